@@ -4,6 +4,7 @@ import os
 import pymel.core as pm
 from luna.static.vars import *
 from luna.core.logger import Logger
+from luna.core.logger import Telemetry
 from luna.core.config import Config
 import luna.workspace
 
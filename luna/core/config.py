@@ -1,14 +1,31 @@
 import os
+import copy
+import time
 import shutil
+import atexit
+import threading
 from luna import Logger
 from luna.utils import fileFn
 from luna.static import directories
 
 
 class Config:
+    """Process wide config store.
+
+    Config file is parsed once and all reads are served from memory.
+    Writes are applied to in-memory data and flushed to disk after FLUSH_DELAY seconds (debounced),
+    or immediately with Config.flush(). Data is reloaded only when config file's mtime/size changes.
+    """
     DEFAULT_CONFIG_PATH = directories.DEFAULT_CONFIG_PATH
     FILE_PATH = directories.CONFIG_PATH
+    FLUSH_DELAY = 1.0  # type: float
+    STAT_INTERVAL = 1.0  # type: float
     CACHED_DATA = {}  # type:dict
+    _pending = {}  # type: dict
+    _file_stamp = None  # type: tuple
+    _last_stat_time = 0.0  # type: float
+    _flush_timer = None  # type: threading.Timer
+    _lock = threading.RLock()
 
     @classmethod
     def load(cls):
@@ -17,14 +34,14 @@ class Config:
         Returns:
             dict: Config dictionary
         """
-        return fileFn.load_json(cls.get_config_path())
+        return copy.deepcopy(cls._get_data())
 
     @classmethod
     def update(cls, new_config_dict):
-        current_config = cls.load()  # type: dict
-        current_config.update(new_config_dict)
-        cls.CACHED_DATA.update(new_config_dict)
-        fileFn.write_json(cls.get_config_path(), current_config, sort_keys=True)
+        with cls._lock:
+            cls._get_data(cached=True).update(new_config_dict)
+            cls._pending.update(new_config_dict)
+            cls._schedule_flush()
 
     @classmethod
     def get(cls, key, default=None, cached=False):
@@ -33,21 +50,14 @@ class Config:
         Args:
             key (str): Setting name
             default (any, optional): Default value to set if key doesn't exist. Defaults to None.
+            cached (bool, optional): Skip config file change check. Defaults to False.
 
         Returns:
             any: Value for requested setting
         """
-        if cached:
-            if cls.CACHED_DATA:
-                current_config = cls.CACHED_DATA
-            else:
-                current_config = cls.load()  # type:dict
-        else:
-            current_config = cls.load()  # type:dict
-
-        if key not in current_config.keys():
-            current_config[key] = default
-            cls.update(current_config)
+        current_config = cls._get_data(cached=cached)
+        if key not in current_config:
+            cls.update({key: default})
         return current_config.get(key)
 
     @classmethod
@@ -60,12 +70,47 @@ class Config:
         """
         cls.update({key: value})
 
+    @classmethod
+    def flush(cls):
+        """Write pending changes to config file.
+
+        Returns:
+            bool: True if file was written.
+        """
+        with cls._lock:
+            if cls._flush_timer:
+                cls._flush_timer.cancel()
+                cls._flush_timer = None
+            if not cls._pending:
+                return False
+            # Merge with external changes made since last load
+            cls._revalidate(force=True)
+            if fileFn.write_json(cls.get_config_path(), cls.CACHED_DATA, sort_keys=True) is None:
+                return False
+            cls._pending = {}
+            cls._file_stamp = cls._get_file_stamp()
+        Logger.debug("Config flushed to: %s", cls.FILE_PATH)
+        return True
+
+    @classmethod
+    def reload(cls):
+        """Force config reload from disk. Pending changes are kept."""
+        with cls._lock:
+            cls._file_stamp = None
+            cls._revalidate(force=True)
+
     @classmethod
     def reset(cls):
         """
         Reset config to default. Copies default config file with normal config name
         """
-        shutil.copy2(directories.DEFAULT_CONFIG_PATH, directories.CONFIG_PATH)
+        with cls._lock:
+            if cls._flush_timer:
+                cls._flush_timer.cancel()
+                cls._flush_timer = None
+            cls._pending = {}
+            shutil.copy2(directories.DEFAULT_CONFIG_PATH, directories.CONFIG_PATH)
+            cls.reload()
         Logger.info("luna config reset to default")
 
     @ classmethod
@@ -77,10 +122,65 @@ class Config:
         """
         if not os.path.isfile(cls.FILE_PATH):
             shutil.copy2(cls.DEFAULT_CONFIG_PATH, cls.FILE_PATH)
-            Logger.debug("Default config copied to: {0}".format(cls.FILE_PATH))
+            Logger.debug("Default config copied to: %s", cls.FILE_PATH)
 
         return cls.FILE_PATH
 
+    # ========= Internal ========= #
+    @classmethod
+    def _get_data(cls, cached=False):
+        if cls._file_stamp is None:
+            with cls._lock:
+                cls._revalidate(force=True)
+        elif not cached:
+            cls._revalidate()
+        return cls.CACHED_DATA
+
+    @classmethod
+    def _get_file_stamp(cls):
+        try:
+            stat = os.stat(cls.get_config_path())
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    @classmethod
+    def _revalidate(cls, force=False):
+        """Reload config data if file's mtime or size changed.
+
+        Args:
+            force (bool, optional): Ignore STAT_INTERVAL throttling. Defaults to False.
+        """
+        now = time.time()
+        if not force and now - cls._last_stat_time < cls.STAT_INTERVAL:
+            return
+        cls._last_stat_time = now
+        stamp = cls._get_file_stamp()
+        if stamp is not None and stamp == cls._file_stamp:
+            return
+
+        with cls._lock:
+            data = fileFn.load_json(cls.get_config_path())
+            if data is None:
+                data = {}
+            data.update(cls._pending)
+            # Update in place, so references returned from _get_data stay valid
+            cls.CACHED_DATA.clear()
+            cls.CACHED_DATA.update(data)
+            cls._file_stamp = stamp
+        Logger.debug("Config loaded from: %s", cls.FILE_PATH)
+
+    @classmethod
+    def _schedule_flush(cls):
+        if cls._flush_timer:
+            cls._flush_timer.cancel()
+        cls._flush_timer = threading.Timer(cls.FLUSH_DELAY, cls.flush)
+        cls._flush_timer.daemon = True
+        cls._flush_timer.start()
+
+
+atexit.register(Config.flush)
+
 
 if __name__ == "__main__":
     pass
@@ -1,9 +1,24 @@
+import os
 import sys
+import json
+import time
+import uuid
+import timeit
 import inspect
 import logging
 import logging.handlers
+import threading
+from contextlib import contextmanager
+from collections import deque
 from PySide2 import QtCore
 import pymel.core as pm
+try:
+    from queue import Queue
+    from logging.handlers import QueueHandler, QueueListener
+except ImportError:
+    # Python 2 has no queue handlers, logging stays synchronous
+    from Queue import Queue
+    QueueHandler = QueueListener = None
 
 
 class Logger:
@@ -14,6 +29,8 @@ class Logger:
     FORMAT_DEFAULT = "[{0}][%(levelname)s] %(message)s"
     _logger_obj = None  # type: logging.Logger
     _signal_handler = None  # type: QSignalHandler
+    _queue_listener = None  # type: QueueListener
+    _queue_handler = None  # type: QueueHandler
 
     @classmethod
     def logger_obj(cls):
@@ -57,6 +74,22 @@ class Logger:
             return logging.getLevelName(cls.logger_obj().level)
         return cls.logger_obj().level
 
+    @classmethod
+    def is_enabled_for(cls, level):
+        """Cheap level check, use to guard expensive message arguments.
+
+        Example:
+            if Logger.is_enabled_for(logging.DEBUG):
+                Logger.debug("Scene: %s", scene.serialize())
+
+        Args:
+            level (int): Logging level.
+
+        Returns:
+            bool: If messages of given level will be processed.
+        """
+        return cls.logger_obj().isEnabledFor(level)
+
     @classmethod
     def set_propagate(cls, propagate):
         lg = cls.logger_obj()
@@ -67,6 +100,81 @@ class Logger:
         cls.logger_obj()
         return cls._signal_handler
 
+    @classmethod
+    def handlers(cls):
+        """Get output handlers, including ones running behind the queue listener.
+
+        Returns:
+            list[logging.Handler]: Handlers list.
+        """
+        if cls._queue_listener:
+            return list(cls._queue_listener.handlers)
+        return list(cls.logger_obj().handlers)
+
+    @classmethod
+    def add_handler(cls, handler):
+        if not cls._queue_listener:
+            cls.logger_obj().addHandler(handler)
+            return
+        cls._queue_listener.stop()
+        cls._queue_listener.handlers = cls._queue_listener.handlers + (handler, )
+        cls._queue_listener.start()
+
+    @classmethod
+    def is_queued(cls):
+        return cls._queue_listener is not None
+
+    @classmethod
+    def enable_queue(cls):
+        """Move output handlers behind a queue, so stream, file and Qt output is handled by a listener thread.
+        Logging call only puts the record into the queue.
+
+        Returns:
+            bool: If queue is active.
+        """
+        lg = cls.logger_obj()
+        if cls._queue_listener:
+            return True
+        if QueueHandler is None:
+            lg.warning("Queue logging is not supported in this Python version.")
+            return False
+
+        handlers = list(lg.handlers)
+        log_queue = Queue(-1)
+        cls._queue_handler = _LunaQueueHandler(log_queue)
+        cls._queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        for handler in handlers:
+            lg.removeHandler(handler)
+        lg.addHandler(cls._queue_handler)
+        cls._queue_listener.start()
+        return True
+
+    @classmethod
+    def disable_queue(cls):
+        """Process queued records and move handlers back to logger."""
+        if not cls._queue_listener:
+            return
+        lg = cls.logger_obj()
+        cls._queue_listener.stop()
+        lg.removeHandler(cls._queue_handler)
+        for handler in cls._queue_listener.handlers:
+            lg.addHandler(handler)
+        cls._queue_listener = None
+        cls._queue_handler = None
+        cls.flush()
+
+    @classmethod
+    def flush(cls):
+        """Block until all queued records are written and flush handlers.
+        Should be called from main thread, Qt handler emits its buffer here.
+        """
+        if cls._queue_listener:
+            # Stop processes all queued records before joining listener thread
+            cls._queue_listener.stop()
+            cls._queue_listener.start()
+        for handler in cls.handlers():
+            handler.flush()
+
     @classmethod
     def call_info(cls, message):
         caller = inspect.getframeinfo(inspect.stack()[1][0])
@@ -74,12 +182,15 @@ class Logger:
 
     @classmethod
     def debug(cls, msg, *args, **kwargs):
-        lg = cls.logger_obj()
+        """Log debug message. Pass format arguments %-style so they are only formatted if the level is enabled:
+        Logger.debug("Executing %s", node)
+        """
+        lg = cls._logger_obj or cls.logger_obj()
         lg.debug(msg, *args, **kwargs)
 
     @classmethod
     def info(cls, msg, *args, **kwargs):
-        lg = cls.logger_obj()
+        lg = cls._logger_obj or cls.logger_obj()
         lg.info(msg, *args, **kwargs)
 
     @classmethod
@@ -110,7 +221,7 @@ class Logger:
     @classmethod
     def write_to_rotating_file(cls, path, level=logging.WARNING, mode="w", max_bytes=1024):
         lg = cls.logger_obj()
-        if any([isinstance(handler, logging.handlers.RotatingFileHandler) for handler in lg.handlers]):
+        if any([isinstance(handler, logging.handlers.RotatingFileHandler) for handler in cls.handlers()]):
             lg.warning("Rotating file hander already exists")
             return
 
@@ -119,7 +230,142 @@ class Logger:
         fmt = logging.Formatter("[%(asctime)s][%(levelname)s] %(message)s")
         rfile_hander.setFormatter(fmt)
 
-        lg.addHandler(rfile_hander)
+        cls.add_handler(rfile_hander)
+
+
+class Telemetry(object):
+    """Structured build events written as JSON lines.
+
+    Events are buffered in memory and appended to file in batches (on build end or when buffer is full),
+    so recording an event is a dict append. Each line has "event", "time" and "build" keys plus event fields.
+
+    Example:
+        with Telemetry.timed("node_exec", node=node.title):
+            node.execute()
+    """
+    FILE_PATH = None  # type: str
+    MAX_BYTES = 10 * 1024 * 1024
+    BUFFER_SIZE = 256
+    enabled = True
+    build_id = None  # type: str
+    _build_start = None  # type: float
+    _build_name = None  # type: str
+    _buffer = []  # type: list
+    _lock = threading.Lock()
+
+    @classmethod
+    def set_file(cls, path):
+        cls.flush()
+        cls.FILE_PATH = path
+
+    @classmethod
+    def set_enabled(cls, enabled):
+        if not enabled:
+            cls.flush()
+        cls.enabled = enabled
+
+    @classmethod
+    def is_recording(cls):
+        """Check if build is in progress and events are recorded.
+
+        Returns:
+            bool: Recording state.
+        """
+        return cls.enabled and cls.build_id is not None
+
+    @classmethod
+    def event(cls, event_name, **fields):
+        """Record event.
+
+        Args:
+            event_name (str): Event name.
+            **fields: Json serializable event data.
+        """
+        if not cls.enabled or not cls.FILE_PATH:
+            return
+        fields["event"] = event_name
+        fields["time"] = time.time()
+        fields["build"] = cls.build_id
+        with cls._lock:
+            cls._buffer.append(fields)
+            buffer_full = len(cls._buffer) >= cls.BUFFER_SIZE
+        if buffer_full:
+            cls.flush()
+
+    @classmethod
+    @contextmanager
+    def timed(cls, event_name, **fields):
+        """Record event with "duration" (seconds) and "failed" fields for wrapped code.
+
+        Args:
+            event_name (str): Event name.
+            **fields: Json serializable event data.
+
+        Yields:
+            dict: Event fields, can be updated in the block.
+        """
+        if not cls.enabled:
+            yield fields
+            return
+        start_time = timeit.default_timer()
+        fields["failed"] = False
+        try:
+            yield fields
+        except Exception:
+            fields["failed"] = True
+            raise
+        finally:
+            fields["duration"] = timeit.default_timer() - start_time
+            cls.event(event_name, **fields)
+
+    @classmethod
+    def build_started(cls, name, **fields):
+        """Start new build, following events are tagged with build id.
+
+        Args:
+            name (str): Build name (asset name, graph file etc.)
+        """
+        cls.build_id = uuid.uuid4().hex
+        cls._build_start = timeit.default_timer()
+        cls._build_name = name
+        cls.event("build_start", name=name, **fields)
+
+    @classmethod
+    def build_finished(cls, success=True, **fields):
+        if cls.build_id is None:
+            return
+        cls.event("build_end", name=cls._build_name, success=success, duration=timeit.default_timer() - cls._build_start, **fields)
+        cls.flush()
+        cls.build_id = None
+
+    @classmethod
+    def flush(cls):
+        """Append buffered events to telemetry file."""
+        with cls._lock:
+            records = cls._buffer
+            cls._buffer = []
+        if not records or not cls.FILE_PATH:
+            return
+        lines = "".join([json.dumps(record, default=str) + "\n" for record in records])
+        try:
+            if os.path.isfile(cls.FILE_PATH) and os.path.getsize(cls.FILE_PATH) > cls.MAX_BYTES:
+                backup_path = cls.FILE_PATH + ".1"
+                if os.path.isfile(backup_path):
+                    os.remove(backup_path)
+                os.rename(cls.FILE_PATH, backup_path)
+            with open(cls.FILE_PATH, "a") as telemetry_file:
+                telemetry_file.write(lines)
+        except (IOError, OSError):
+            Logger.exception("Failed to write telemetry to: {0}".format(cls.FILE_PATH))
+
+
+if QueueHandler is not None:
+    class _LunaQueueHandler(QueueHandler):
+        def prepare(self, record):
+            record = super(_LunaQueueHandler, self).prepare(record)
+            # Traceback is already a part of the message, prevent output handlers from adding it again
+            record.exc_text = None
+            return record
 
 
 class MGlobalHandler(logging.Handler):
@@ -141,13 +387,46 @@ class QSignaler(QtCore.QObject):
 
 
 class QSignalHandler(logging.Handler):
+    """Buffers records and emits them to Qt in batches on a timer.
+    Records are formatted on flush, so emit is just an append to the buffer.
+    """
+    FLUSH_INTERVAL = 100  # ms
+    CAPACITY = 2000
+
     def __init__(self, *args, **kwargs):
         super(QSignalHandler, self).__init__(*args, **kwargs)
         self.emitter = QSignaler()
+        self.buffer = deque(maxlen=self.CAPACITY)
+        self.buffer_lock = threading.Lock()
+        # Timer lives in the thread handler was created in (main thread)
+        self.flush_timer = QtCore.QTimer(self.emitter)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start()
 
     def emit(self, record):
-        msg = self.format(record)
-        self.emitter.message_logged.emit(msg)
+        with self.buffer_lock:
+            self.buffer.append(record)
+
+    def flush(self):
+        if not self.buffer:
+            return
+        with self.buffer_lock:
+            records = list(self.buffer)
+            self.buffer.clear()
+        messages = []
+        for record in records:
+            try:
+                messages.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if messages:
+            self.emitter.message_logged.emit("\n".join(messages))
+
+    def close(self):
+        self.flush_timer.stop()
+        self.flush()
+        super(QSignalHandler, self).close()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ import luna_rig.functions.curveFn as curveFn
 import luna_rig.functions.jointFn as jointFn
 import luna_rig.functions.transformFn as transformFn
 import luna_rig.functions.nodeFn as nodeFn
+import luna_rig.functions.rigFn as rigFn
 import luna_rig.importexport as importexport
 import luna_rig.core.shape_manager as shape_manager
 
@@ -123,8 +124,7 @@ class MarkingMenu(object):
         pm.menuItem(p=root_menu,
                     l="Control bind pose",
                     rp="E",
-                    c=lambda *args: [luna_rig.Control(trs).to_bind_pose()
-                                     for trs in selection if luna_rig.Control.is_control(trs)],
+                    c=lambda *args: rigFn.selected_control_bind_pose(),
                     i=fileFn.get_icon_path("control.png"))
 
     @classmethod
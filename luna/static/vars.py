@@ -1,9 +1,13 @@
 class LunaVars:
     logging_level = "logging.level"
+    logging_queue = "logging.queue"
+    logging_telemetry = "logging.telemetry"
     command_port = "python.commandPort"
     callback_licence = "callback.license"
     marking_menu_mode = "markingMenu.mode"
     asset_types = "assetTypes"
+    json_backend = "io.json.backend"
+    json_compact = "io.json.compact"
 
 
 class HudVars:
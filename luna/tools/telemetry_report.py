@@ -0,0 +1,83 @@
+"""Offline report for luna build telemetry (luna_telemetry.jsonl).
+Does not require Maya, run with any python interpreter:
+
+python telemetry_report.py path/to/luna_telemetry.jsonl --top 20
+"""
+
+import sys
+import json
+import argparse
+from collections import defaultdict
+
+
+def read_events(paths):
+    """Read events from JSON lines files, skipping malformed lines.
+
+    Args:
+        paths (list[str]): Telemetry file paths.
+
+    Yields:
+        dict: Event data.
+    """
+    for path in paths:
+        with open(path, "r") as telemetry_file:
+            for line in telemetry_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def collect_stats(events, event_name, key):
+    """Aggregate durations of given event type.
+
+    Args:
+        events (iterable[dict]): Events.
+        event_name (str): Event to aggregate, e.g. "node_exec".
+        key (str): Field to group by, e.g. "node".
+
+    Returns:
+        list[tuple]: (key, count, total, mean, max) sorted by total duration, slowest first.
+    """
+    durations = defaultdict(list)
+    for event in events:
+        if event.get("event") != event_name or "duration" not in event or key not in event:
+            continue
+        durations[event.get(key)].append(event["duration"])
+    stats = []
+    for name, values in durations.items():
+        stats.append((name, len(values), sum(values), sum(values) / len(values), max(values)))
+    stats.sort(key=lambda item: item[2], reverse=True)
+    return stats
+
+
+def print_table(title, stats, top):
+    print("\n{0}".format(title))
+    print("{0:<40} {1:>6} {2:>10} {3:>10} {4:>10}".format("name", "count", "total(s)", "mean(s)", "max(s)"))
+    for name, count, total, mean, maximum in stats[:top]:
+        print("{0:<40} {1:>6} {2:>10.3f} {3:>10.3f} {4:>10.3f}".format(str(name)[:40], count, total, mean, maximum))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Print slowest luna build steps across recorded builds.")
+    parser.add_argument("paths", nargs="+", help="Telemetry .jsonl files")
+    parser.add_argument("--top", type=int, default=15, help="Number of rows per table")
+    parsed = parser.parse_args(args)
+
+    events = list(read_events(parsed.paths))
+    builds = [event for event in events if event.get("event") == "build_end"]
+    failed = len([build for build in builds if not build.get("success")])
+    print("Builds: {0} (failed: {1})".format(len(builds), failed))
+    print_table("Builds", collect_stats(events, "build_end", "name"), parsed.top)
+    print_table("Slowest nodes", collect_stats(events, "node_exec", "node"), parsed.top)
+    # Component nodes add component class to their node_exec events
+    print_table("Slowest components", collect_stats(events, "node_exec", "component"), parsed.top)
+    print_table("Slowest files", collect_stats(events, "file_io", "path"), parsed.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,7 @@ def unload_builder_modules(*args):
     for mod_name in list(sys.modules):
         if mod_name.startswith("luna_builder"):
             del sys.modules[mod_name]
-            luna.Logger.debug("Unloaded module: {0}".format(mod_name))
+            luna.Logger.debug("Unloaded module: %s", mod_name)
     luna.Logger.info("Unloaded builder modules")
 
 
@@ -22,7 +22,7 @@ def unload_configer_modules(*args):
     for mod_name in list(sys.modules):
         if mod_name.startswith("luna_configer"):
             del sys.modules[mod_name]
-            luna.Logger.debug("Unloaded module: {0}".format(mod_name))
+            luna.Logger.debug("Unloaded module: %s", mod_name)
     luna.Logger.info("Unloaded configer modules")
 
 
@@ -30,7 +30,7 @@ def unload_rig_modules(*args):
     for mod_name in list(sys.modules):
         if mod_name.startswith("luna_rig"):
             del sys.modules[mod_name]
-            luna.Logger.debug("Unloaded module: {0}".format(mod_name))
+            luna.Logger.debug("Unloaded module: %s", mod_name)
     luna.Logger.info("Unloaded luna rig modules")
 
 
@@ -38,7 +38,7 @@ def unload_luna_modules(*args):
     for mod_name in list(sys.modules):
         if mod_name.startswith("luna"):
             del sys.modules[mod_name]
-            luna.Logger.debug("Unloaded module: {0}".format(mod_name))
+            luna.Logger.debug("Unloaded module: %s", mod_name)
     luna.Logger.info("Unloaded luna modules")
 
 
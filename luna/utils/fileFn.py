@@ -1,43 +1,242 @@
 """Common file operations"""
 import json
 import os
+import time
+import errno
 import pickle
 import shutil
+import threading
+import uuid
 import pymel.core as pm
 from luna import Logger
+from luna import Telemetry
 from luna.static import directories
 
 
 # Json
-def write_json(path, data=None, as_string=False, sort_keys=True):
-    # type: (str, dict, bool, bool) -> str
+class JsonBackend(object):
+    """Json encoder/decoder pair.
+
+    dumps(data, compact, sort_keys) -> str
+    loads(string) -> object
+    """
+
+    def __repr__(self):
+        return "JsonBackend({0})".format(self.name)
+
+    def __init__(self, name, dumps, loads):
+        self.name = name  # type: str
+        self.dumps = dumps
+        self.loads = loads
+
+
+def _readable_dumps(data, sort_keys=False):
+    # Readable files are formatted by stdlib json regardless of backend, so they don't change with installed packages
+    return json.dumps(data, sort_keys=sort_keys, indent=4)
+
+
+def _find_json_backends():
+    """Collect importable json backends, fastest first. Stdlib json is always available as a fallback.
+    Backends are used for compact output only, readable output is always written by stdlib json.
+
+    Returns:
+        list[JsonBackend]: Available backends.
+    """
+    backends = []
+    try:
+        import orjson
+
+        def orjson_dumps(data, compact=False, sort_keys=False):
+            if not compact:
+                return _readable_dumps(data, sort_keys=sort_keys)
+            option = orjson.OPT_NON_STR_KEYS
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(data, option=option).decode("utf-8")
+        backends.append(JsonBackend("orjson", orjson_dumps, orjson.loads))
+    except ImportError:
+        pass
+
+    try:
+        import rapidjson
+
+        def rapidjson_dumps(data, compact=False, sort_keys=False):
+            if not compact:
+                return _readable_dumps(data, sort_keys=sort_keys)
+            return rapidjson.dumps(data, sort_keys=sort_keys)
+        backends.append(JsonBackend("rapidjson", rapidjson_dumps, rapidjson.loads))
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+
+        def ujson_dumps(data, compact=False, sort_keys=False):
+            if not compact:
+                return _readable_dumps(data, sort_keys=sort_keys)
+            return ujson.dumps(data, sort_keys=sort_keys)
+        backends.append(JsonBackend("ujson", ujson_dumps, ujson.loads))
+    except ImportError:
+        pass
+
+    def stdlib_dumps(data, compact=False, sort_keys=False):
+        if not compact:
+            return _readable_dumps(data, sort_keys=sort_keys)
+        return json.dumps(data, sort_keys=sort_keys, separators=(",", ":"))
+    backends.append(JsonBackend("json", stdlib_dumps, json.loads))
+    return backends
+
+
+class JsonSettings(object):
+    """Json serializer settings. Set from config on plugin load, see set_json_backend and set_json_compact."""
+    available = _find_json_backends()  # type: list[JsonBackend]
+    backend = available[0]  # type: JsonBackend
+    # Allow compact mode for machine-only files. Disable to write everything readable.
+    compact = True  # type: bool
+
+
+def set_json_backend(name="auto"):
+    """Set json backend used for luna file I/O.
+
+    Args:
+        name (str, optional): Backend name (orjson, rapidjson, ujson, json) or "auto" for the fastest available. Defaults to "auto".
+
+    Returns:
+        JsonBackend: Backend in use.
+    """
+    if name == "auto":
+        JsonSettings.backend = JsonSettings.available[0]
+        return JsonSettings.backend
+    for backend in JsonSettings.available:
+        if backend.name == name:
+            JsonSettings.backend = backend
+            return backend
+    Logger.warning("Json backend {0} is not available, using {1}".format(name, JsonSettings.backend.name))
+    return JsonSettings.backend
+
+
+def set_json_compact(enabled):
+    JsonSettings.compact = enabled
+
+
+def dumps_json(data, compact=False, sort_keys=False):
+    """Serialize data with current json backend.
+
+    Args:
+        data (any): Json serializable data.
+        compact (bool, optional): No indentation or whitespace, for machine-only data. Defaults to False.
+        sort_keys (bool, optional): Sort dictionary keys. Defaults to False.
+
+    Returns:
+        str: Json string.
+    """
+    return JsonSettings.backend.dumps(data, compact=compact and JsonSettings.compact, sort_keys=sort_keys)
+
+
+def loads_json(string):
+    return JsonSettings.backend.loads(string)
+
+
+def write_json(path, data=None, as_string=False, sort_keys=False, atomic=True, fsync=False, stream=False, compact=False):
+    # type: (str, dict, bool, bool, bool, bool, bool, bool) -> str
+    """Write data to json file.
+
+    Args:
+        path (str): File path.
+        data (dict, optional): Data to write. Defaults to None.
+        as_string (bool, optional): Use stdlib json with compact separators and indentation. Defaults to False.
+        sort_keys (bool, optional): Sort dictionary keys. Defaults to False, keys are written in insertion order.
+        atomic (bool, optional): Write to temp file and replace target, so target is never left truncated. Defaults to True.
+        fsync (bool, optional): Flush file to disk before replacing target. Defaults to False.
+        stream (bool, optional): Write compact json in chunks, for large arrays (weights). Defaults to False.
+        compact (bool, optional): Compact output for machine-only files. Defaults to False.
+
+    Returns:
+        str: Written file path, None if write failed.
+    """
     data = data if data is not None else dict()
+    start_time = time.time()
+    write_path = path
+    dir_mtime = VersionIndex.dir_mtime(path)
     try:
-        with open(path, "w") as json_file:
-            if as_string:
-                json_file.write(json.dumps(data, sort_keys=sort_keys,
-                                indent=4, separators=(",", ":")))
+        # Asset directories are created lazily on first write
+        create_missing_dir(os.path.dirname(path) or ".")
+        if atomic:
+            write_path = get_temp_path(path)
+        with open(write_path, "w") as json_file:
+            if stream:
+                stream_json(data, json_file, sort_keys=sort_keys)
+            elif as_string:
+                json.dump(data, json_file, sort_keys=sort_keys, indent=4, separators=(",", ":"))
             else:
-                json.dump(data, json_file, indent=4)
-
-    except IOError as e:
+                json_file.write(dumps_json(data, compact=compact, sort_keys=sort_keys))
+            if fsync:
+                json_file.flush()
+                os.fsync(json_file.fileno())
+        if atomic:
+            replace_file(write_path, path)
+
+    except (IOError, OSError) as e:
         Logger.exception("{0} is not a valid file path".format(path), exc_info=e)
+        remove_temp_file(write_path, path)
         return None
 
     except BaseException:
         Logger.exception("Failed to write file {0}".format(path), exc_info=1)
+        remove_temp_file(write_path, path)
         return None
 
+    VersionIndex.file_added(path, dir_mtime=dir_mtime)
+    _record_io("write", path, start_time)
     return path
 
 
+def stream_json(data, json_file, sort_keys=False, chunk_size=65536):
+    """Write compact json to file object without building whole string in memory.
+    Lists are encoded in chunks of chunk_size items.
+
+    Args:
+        data (any): Json serializable data.
+        json_file (file): File object opened for writing.
+        sort_keys (bool, optional): Sort dictionary keys. Defaults to False.
+        chunk_size (int, optional): Number of list items encoded at once. Defaults to 65536.
+    """
+    if isinstance(data, dict):
+        json_file.write("{")
+        keys = sorted(data.keys()) if sort_keys else data.keys()
+        for index, key in enumerate(keys):
+            if index:
+                json_file.write(",")
+            json_file.write(json.dumps(key if isinstance(key, (str, type(u""))) else str(key)) + ":")
+            stream_json(data[key], json_file, sort_keys=sort_keys, chunk_size=chunk_size)
+        json_file.write("}")
+    elif isinstance(data, (list, tuple)):
+        json_file.write("[")
+        for start in range(0, len(data), chunk_size):
+            if start:
+                json_file.write(",")
+            chunk = data[start:start + chunk_size]
+            if any(isinstance(item, (dict, list, tuple)) for item in chunk):
+                for index, item in enumerate(chunk):
+                    if index:
+                        json_file.write(",")
+                    stream_json(item, json_file, sort_keys=sort_keys, chunk_size=chunk_size)
+            else:
+                json_file.write(JsonSettings.backend.dumps(list(chunk), compact=True)[1:-1])
+        json_file.write("]")
+    else:
+        json_file.write(json.dumps(data))
+
+
 def load_json(path, string_data=False, object_pairs_hook=None):
     # type: (str, bool, object) -> dict
+    start_time = time.time()
     try:
         with open(path, "r") as json_file:
-            if string_data:
-                data = json.loads(json_file)  # type:str
+            if string_data or not object_pairs_hook:
+                data = loads_json(json_file.read())  # type:dict
             else:
+                # Only stdlib json supports object_pairs_hook
                 data = json.load(json_file, object_pairs_hook=object_pairs_hook)  # type:dict
 
     except IOError:
@@ -47,25 +246,54 @@ def load_json(path, string_data=False, object_pairs_hook=None):
         Logger.exception("Failed to load file {0}".format(path))
         return None
 
+    _record_io("read", path, start_time)
     return data
 
 
 # Pickle
-def write_pickle(path, data):
+def write_pickle(path, data, protocol=2, atomic=True, fsync=False):
+    """Write data to pickle file.
+
+    Args:
+        path (str): File path.
+        data (any): Data to pickle.
+        protocol (int, optional): Pickle protocol. Defaults to 2, readable by Python 2 and 3 Maya versions.
+        atomic (bool, optional): Write to temp file and replace target. Defaults to True.
+        fsync (bool, optional): Flush file to disk before replacing target. Defaults to False.
+
+    Returns:
+        bool: Success status.
+    """
+    start_time = time.time()
+    write_path = path
+    dir_mtime = VersionIndex.dir_mtime(path)
     try:
-        with open(path, "wb") as new_file:
-            pickle.dump(data, new_file)
+        create_missing_dir(os.path.dirname(path) or ".")
+        if atomic:
+            write_path = get_temp_path(path)
+        with open(write_path, "wb") as new_file:
+            pickle.dump(data, new_file, protocol)
+            if fsync:
+                new_file.flush()
+                os.fsync(new_file.fileno())
+        if atomic:
+            replace_file(write_path, path)
+        VersionIndex.file_added(path, dir_mtime=dir_mtime)
+        _record_io("write", path, start_time)
         return True
-    except IOError:
+    except (IOError, OSError):
         Logger.exception("Failed to saved file: {0}".format(path))
+        remove_temp_file(write_path, path)
         return False
 
 
 def load_pickle(path):
     data = None
+    start_time = time.time()
     try:
         with open(path, "rb") as read_file:
             data = pickle.load(read_file)
+        _record_io("read", path, start_time)
     except IOError:
         Logger.exception("Failed to open file {0}".format(path))
     except Exception:
@@ -74,21 +302,210 @@ def load_pickle(path):
     return data
 
 
+def _record_io(operation, path, start_time):
+    """Record data file read/write to build telemetry. Does nothing outside of builds."""
+    if not Telemetry.is_recording():
+        return
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = None
+    Telemetry.event("file_io", operation=operation, path=path, size=size, duration=time.time() - start_time)
+
+
 # File
+def get_temp_path(path):
+    """Create temporary file next to given path. Used for atomic writes.
+
+    Args:
+        path (str): Target file path.
+
+    Returns:
+        str: Temporary file path.
+    """
+    dir_path = os.path.dirname(path) or "."
+    prefix = "." + os.path.basename(path) + "."
+    while True:
+        temp_path = os.path.join(dir_path, prefix + uuid.uuid4().hex[:8] + ".tmp")
+        try:
+            # Created with regular file mode, so new files get process umask applied like plain open
+            handle = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except OSError as e:
+            if e.errno == errno.EEXIST:
+                continue
+            raise
+        break
+    os.close(handle)
+    # Replaced file keeps its permissions
+    try:
+        os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+    except OSError:
+        pass
+    return temp_path
+
+
+def replace_file(source_path, target_path):
+    """Atomically move source file over target file.
+
+    Args:
+        source_path (str): File to move.
+        target_path (str): File to replace.
+    """
+    if hasattr(os, "replace"):
+        os.replace(source_path, target_path)
+        return
+    # Python 2: os.rename is atomic on posix, but fails on Windows if target exists
+    try:
+        os.rename(source_path, target_path)
+    except OSError:
+        os.remove(target_path)
+        os.rename(source_path, target_path)
+
+
+def remove_temp_file(temp_path, target_path):
+    if temp_path != target_path and os.path.isfile(temp_path):
+        os.remove(temp_path)
+
+
+class FileLock(object):
+    """Advisory inter-process lock using hidden side file (.<name>.lock). Re-entrant within a process.
+    Lock file is removed on release.
+
+    Example:
+        with FileLock(meta_path):
+            ...
+    """
+    _THREAD_LOCKS = {}  # type: dict
+    _DEPTH = {}  # type: dict
+    _HANDLES = {}  # type: dict
+    _GUARD = threading.Lock()
+
+    def __repr__(self):
+        return "FileLock({0})".format(self.lock_path)
+
+    def __init__(self, path, timeout=10.0, poll_interval=0.05):
+        dir_path, file_name = os.path.split(os.path.normcase(os.path.abspath(path)))
+        self.lock_path = os.path.join(dir_path, ".{0}.lock".format(file_name))  # type: str
+        self.timeout = timeout  # type: float
+        self.poll_interval = poll_interval  # type: float
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def acquire(self):
+        with FileLock._GUARD:
+            thread_lock = FileLock._THREAD_LOCKS.setdefault(self.lock_path, threading.RLock())
+        thread_lock.acquire()
+        if FileLock._DEPTH.get(self.lock_path, 0) == 0:
+            try:
+                FileLock._HANDLES[self.lock_path] = self._lock_file()
+            except Exception:
+                thread_lock.release()
+                raise
+        FileLock._DEPTH[self.lock_path] = FileLock._DEPTH.get(self.lock_path, 0) + 1
+
+    def release(self):
+        depth = FileLock._DEPTH.get(self.lock_path, 0) - 1
+        FileLock._DEPTH[self.lock_path] = depth
+        if depth == 0:
+            self._unlock_file(FileLock._HANDLES.pop(self.lock_path))
+        FileLock._THREAD_LOCKS[self.lock_path].release()
+
+    def _lock_file(self):
+        start_time = time.time()
+        while True:
+            lock_file = open(self.lock_path, "a+")
+            try:
+                self._os_lock(lock_file)
+                # Previous holder could remove lock file while we were waiting, lock is valid only for current file
+                if self._is_current(lock_file):
+                    return lock_file
+                self._os_unlock(lock_file)
+            except (IOError, OSError) as e:
+                if e.errno not in (errno.EACCES, errno.EAGAIN, errno.EDEADLK):
+                    lock_file.close()
+                    raise
+            lock_file.close()
+            if time.time() - start_time > self.timeout:
+                Logger.error("Timed out waiting for lock: {0}".format(self.lock_path))
+                raise RuntimeError("Failed to acquire lock {0}".format(self.lock_path))
+            time.sleep(self.poll_interval)
+
+    def _is_current(self, lock_file):
+        if os.name == "nt":
+            # Open files can't be removed on Windows
+            return True
+        try:
+            path_stat = os.stat(self.lock_path)
+        except OSError:
+            return False
+        file_stat = os.fstat(lock_file.fileno())
+        return (path_stat.st_dev, path_stat.st_ino) == (file_stat.st_dev, file_stat.st_ino)
+
+    def _unlock_file(self, lock_file):
+        try:
+            if os.name != "nt":
+                # Remove while still locked, waiting processes will reopen new file
+                self._remove_lock_file()
+            self._os_unlock(lock_file)
+        finally:
+            lock_file.close()
+        if os.name == "nt":
+            # Fails if another process has lock file open, it will remove it on release
+            self._remove_lock_file()
+
+    def _remove_lock_file(self):
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+
+    if os.name == "nt":
+        @staticmethod
+        def _os_lock(lock_file):
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+
+        @staticmethod
+        def _os_unlock(lock_file):
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        @staticmethod
+        def _os_lock(lock_file):
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        @staticmethod
+        def _os_unlock(lock_file):
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def create_file(path, data=""):
     if not os.path.isfile(path):
+        dir_mtime = VersionIndex.dir_mtime(path)
         with open(path, "w") as f:
             f.write(data)
+        VersionIndex.file_added(path, dir_mtime=dir_mtime)
     return path
 
 
 def delete_oldest(directory, file_limit):
-    all_files = ["{0}/{1}".format(directory, child) for child in os.listdir(directory)]
+    all_files = ["{0}/{1}".format(directory, child) for child in os.listdir(directory) if not child.startswith(".")]
 
     if file_limit and len(all_files) > file_limit:
         try:
             oldest_file = min(all_files, key=os.path.getctime)
+            dir_mtime = VersionIndex.dir_mtime(oldest_file)
             os.remove(oldest_file)
+            VersionIndex.file_removed(oldest_file, dir_mtime=dir_mtime)
             return oldest_file
         except Exception as e:
             Logger.exception("Failed to delete file {0}".format(oldest_file), exc_info=e)
@@ -105,16 +522,32 @@ def create_missing_dir(path):
     :rtype: str
     """
     if not os.path.isdir(path):
-        os.makedirs(path)
+        try:
+            os.makedirs(path)
+        except OSError:
+            # Directory could be created by another thread or process in the meantime
+            if not os.path.isdir(path):
+                raise
     return path
 
 
 # Pipeline functions
-def copy_empty_scene(new_path):
+def get_empty_scene_path():
+    """Get path to empty scene template for current Maya version.
+
+    Returns:
+        str: Scene path.
+    """
+    return os.path.join(directories.EMPTY_SCENES_PATH, "EmptyScene_Maya{0}.ma".format(pm.about(v=1)))
+
+
+def copy_empty_scene(new_path, source_path=None):
     """Copy empty scenes from luna's resource directory ot a given path. Scene version is based on current Maya version.
 
     Args:
         new_path (str): Full path to a new scene file location.
+        source_path (str, optional): Template scene path, resolved with get_empty_scene_path if not passed.
+            Pass it explicitly when copying from worker threads. Defaults to None.
 
     Raises:
         IOError: If scene for selected maya version doesn't exist.
@@ -122,13 +555,15 @@ def copy_empty_scene(new_path):
     if os.path.isfile(new_path):
         return
 
-    source_path = os.path.join(directories.EMPTY_SCENES_PATH,
-                               "EmptyScene_Maya{0}.ma".format(pm.about(v=1)))
-    Logger.debug("Copying file {0} to {1}".format(source_path, new_path))
+    if source_path is None:
+        source_path = get_empty_scene_path()
+    Logger.debug("Copying file %s to %s", source_path, new_path)
     if not os.path.isfile(source_path):
         raise IOError
     try:
+        dir_mtime = VersionIndex.dir_mtime(new_path)
         shutil.copy2(source_path, new_path)
+        VersionIndex.file_added(new_path, dir_mtime=dir_mtime)
     except Exception:
         Logger.exception("Failed to copy scene {0}".format(source_path))
 
@@ -145,42 +580,309 @@ def get_icon_path(name):
     return os.path.join(directories.ICONS_PATH, name)
 
 
-def get_versioned_files(path, extension="", split_char="."):
-    files_dict = {}
-    all_files = [item for item in os.listdir(path) if os.path.isfile(os.path.join(path, item))]
-    if extension:
-        all_files = [item for item in all_files if item.endswith("." + extension)]
+def parse_version(file_name, split_char="."):
+    """Get integer version from versioned file name (name.0001.ext).
 
-    # Fill dict
-    for each_file in all_files:
-        if each_file.split(split_char)[0] not in files_dict.keys():
-            files_dict[each_file.split(split_char)[0]] = [each_file]
-        else:
-            files_dict[each_file.split(split_char)[0]].append(each_file)
+    Args:
+        file_name (str): File name.
+        split_char (str, optional): Name parts separator. Defaults to ".".
+
+    Returns:
+        int: Version number or None if file name is not versioned.
+    """
+    parts = file_name.split(split_char)
+    if len(parts) < 3 or not parts[-2].isdigit():
+        return None
+    return int(parts[-2])
+
+
+class _VersionedFiles(object):
+    """Files sharing the same base name, with latest version tracked on insertion."""
+
+    def __init__(self):
+        self.files = {}  # type: dict
+        self.latest_key = None  # type: tuple
+        self._sorted = None  # type: list
+
+    def add(self, file_name, version):
+        # Unversioned files are ordered before any versioned one
+        key = (-1 if version is None else version, file_name)
+        self.files[file_name] = key
+        self._sorted = None
+        if self.latest_key is None or key > self.latest_key:
+            self.latest_key = key
+
+    def remove(self, file_name):
+        key = self.files.pop(file_name, None)
+        if key is None:
+            return
+        self._sorted = None
+        if key == self.latest_key:
+            self.latest_key = max(self.files.values()) if self.files else None
+
+    @property
+    def latest(self):
+        return self.latest_key[1] if self.latest_key else None
+
+    @property
+    def next_version(self):
+        if self.latest_key is None or self.latest_key[0] < 0:
+            return 0
+        return self.latest_key[0] + 1
+
+    def sorted_files(self):
+        if self._sorted is None:
+            self._sorted = [key[1] for key in sorted(self.files.values())]
+        return self._sorted
+
+
+class VersionIndex(object):
+    """Index of versioned files in a directory.
+
+    Maps base names to files ordered by integer version.
+    Directory is scanned once, then index is updated by writes made through fileFn
+    and revalidated against directory mtime. Latest and next version queries are O(1).
+    Writers pass directory mtime taken before the write, if index was current at that point
+    the new mtime is stored, otherwise next query rescans the directory.
+    Files added by other processes while luna writes to the same directory are not seen until next change.
+    Indexes are shared between threads, all access goes through class lock.
+    """
+    _INSTANCES = {}  # type: dict
+    _LOCK = threading.RLock()
+
+    def __repr__(self):
+        return "VersionIndex({0}, extension={1})".format(self.path, self.extension)
+
+    def __init__(self, path, extension="", split_char="."):
+        self.path = path  # type: str
+        self.extension = extension  # type: str
+        self.split_char = split_char  # type: str
+        self._files = {}  # type: dict[str, _VersionedFiles]
+        self._mtime = None  # type: float
+
+    @classmethod
+    def get(cls, path, extension="", split_char="."):
+        """Get shared index instance for directory.
+
+        Args:
+            path (str): Directory path.
+            extension (str, optional): Only index files with this extension. Defaults to "".
+            split_char (str, optional): Base name separator. Defaults to ".".
+
+        Returns:
+            VersionIndex: Index instance.
+        """
+        key = (cls._norm_path(path), extension, split_char)
+        with cls._LOCK:
+            index = cls._INSTANCES.get(key)
+            if index is None:
+                index = cls(path, extension=extension, split_char=split_char)
+                cls._INSTANCES[key] = index
+        return index
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._LOCK:
+            cls._INSTANCES.clear()
+
+    @staticmethod
+    def dir_mtime(file_path):
+        """Get mtime of file's directory, call before writing and pass to file_added/file_removed.
+
+        Args:
+            file_path (str): Path to file.
+
+        Returns:
+            float: Directory mtime, None if directory doesn't exist.
+        """
+        try:
+            return os.stat(os.path.dirname(file_path) or ".").st_mtime
+        except OSError:
+            return None
+
+    @classmethod
+    def file_added(cls, file_path, dir_mtime=None):
+        """Notify indexes about a new file written through luna.
+
+        Args:
+            file_path (str): Path to written file.
+            dir_mtime (float, optional): Directory mtime before the write. Defaults to None.
+        """
+        dir_path, file_name = os.path.split(file_path)
+        dir_path = cls._norm_path(dir_path)
+        with cls._LOCK:
+            for key, index in list(cls._INSTANCES.items()):
+                if key[0] == dir_path and index._mtime is not None:
+                    index._add(file_name)
+                    index._update_mtime(dir_mtime)
+
+    @classmethod
+    def file_removed(cls, file_path, dir_mtime=None):
+        """Notify indexes about a file removed through luna.
+
+        Args:
+            file_path (str): Path to removed file.
+            dir_mtime (float, optional): Directory mtime before the removal. Defaults to None.
+        """
+        dir_path, file_name = os.path.split(file_path)
+        dir_path = cls._norm_path(dir_path)
+        with cls._LOCK:
+            for key, index in list(cls._INSTANCES.items()):
+                if key[0] == dir_path and index._mtime is not None:
+                    index._remove(file_name)
+                    index._update_mtime(dir_mtime)
+
+    @staticmethod
+    def _norm_path(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    @property
+    def files(self):
+        """Versioned files dictionary.
+
+        Returns:
+            dict: {base_name: [file_name, ...]} with file names ordered by version.
+        """
+        with VersionIndex._LOCK:
+            self.revalidate()
+            return dict([(name, list(versioned.sorted_files())) for name, versioned in self._files.items()])
+
+    def names(self):
+        """Get indexed base names.
+
+        Returns:
+            list[str]: Base names.
+        """
+        with VersionIndex._LOCK:
+            self.revalidate()
+            return list(self._files.keys())
+
+    def base_name(self, file_name):
+        return file_name.split(self.split_char)[0]
+
+    def versions(self, name):
+        """Get list of file names for base name ordered by version.
+
+        Args:
+            name (str): Base name.
+
+        Returns:
+            list[str]: File names.
+        """
+        with VersionIndex._LOCK:
+            self.revalidate()
+            versioned = self._files.get(name)
+            return list(versioned.sorted_files()) if versioned else []
+
+    def latest(self, name):
+        """Get latest file name for base name.
+
+        Args:
+            name (str): Base name.
+
+        Returns:
+            str: File name or None if there are no files for this name.
+        """
+        with VersionIndex._LOCK:
+            self.revalidate()
+            versioned = self._files.get(name)
+            return versioned.latest if versioned else None
+
+    def next_version(self, name):
+        """Get version number for a new file with given base name.
+
+        Args:
+            name (str): Base name.
+
+        Returns:
+            int: Latest version + 1 or 0 if there are no versioned files.
+        """
+        with VersionIndex._LOCK:
+            self.revalidate()
+            versioned = self._files.get(name)
+            return versioned.next_version if versioned else 0
+
+    def revalidate(self):
+        """Rescan directory if it was modified since last scan."""
+        with VersionIndex._LOCK:
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError:
+                self._files = {}
+                self._mtime = None
+                return
+            if mtime == self._mtime:
+                return
+            self.refresh(mtime=mtime)
+
+    def refresh(self, mtime=None):
+        """Scan directory and rebuild index.
+
+        Args:
+            mtime (float, optional): Directory mtime, queried if not passed. Defaults to None.
+        """
+        with VersionIndex._LOCK:
+            if mtime is None:
+                mtime = os.stat(self.path).st_mtime
+            self._files = {}
+            for file_name in os.listdir(self.path):
+                if not self._matches(file_name) or not os.path.isfile(os.path.join(self.path, file_name)):
+                    continue
+                self._insert(file_name)
+            self._mtime = mtime
+
+    def _matches(self, file_name):
+        # Hidden files are temp files of atomic writes and lock files
+        if file_name.startswith("."):
+            return False
+        return not self.extension or file_name.endswith("." + self.extension)
+
+    def _insert(self, file_name):
+        versioned = self._files.get(self.base_name(file_name))
+        if versioned is None:
+            versioned = _VersionedFiles()
+            self._files[self.base_name(file_name)] = versioned
+        versioned.add(file_name, parse_version(file_name, self.split_char))
+
+    def _update_mtime(self, dir_mtime):
+        # Directory changed only by our write since last scan, keep index without rescan
+        if dir_mtime is None or dir_mtime != self._mtime:
+            return
+        try:
+            self._mtime = os.stat(self.path).st_mtime
+        except OSError:
+            self._mtime = None
 
-    # Sort items for each key
-    for key, value in files_dict.items():
-        files_dict[key] = sorted(value)
+    def _add(self, file_name):
+        if self._matches(file_name):
+            self._insert(file_name)
 
-    return files_dict
+    def _remove(self, file_name):
+        base_name = self.base_name(file_name)
+        versioned = self._files.get(base_name)
+        if versioned is None:
+            return
+        versioned.remove(file_name)
+        if not versioned.files:
+            self._files.pop(base_name)
+
+
+def get_versioned_files(path, extension="", split_char="."):
+    return VersionIndex.get(path, extension=extension, split_char=split_char).files
 
 
 def get_latest_file(name, dir_path, extension="", full_path=True, split_char="."):
-    files_dict = get_versioned_files(dir_path, extension, split_char)
-    if name not in files_dict.keys():
+    latest = VersionIndex.get(dir_path, extension=extension, split_char=split_char).latest(name)
+    if latest is None:
         return None
     if full_path:
-        return os.path.join(dir_path, files_dict.get(name)[-1])
+        return os.path.join(dir_path, latest)
     else:
-        return files_dict.get(name)[-1]
+        return latest
 
 
 def get_new_versioned_file(name, dir_path, extension="", split_char=".", full_path=True):
-    files_dict = get_versioned_files(dir_path, extension, split_char)
-    if name in files_dict.keys():
-        new_version = int(files_dict.get(name)[-1].split(split_char)[-2]) + 1
-    else:
-        new_version = 0
+    new_version = VersionIndex.get(dir_path, extension=extension, split_char=split_char).next_version(name)
 
     new_file_name = "{0}.{1}.{2}".format(name, str(new_version).zfill(4), extension)
     if full_path:
@@ -190,11 +892,11 @@ def get_new_versioned_file(name, dir_path, extension="", split_char=".", full_pa
 
 
 def get_latest_from_sub_name(sub_name, dir_path, extension="", sub_index=0, sub_split="-", full_path=True, split_char="."):
-    files_dict = get_versioned_files(dir_path, extension, split_char)
-    related_names = [name for name in files_dict.keys() if name.split(sub_split)
+    index = VersionIndex.get(dir_path, extension=extension, split_char=split_char)
+    related_names = [name for name in index.names() if name.split(sub_split)
                      [sub_index] == sub_name]
     latest_versions = []
     for full_name in related_names:
-        latest_versions.append(get_latest_file(full_name, dir_path,
-                               extension=extension, full_path=full_path, split_char=split_char))
+        latest = index.latest(full_name)
+        latest_versions.append(os.path.join(dir_path, latest) if full_path else latest)
     return latest_versions
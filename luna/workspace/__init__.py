@@ -1,2 +1,3 @@
 from luna.workspace.asset import Asset
 from luna.workspace.project import Project
+from luna.workspace.recent import RecentProjects
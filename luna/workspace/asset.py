@@ -1,5 +1,6 @@
 import os
 from datetime import datetime
+from contextlib import contextmanager
 from luna import Logger
 import luna.utils.fileFn as fileFn
 from luna.interface.hud import LunaHUD
@@ -16,31 +17,27 @@ class Asset:
     def __repr__(self):
         return "Asset: {0}({1}), Model: {2}".format(self.name, self.type, self.meta_data.get("model"))
 
-    def __init__(self, project, name, typ):
+    def __init__(self, project, name, typ, read_only=False):
         self.name = name
         self.type = typ.lower()
         self.current_project = project
         if not self.current_project:
             raise Exception("Project is not set!")
 
-        # Define paths
+        # Define paths. Directories of assets from open() exist only after first write or ensure_layout.
         self.path = os.path.join(self.current_project.path, self.type.lower() + "s", self.name)  # type:str
-
-        #  Create directories
-        fileFn.create_missing_dir(self.path)
-        self.controls = fileFn.create_missing_dir(os.path.join(self.path, "controls"))  # type:str
-        self.skeleton = fileFn.create_missing_dir(os.path.join(self.path, "skeleton"))  # type:str
-        self.build = fileFn.create_missing_dir(os.path.join(self.path, "build"))  # type:str
-        self.rig = fileFn.create_missing_dir(os.path.join(self.path, "rig"))  # type:str
-        self.settings = fileFn.create_missing_dir(os.path.join(self.path, "settings"))  # type:str
+        self.controls = os.path.join(self.path, "controls")  # type:str
+        self.skeleton = os.path.join(self.path, "skeleton")  # type:str
+        self.build = os.path.join(self.path, "build")  # type:str
+        self.rig = os.path.join(self.path, "rig")  # type:str
+        self.settings = os.path.join(self.path, "settings")  # type:str
         self.weights = _weightsDirectorySctruct(self.path)
         self.data = _dataDirectoryStruct(self.path)
         self.mapping = _mappingFiles(self.data)
+        if read_only:
+            return
 
-        # Copy empty scenes
-        fileFn.copy_empty_scene(os.path.join(self.skeleton, "{0}_skeleton.0000.ma".format(self.name)))
-        fileFn.copy_empty_scene(os.path.join(self.rig, "{0}_rig.0000.ma".format(self.name)))
-
+        self.ensure_layout()
         # Set env variables and update hud
         Asset._INSTANCE = self
         self.current_project.update_meta()
@@ -48,6 +45,49 @@ class Asset:
         # Update hude
         LunaHUD.refresh()
 
+    @classmethod
+    def open(cls, project, name, typ):
+        """Get asset instance without any disk writes or workspace changes.
+        Sub directories are created on first write made through luna or by new_*_path properties (see ensure_layout),
+        call ensure_layout before writing to directory attributes with Maya or other tools.
+
+        Args:
+            project (luna.workspace.Project): Asset project.
+            name (str): Asset name.
+            typ (str): Asset type.
+
+        Returns:
+            Asset: Asset instance.
+        """
+        return cls(project, name, typ, read_only=True)
+
+    def ensure_layout(self):
+        """Create missing asset directories and template files."""
+        for dir_path in self.layout_dirs():
+            fileFn.create_missing_dir(dir_path)
+        self.mapping.create()
+
+        # Copy empty scenes
+        for scene_path in self.template_scenes():
+            fileFn.copy_empty_scene(scene_path)
+
+    def layout_dirs(self):
+        """Get all asset directories.
+
+        Returns:
+            list[str]: Directory paths.
+        """
+        return [self.path, self.controls, self.skeleton, self.build, self.rig, self.settings] + self.weights.paths() + self.data.paths()
+
+    def template_scenes(self):
+        """Get paths of initial scene files copied from empty scene template.
+
+        Returns:
+            list[str]: Scene paths.
+        """
+        return [os.path.join(self.skeleton, "{0}_skeleton.0000.ma".format(self.name)),
+                os.path.join(self.rig, "{0}_rig.0000.ma".format(self.name))]
+
     @property
     def meta_path(self):
         path = os.path.join(self.path, self.name + ".meta")  # type:str
@@ -68,6 +108,8 @@ class Asset:
 
     @property
     def new_skeleton_path(self):
+        """Path for next skeleton scene version. Creates skeleton directory, so path can be passed to Maya file commands."""
+        fileFn.create_missing_dir(self.skeleton)
         path = fileFn.get_new_versioned_file("{0}_skeleton".format(self.name), self.skeleton, extension="ma", full_path=True, split_char=".")  # type: str
         return path
 
@@ -78,6 +120,8 @@ class Asset:
 
     @property
     def new_rig_path(self):
+        """Path for next rig scene version. Creates rig directory if missing."""
+        fileFn.create_missing_dir(self.rig)
         path = fileFn.get_new_versioned_file("{0}_rig".format(self.name), self.rig, extension="ma", full_path=True, split_char=".")  # type: str
         return path
 
@@ -88,6 +132,8 @@ class Asset:
 
     @property
     def new_build_path(self):
+        """Path for next build graph version. Creates build directory if missing."""
+        fileFn.create_missing_dir(self.build)
         path = fileFn.get_new_versioned_file(self.name, self.build, extension="rig", full_path=True, split_char=".")  # type: str
         return path
 
@@ -96,52 +142,78 @@ class Asset:
         path = self.meta_data.get("model", "")  # type:str
         return path
 
+    @contextmanager
+    def meta_transaction(self):
+        """Read meta data once, apply changes and write them atomically on exit.
+        Meta file is locked for the duration of transaction.
+
+        Example:
+            with asset.meta_transaction() as meta:
+                meta["model"] = model_path
+
+        Yields:
+            dict: Meta data dictionary.
+        """
+        fileFn.create_missing_dir(self.path)
+        with fileFn.FileLock(self.meta_path):
+            meta_dict = self.meta_data
+            yield meta_dict
+            meta_dict["modified"] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+            fileFn.write_json(self.meta_path, meta_dict, atomic=True)
+
     def set_data(self, key, value):
-        data = self.meta_data
-        data[key] = value
-        data["modified"] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        fileFn.write_json(self.meta_path, data)
-
-    def update_meta(self):
-        meta_dict = self.meta_data
-        meta_dict["name"] = self.name
-        meta_dict["type"] = self.type
-        meta_dict["modified"] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        meta_dict["model"] = meta_dict.get("model", "")
-        if not meta_dict.get("created", ""):
-            meta_dict["created"] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        fileFn.write_json(self.meta_path, meta_dict)
+        with self.meta_transaction() as meta_dict:
+            meta_dict[key] = value
+
+    def update_meta(self, extra_data=None):
+        with self.meta_transaction() as meta_dict:
+            if extra_data:
+                meta_dict.update(extra_data)
+            meta_dict["name"] = self.name
+            meta_dict["type"] = self.type
+            meta_dict["model"] = meta_dict.get("model", "")
+            if not meta_dict.get("created", ""):
+                meta_dict["created"] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
 
 
 class _weightsDirectorySctruct:
     """Directory scruct with folder per weight type"""
 
     def __init__(self, root):
-        self.blendshape = fileFn.create_missing_dir(os.path.join(root, "weights", "blendshape"))  # type:str
-        self.delta_mush = fileFn.create_missing_dir(os.path.join(root, "weights", "delta_mush"))  # type:str
-        self.ffd = fileFn.create_missing_dir(os.path.join(root, "weights", "ffd"))  # type:str
-        self.ncloth = fileFn.create_missing_dir(os.path.join(root, "weights", "ncloth"))  # type:str
-        self.skin = fileFn.create_missing_dir(os.path.join(root, "weights", "skin"))  # type:str
-        self.nonlinear = fileFn.create_missing_dir(os.path.join(root, "weights", "nonlinear"))  # type:str
-        self.tension = fileFn.create_missing_dir(os.path.join(root, "weights", "tension"))  # type:str
-        self.soft_mod = fileFn.create_missing_dir(os.path.join(root, "weights", "soft_mod"))  # type:str
-        self.dsAttract = fileFn.create_missing_dir(os.path.join(root, "weights", "dsAttract"))  # type:str
-        self.ng_layers = fileFn.create_missing_dir(os.path.join(root, "weights", "ng_layers"))  # type:str
-        self.ng_layers2 = fileFn.create_missing_dir(os.path.join(root, "weights", "ng_layers2"))  # type:str
+        self.blendshape = os.path.join(root, "weights", "blendshape")  # type:str
+        self.delta_mush = os.path.join(root, "weights", "delta_mush")  # type:str
+        self.ffd = os.path.join(root, "weights", "ffd")  # type:str
+        self.ncloth = os.path.join(root, "weights", "ncloth")  # type:str
+        self.skin = os.path.join(root, "weights", "skin")  # type:str
+        self.nonlinear = os.path.join(root, "weights", "nonlinear")  # type:str
+        self.tension = os.path.join(root, "weights", "tension")  # type:str
+        self.soft_mod = os.path.join(root, "weights", "soft_mod")  # type:str
+        self.dsAttract = os.path.join(root, "weights", "dsAttract")  # type:str
+        self.ng_layers = os.path.join(root, "weights", "ng_layers")  # type:str
+        self.ng_layers2 = os.path.join(root, "weights", "ng_layers2")  # type:str
+
+    def paths(self):
+        return sorted(vars(self).values())
 
 
 class _dataDirectoryStruct:
     """Directory struct with folder per data type."""
 
     def __init__(self, root):
-        self.blendshapes = fileFn.create_missing_dir(os.path.join(root, "data", "blendshapes"))  # type:str
-        self.driven_poses = fileFn.create_missing_dir(os.path.join(root, "data", "driven_poses"))  # type:str
-        self.sdk_correctives = fileFn.create_missing_dir(os.path.join(root, "data", "sdk_correctives"))  # type:str
-        self.xgen = fileFn.create_missing_dir(os.path.join(root, "data", "xgen"))  # type:str
-        self.mocap = fileFn.create_missing_dir(os.path.join(root, "data", "mocap"))  # type:str
-        self.psd = fileFn.create_missing_dir(os.path.join(root, "data", "psd"))  # type:str
+        self.blendshapes = os.path.join(root, "data", "blendshapes")  # type:str
+        self.driven_poses = os.path.join(root, "data", "driven_poses")  # type:str
+        self.sdk_correctives = os.path.join(root, "data", "sdk_correctives")  # type:str
+        self.xgen = os.path.join(root, "data", "xgen")  # type:str
+        self.mocap = os.path.join(root, "data", "mocap")  # type:str
+        self.psd = os.path.join(root, "data", "psd")  # type:str
+
+    def paths(self):
+        return sorted(vars(self).values())
 
 
 class _mappingFiles:
     def __init__(self, data_struct):
-        self.blendshapes = fileFn.create_file(os.path.join(data_struct.blendshapes, "mapping.json"), data=r"{}")
+        self.blendshapes = os.path.join(data_struct.blendshapes, "mapping.json")
+
+    def create(self):
+        fileFn.create_file(self.blendshapes, data=r"{}")
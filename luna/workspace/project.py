@@ -1,5 +1,8 @@
 import os
-from collections import deque
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 from datetime import datetime
 
 from luna import Logger
@@ -9,6 +12,7 @@ try:
     from luna import Config
     from luna import ProjectVars
     from luna.interface.hud import LunaHUD
+    from luna.workspace.recent import RecentProjects
 except Exception:
     Logger.exception("Failed to import modules")
 
@@ -21,10 +25,15 @@ class Project(object):
     _INSTANCE = None  # type: Project
 
     def __repr__(self):
-        return "{0}({1}): {2}".format(self.name, self.path, self.meta_data)
+        return "{0}({1}): {2}".format(self.name, self.path, self.get_meta_data(refresh=False))
 
     def __init__(self, path):
         self.path = path  # type: str
+        # Cached meta file data and asset index: {category: [mtime, [asset names]]}
+        self._meta_file_cache = None  # type: dict
+        self._meta_file_stamp = None  # type: tuple
+        self._categories = {}  # type: dict
+        self._root_mtime = None  # type: float
 
     @property
     def name(self):
@@ -43,42 +52,174 @@ class Project(object):
 
     @property
     def meta_data(self):
-        meta_dict = {}
-        if os.path.isfile(self.meta_path):
-            meta_dict = fileFn.load_json(self.meta_path)
+        return self.get_meta_data()
 
-        for category in os.listdir(self.path):
-            category_path = os.path.join(self.path, category)
-            if os.path.isdir(category_path):
-                asset_dirs = filter(os.path.isdir, [os.path.join(category_path, item) for item in os.listdir(category_path)])
-                meta_dict[category] = [os.path.basename(asset) for asset in asset_dirs]
+    def get_meta_data(self, refresh=True):
+        """Get project meta data with asset lists per category.
+
+        Args:
+            refresh (bool, optional): Revalidate cached data against file and directories mtimes. Defaults to True.
+
+        Returns:
+            dict: Meta data dictionary.
+        """
+        if refresh or self._meta_file_cache is None:
+            self._load_meta_file()
+            self.refresh()
+        meta_dict = dict(self._meta_file_cache)
+        for category, entry in self._categories.items():
+            meta_dict[category] = list(entry[1])
         return meta_dict
 
+    def assets(self, category):
+        """Get asset names for category from project index. Directories are scanned only once.
+
+        Args:
+            category (str): Category directory name, e.g. "characters".
+
+        Returns:
+            list[str]: Asset names.
+        """
+        if self._root_mtime is None:
+            self.refresh()
+        entry = self._categories.get(category)
+        return list(entry[1]) if entry else []
+
+    def refresh(self, force=False):
+        """Update asset index. Only categories with changed mtime are rescanned.
+
+        Args:
+            force (bool, optional): Rescan all categories. Defaults to False.
+        """
+        root_mtime = os.stat(self.path).st_mtime
+        if force or root_mtime != self._root_mtime:
+            categories = {}
+            for category in os.listdir(self.path):
+                if os.path.isdir(os.path.join(self.path, category)):
+                    categories[category] = self._categories.get(category, [None, []])
+            self._categories = categories
+            self._root_mtime = root_mtime
+
+        for category, entry in self._categories.items():
+            category_path = os.path.join(self.path, category)
+            try:
+                category_mtime = os.stat(category_path).st_mtime
+            except OSError:
+                continue
+            if not force and category_mtime == entry[0]:
+                continue
+            entry[0] = category_mtime
+            entry[1] = sorted([item for item in os.listdir(category_path) if os.path.isdir(os.path.join(category_path, item))])
+            Logger.debug("Scanned project category: %s", category_path)
+
+    def _load_meta_file(self):
+        try:
+            stat = os.stat(self.meta_path)
+            stamp = (stat.st_mtime, stat.st_size)
+        except OSError:
+            stamp = None
+        if self._meta_file_cache is not None and stamp == self._meta_file_stamp:
+            return
+        meta_dict = {}
+        if stamp:
+            meta_dict = fileFn.load_json(self.meta_path) or {}
+        self._meta_file_cache = meta_dict
+        self._meta_file_stamp = stamp
+
+    def _write_meta_file(self, data):
+        fileFn.write_json(self.meta_path, data, sort_keys=True, atomic=True)
+        self._meta_file_cache = None
+        self._load_meta_file()
+
+    @contextmanager
+    def meta_transaction(self):
+        """Read meta data once, apply changes and write them atomically on exit.
+        Meta file is locked for the duration of transaction.
+
+        Yields:
+            dict: Meta data dictionary.
+        """
+        with fileFn.FileLock(self.meta_path):
+            # Always re-read under lock to pick up changes from other processes
+            self._meta_file_cache = None
+            data_dict = self.meta_data
+            yield data_dict
+            self._write_meta_file(data_dict)
+
     def __on_creation(self):
         Config.set(ProjectVars.previous_project, self.path)
         self.add_to_recent()
         LunaHUD.refresh()
 
     def set_data(self, key, value):
-        data_dict = self.meta_data
-        data_dict[key] = value
-        fileFn.write_json(self.meta_path, data_dict, sort_keys=True)
+        with self.meta_transaction() as data_dict:
+            data_dict[key] = value
 
     def update_meta(self):
-        fileFn.write_json(self.meta_path, data=self.meta_data)
+        with self.meta_transaction():
+            pass
 
     def add_to_recent(self):
-        max_recent = Config.get(ProjectVars.recent_max, default=3)
-        project_queue = Config.get(ProjectVars.recent_projects, default=deque(maxlen=max_recent))
-        if not isinstance(project_queue, deque):
-            project_queue = deque(project_queue, maxlen=max_recent)
+        RecentProjects.add(self.name, self.path)
 
-        entry = [self.name, self.path]
-        if entry in project_queue:
-            return
+    def create_assets(self, specs, threads=8):
+        """Create many assets at once. Directories and template files are created on a thread pool,
+        each asset meta file and project meta file are written once.
+
+        Example:
+            project.create_assets([{"name": "chair", "type": "prop"}, {"name": "table", "type": "prop", "model": path}])
+
+        Args:
+            specs (list[dict]): Asset specs with "name" and "type" keys. Other keys are stored in asset meta data.
+            threads (int, optional): Number of worker threads. Defaults to 8.
+
+        Returns:
+            list[luna.workspace.Asset]: Created assets.
+        """
+        timings = OrderedDict()
+        # Plan
+        start_time = time.time()
+        assets = []
+        dir_paths = set()
+        scene_copies = []
+        mapping_files = []
+        for spec in specs:
+            asset = luna.workspace.Asset.open(self, spec["name"], spec["type"])
+            assets.append(asset)
+            dir_paths.update(asset.layout_dirs())
+            scene_copies.extend(asset.template_scenes())
+            mapping_files.append(asset.mapping)
+        # Resolve template on main thread, Maya commands are not thread safe
+        empty_scene_path = fileFn.get_empty_scene_path()
+        timings["plan"] = time.time() - start_time
+
+        pool = ThreadPool(max(1, threads))
+        try:
+            # Directories, sorted so parents are usually created first
+            start_time = time.time()
+            pool.map(fileFn.create_missing_dir, sorted(dir_paths))
+            timings["directories"] = time.time() - start_time
+            # Template files
+            start_time = time.time()
+            pool.map(lambda scene_path: fileFn.copy_empty_scene(scene_path, source_path=empty_scene_path), scene_copies)
+            pool.map(lambda mapping: mapping.create(), mapping_files)
+            timings["templates"] = time.time() - start_time
+            # Meta files
+            start_time = time.time()
+            pool.map(lambda pair: pair[0].update_meta(extra_data=pair[1]),
+                     [(asset, dict([(key, value) for key, value in spec.items() if key not in ("name", "type")]))
+                      for asset, spec in zip(assets, specs)])
+            self.update_meta()
+            timings["meta"] = time.time() - start_time
+        finally:
+            pool.close()
+            pool.join()
 
-        project_queue.appendleft(entry)
-        Config.set(ProjectVars.recent_projects, list(project_queue))
+        Logger.info("Created {0} assets in {1:.3f}s ({2})".format(
+            len(assets),
+            sum(timings.values()),
+            ", ".join(["{0}: {1:.3f}s".format(phase, duration) for phase, duration in timings.items()])))
+        return assets
 
     @classmethod
     def create(cls, path, silent=False):
@@ -103,7 +244,7 @@ class Project(object):
     @classmethod
     def is_project(cls, path):
         search_file = os.path.join(path, cls.TAG_FILE)
-        Logger.debug("isProject check ({0}) - {1}".format(os.path.isfile(search_file), path))
+        Logger.debug("isProject check (%s) - %s", os.path.isfile(search_file), path)
         return os.path.isfile(search_file)
 
     @classmethod
@@ -132,10 +273,5 @@ class Project(object):
         LunaHUD.refresh()
 
     @staticmethod
-    def refresh_recent():
-        recent_projects = Config.get(ProjectVars.recent_projects)
-        existing_projects = []
-        for prj in recent_projects:
-            if os.path.isdir(prj[1]):
-                existing_projects.append(prj)
-        Config.set(ProjectVars.recent_projects, existing_projects)
+    def refresh_recent(background=True):
+        RecentProjects.validate(background=background)
@@ -0,0 +1,108 @@
+import os
+import threading
+from collections import OrderedDict
+
+from luna import Logger
+import luna.utils.fileFn as fileFn
+from luna import Config
+from luna import ProjectVars
+from luna.static import directories
+
+
+class RecentProjects(object):
+    """Recent projects registry stored in a dedicated file.
+
+    Entries are kept in memory ordered oldest to newest, so adding a project is O(1).
+    Existence of project directories is checked lazily in a background thread.
+    """
+    FILE_PATH = directories.RECENT_PROJECTS_PATH
+    _entries = None  # type: OrderedDict
+    _lock = threading.RLock()
+    _validate_thread = None  # type: threading.Thread
+
+    @classmethod
+    def max_size(cls):
+        return Config.get(ProjectVars.recent_max, default=3, cached=True)
+
+    @classmethod
+    def add(cls, name, path):
+        """Add project to the top of recent list.
+
+        Args:
+            name (str): Project name.
+            path (str): Project path.
+        """
+        with cls._lock:
+            entries = cls._get_entries()
+            entries.pop(path, None)
+            entries[path] = name
+            while len(entries) > cls.max_size():
+                entries.popitem(last=False)
+            cls.save()
+
+    @classmethod
+    def remove(cls, path):
+        with cls._lock:
+            if cls._get_entries().pop(path, None) is not None:
+                cls.save()
+
+    @classmethod
+    def entries(cls):
+        """Get recent projects, newest first. Does not touch project directories.
+
+        Returns:
+            list[list[str]]: List of [name, path] pairs.
+        """
+        with cls._lock:
+            result = [[name, path] for path, name in reversed(list(cls._get_entries().items()))]
+        return result
+
+    @classmethod
+    def validate(cls, background=True):
+        """Remove entries with missing project directories.
+
+        Args:
+            background (bool, optional): Run check in a separate thread. Defaults to True.
+        """
+        if not background:
+            cls._validate()
+            return
+        if cls._validate_thread and cls._validate_thread.is_alive():
+            return
+        cls._validate_thread = threading.Thread(target=cls._validate, name="luna_recent_projects")
+        cls._validate_thread.daemon = True
+        cls._validate_thread.start()
+
+    @classmethod
+    def save(cls):
+        # Write under lock, so file always matches latest in-memory state
+        with cls._lock:
+            data = [[name, path] for path, name in reversed(list(cls._get_entries().items()))]
+            fileFn.write_json(cls.FILE_PATH, data)
+
+    @classmethod
+    def _validate(cls):
+        with cls._lock:
+            paths = list(cls._get_entries().keys())
+        # Stat outside of lock, network mounts can be slow
+        missing = set([path for path in paths if not os.path.isdir(path)])
+        if not missing:
+            return
+        with cls._lock:
+            for path in missing:
+                cls._get_entries().pop(path, None)
+            cls.save()
+        Logger.debug("Removed missing recent projects: %s", list(missing))
+
+    @classmethod
+    def _get_entries(cls):
+        if cls._entries is None:
+            if os.path.isfile(cls.FILE_PATH):
+                data = fileFn.load_json(cls.FILE_PATH) or []
+            else:
+                # Migrate list previously stored in config
+                data = Config.get(ProjectVars.recent_projects, default=[], cached=True) or []
+            cls._entries = OrderedDict()
+            for name, path in reversed(data):
+                cls._entries[path] = name
+        return cls._entries
@@ -182,7 +182,7 @@ def register_node(node_id, node_class):
 def _do_node_registrations():
     for node_id, node_class in NODES_QUEUE.items():
         NODE_REGISTER[node_id] = node_class
-        Logger.debug('Registered node {0}::{1}'.format(node_id, node_class))
+        Logger.debug('Registered node %s::%s', node_id, node_class)
     NODES_QUEUE.clear()
 
 
@@ -263,7 +263,7 @@ def _do_func_registrations():
             FUNCTION_REGISTER[dt_name] = {}
         for signature, func_dict in FUNCTIONS_QUEUE[dt_name].items():
             FUNCTION_REGISTER[dt_name][signature] = func_dict
-            Logger.debug('Function registered {0}: {1}'.format(dt_name, signature))
+            Logger.debug('Function registered %s: %s', dt_name, signature)
     FUNCTIONS_QUEUE.clear()
 
 
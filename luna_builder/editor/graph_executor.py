@@ -2,6 +2,9 @@ import timeit
 
 from collections import deque
 from luna import Logger
+from luna import Telemetry
+import luna_rig.functions.nameFn as nameFn
+from luna_rig.core.shape_manager import ShapeManager
 import luna_builder.editor.editor_conf as editor_conf
 
 
@@ -60,16 +63,23 @@ class GraphExecutor(object):
         Logger.info('Initiating new build...')
         start_time = timeit.default_timer()
         self.scene.is_executing = True
-        for node in self.exec_chain:
-            try:
-                node._exec()
-            except Exception:
-                Logger.exception('Failed to execute {0}'.format(node.title))
-                self.scene.is_executing = False
-                return
-
-        Logger.info("Build finished in {0:.2f}s".format(timeit.default_timer() - start_time))
-        self.scene.is_executing = False
+        Telemetry.build_started(self.scene.file_name or "untitled", source="graph", nodes=len(self.exec_chain))
+        success = False
+        try:
+            with nameFn.NameAllocator.scope(), ShapeManager.fast_apply():
+                for node in self.exec_chain:
+                    try:
+                        node._exec()
+                    except Exception:
+                        Logger.exception('Failed to execute {0}'.format(node.title))
+                        return
+
+            success = True
+            Logger.info("Build finished in {0:.2f}s".format(timeit.default_timer() - start_time))
+        finally:
+            self.scene.is_executing = False
+            Telemetry.build_finished(success=success)
+            Logger.flush()
 
     def execute_step(self):
         if self.step == len(self.exec_chain):
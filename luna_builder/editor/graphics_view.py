@@ -1,4 +1,5 @@
 import imp
+import logging
 from PySide2 import QtCore
 from PySide2 import QtGui
 from PySide2 import QtWidgets
@@ -262,11 +263,13 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
         return (click_release_delta.x() ** 2 + click_release_delta.y() ** 2) > QLGraphicsView.EDGE_DRAG_START_THRESHOLD ** 2
 
     def log_scene_objects(self, item):
+        if not Logger.is_enabled_for(logging.DEBUG):
+            return
         if isinstance(item, graphics_socket.QLGraphicsSocket):
             Logger.debug(item.socket)
-            Logger.debug('  Data Class: {0}'.format(item.socket.data_class))
-            Logger.debug('  Value: {0}'.format(item.socket.value()))
-            Logger.debug('  Connected edge: {0}'.format(item.socket.edges))
+            Logger.debug('  Data Class: %s', item.socket.data_class)
+            Logger.debug('  Value: %s', item.socket.value())
+            Logger.debug('  Connected edge: %s', item.socket.edges)
         elif isinstance(item, graphics_node.QLGraphicsNode):
             Logger.debug(item.node)
             Logger.debug('-- Inputs')
@@ -280,17 +283,17 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
                 Logger.debug(outsocket)
         elif isinstance(item, graphics_edge.QLGraphicsEdge):
             Logger.debug(item.edge)
-            Logger.debug('  Start: {0}, End:{1}'.format(item.edge.start_socket, item.edge.end_socket))
+            Logger.debug('  Start: %s, End:%s', item.edge.start_socket, item.edge.end_socket)
 
         if not item:
             Logger.debug('SCENE:')
-            Logger.debug('VARS: {0}'.format(self.scene.vars._vars))
+            Logger.debug('VARS: %s', self.scene.vars._vars)
             Logger.debug('  Nodes:')
             for node in self.gr_scene.scene.nodes:
-                Logger.debug('    {0}'.format(node))
+                Logger.debug('    %s', node)
             Logger.debug('  Edges:')
             for edge in self.gr_scene.scene.edges:
-                Logger.debug('    {0}'.format(edge))
+                Logger.debug('    %s', edge)
 
     def debug_modifiers(self, event):
         """Helper function get string if we hold Ctrl, Shift or Alt modifier keys"""
@@ -27,14 +27,14 @@ class EdgeDrag(object):
 
     def start_edge_drag(self, item):
         try:
-            Logger.debug('Start dragging edge: {}'.format(self.gr_view.edge_mode))
+            Logger.debug('Start dragging edge: %s', self.gr_view.edge_mode)
             self.drag_start_socket = item.socket
             if isinstance(item.socket, node_socket.OutputSocket):
-                Logger.debug('Assign start socket to: {0}'.format(item.socket))
+                Logger.debug('Assign start socket to: %s', item.socket)
                 self.drag_edge = node_edge.Edge(
                     self.gr_view.scene, start_socket=item.socket, end_socket=None, silent=True)
             else:
-                Logger.debug('Assign end socket to: {0}'.format(item.socket))
+                Logger.debug('Assign end socket to: %s', item.socket)
                 self.drag_edge = node_edge.Edge(
                     self.gr_view.scene, start_socket=None, end_socket=item.socket, silent=True)
         except Exception:
@@ -61,11 +61,11 @@ class EdgeDrag(object):
         start_socket = None
         end_socket = None
         if isinstance(item.socket, node_socket.OutputSocket):
-            Logger.debug('Assign start socket: {0}'.format(item.socket))
+            Logger.debug('Assign start socket: %s', item.socket)
             start_socket = item.socket
             end_socket = self.drag_start_socket
         elif isinstance(item.socket, node_socket.InputSocket):
-            Logger.debug('Assign end socket: {0}'.format(item.socket))
+            Logger.debug('Assign end socket: %s', item.socket)
             start_socket = self.drag_start_socket
             end_socket = item.socket
 
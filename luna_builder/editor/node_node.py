@@ -4,6 +4,7 @@ from collections import deque
 from collections import OrderedDict
 
 from luna import Logger
+from luna import Telemetry
 import luna_builder.editor.editor_conf as editor_conf
 import luna_builder.editor.graphics_node as graphics_node
 import luna_builder.editor.node_socket as node_socket
@@ -266,7 +267,7 @@ class Node(node_serializable.Serializable):
 
     def on_invalid_change(self, state):
         if state:
-            Logger.debug('{0} marked invalid'.format(self))
+            Logger.debug('%s marked invalid', self)
 
     def mark_children_compiled(self, state):
         if state:
@@ -339,7 +340,7 @@ class Node(node_serializable.Serializable):
                     break
             if found is None:
                 Logger.warning('Deserialization of socket data has not found socket with index {0}'.format(socket_data['index']))
-                Logger.debug('Missing socket data: {0}'.format(socket_data))
+                Logger.debug('Missing socket data: %s', socket_data)
                 data_type = editor_conf.DataType.get_type(socket_data['data_type'])
                 value = socket_data.get('value', data_type['default'])
                 found = self.add_input(data_type, socket_data['label'], value=value)
@@ -353,7 +354,7 @@ class Node(node_serializable.Serializable):
                     break
             if found is None:
                 Logger.warning('Deserialization of socket data has not found socket with index {0}'.format(socket_data['index']))
-                Logger.debug('Missing socket data: {0}'.format(socket_data))
+                Logger.debug('Missing socket data: %s', socket_data)
                 # we can create new socket for this
                 data_type = editor_conf.DataType.get_type(socket_data['data_type'])
                 value = socket_data.get('value', data_type['default'])
@@ -449,10 +450,11 @@ class Node(node_serializable.Serializable):
             input.update_affected()
 
     def _exec(self):
-        Logger.debug('Executing {0}...'.format(self))
+        Logger.debug('Executing %s...', self)
         try:
-            self.execute()
-            self.update_affected_outputs()
+            with Telemetry.timed("node_exec", **self.telemetry_fields()):
+                self.execute()
+                self.update_affected_outputs()
         except Exception:
             Logger.exception('Failed to execute {0} {1}'.format(self.title, self))
             self.append_tooltip('Execution error (Check script editor for details)\n')
@@ -463,6 +465,10 @@ class Node(node_serializable.Serializable):
         self.set_invalid(False)
         return 0
 
+    def telemetry_fields(self):
+        """Fields recorded with node_exec telemetry event."""
+        return {"node": self.title, "node_id": self.ID, "node_class": self.__class__.__name__}
+
     def execute(self):
         return 0
 
@@ -145,7 +145,7 @@ class QLDragTreeWidget(QtWidgets.QTreeWidget):
             drag.setHotSpot(QtCore.QPoint(pixmap.width() / 2, pixmap.height() / 2))
             drag.setPixmap(pixmap)
 
-            Logger.debug('Dragging item <{0}>, {1}'.format(node_id, item))
+            Logger.debug('Dragging item <%s>, %s', node_id, item)
             drag.exec_(QtCore.Qt.MoveAction)
 
         except Exception:
@@ -1,3 +1,4 @@
+import logging
 import itertools
 from collections import deque
 from PySide2 import QtCore
@@ -72,7 +73,7 @@ class SceneHistory(object):
             Logger.error("Out of bounds step: {0}".format(new_value))
             return
 
-        Logger.debug("New step {0}, Current step {1}".format(new_value, self.current_step))
+        Logger.debug("New step %s, Current step %s", new_value, self.current_step)
         if self.current_step < new_value:
             while self.current_step < new_value:
                 self.redo()
@@ -82,7 +83,7 @@ class SceneHistory(object):
 
     def restore_history(self):
         self.enabled = False
-        # Logger.debug('Restoring history | \nStep: @{0} | Stack: {1}'.format(self.current_step, len(self)))
+        # Logger.debug('Restoring history | \nStep: @%s | Stack: %s', self.current_step, len(self))
         self.restore_stamp(self.stack[self.current_step])
         self.scene.has_been_modified = True
         self.enabled = True
@@ -149,8 +150,10 @@ class SceneHistory(object):
             raise
 
     def debug_varibles(self):
+        if not Logger.is_enabled_for(logging.DEBUG):
+            return
         for step, stamp in enumerate(self.stack):
-            Logger.debug('Step {0} - {1}'.format(step, stamp['snapshot']['vars']))
+            Logger.debug('Step %s - %s', step, stamp['snapshot']['vars'])
 
 
 class SceneHistoryWidget(QtWidgets.QListWidget):
@@ -172,7 +175,7 @@ class SceneHistoryWidget(QtWidgets.QListWidget):
 
         self.update_view()
         self.update_current_step(self.tracked_history.current_step)
-        Logger.debug("Tracking history: {}".format(self.tracked_history))
+        Logger.debug("Tracking history: %s", self.tracked_history)
 
     def update_view(self):
         self.clear()
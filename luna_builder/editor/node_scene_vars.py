@@ -274,7 +274,7 @@ class QLVarsListWidget(QtWidgets.QListWidget):
             # drag.setHotSpot(QtCore.QPoint(pixmap.width() / 2, pixmap.height() / 2))
             # drag.setPixmap(pixmap)
 
-            Logger.debug('Dragging item <{0}>'.format(item.text()))
+            Logger.debug('Dragging item <%s>', item.text())
             drag.exec_(QtCore.Qt.MoveAction)
 
         except Exception:
@@ -329,7 +329,7 @@ class VarAttribWidget(QtWidgets.QGroupBox):
             self.value_widget = QtWidgets.QCheckBox()
             self.value_widget.setChecked(var_value)
         else:
-            Logger.debug('Missing widget creation for data {0}'.format(var_data_type['class']))
+            Logger.debug('Missing widget creation for data %s', var_data_type['class'])
 
     def create_layouts(self):
         self.main_layout = QtWidgets.QFormLayout()
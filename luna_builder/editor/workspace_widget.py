@@ -103,7 +103,7 @@ class ProjectGroup(QtWidgets.QGroupBox):
 
     def create_project(self):
         prev_project_path = Config.get(ProjectVars.previous_project, default="")
-        Logger.debug("Previous project: {0}".format(prev_project_path))
+        Logger.debug("Previous project: %s", prev_project_path)
         if os.path.isdir(prev_project_path):
             root_dir = os.path.dirname(prev_project_path)
         else:
@@ -116,7 +116,7 @@ class ProjectGroup(QtWidgets.QGroupBox):
 
     def browse_project(self):
         prev_project_path = Config.get(ProjectVars.previous_project, default="")
-        Logger.debug("Previous project: {0}".format(prev_project_path))
+        Logger.debug("Previous project: %s", prev_project_path)
         if os.path.isdir(prev_project_path):
             root_dir = os.path.dirname(prev_project_path)
         else:
@@ -264,8 +264,7 @@ class AssetGroup(QtWidgets.QGroupBox):
         if not current_project:
             self.asset_name_lineedit.setCompleter(None)
             return
-        project_meta = current_project.meta_data
-        asset_list = project_meta.get(self.asset_type_cmbox.currentText() + "s", [])
+        asset_list = current_project.assets(self.asset_type_cmbox.currentText() + "s")
         if not asset_list:
             self.asset_name_lineedit.setCompleter(None)
             return
@@ -1,4 +1,3 @@
-import os
 from PySide2 import QtWidgets
 import luna
 import luna.utils.pysideFn as pysideFn
@@ -77,12 +76,11 @@ class FileMenu(QtWidgets.QMenu):
         self.addAction(self.clear_referances_action)
 
     def update_recent_projects(self):
-        projects_data = luna.Config.get(luna.ProjectVars.recent_projects)
+        projects_data = luna.workspace.RecentProjects.entries()
+        luna.workspace.Project.refresh_recent()
 
         self.recent_projects_menu.clear()
         for prj in projects_data:
-            if not os.path.isdir(prj[1]):
-                continue
             project_action = QtWidgets.QAction(prj[0], self)
             project_action.setToolTip(prj[1])
             project_action.triggered.connect(lambda path=prj[1], *args: self.workspace_widget.project_grp.set_project(path))
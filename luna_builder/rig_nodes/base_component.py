@@ -14,6 +14,11 @@ class ComponentNode(luna_node.LunaNode):
         super(ComponentNode, self).__init__(scene, title=title)
         self.component_instance = None
 
+    def telemetry_fields(self):
+        fields = super(ComponentNode, self).telemetry_fields()
+        fields["component"] = self.COMPONENT_CLASS.as_str(name_only=True)
+        return fields
+
     def init_sockets(self, reset=True):
         super(ComponentNode, self).init_sockets(reset=reset)
         # Inputs
@@ -80,7 +80,7 @@ class FunctionNode(luna_node.LunaNode):
     def execute(self):
         attr_values = [socket.value() for socket in self.list_non_exec_inputs()]
         func_result = self.func_ref(*attr_values)
-        Logger.debug('Function result: {0}'.format(func_result))
+        Logger.debug('Function result: %s', func_result)
 
         # Set outputs
         if not isinstance(func_result, (list, tuple)):
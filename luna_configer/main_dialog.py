@@ -145,10 +145,10 @@ class MainDialog(QtWidgets.QDialog):
             if isinstance(child, pages.PageWidget):
                 try:
                     child.load_config()
-                    Logger.debug("{0} page - loaded in: {1}s".format(child, timeit.default_timer() - start_time))
+                    Logger.debug("%s page - loaded in: %ss", child, timeit.default_timer() - start_time)
                 except Exception:
                     Logger.exception("Failed to load config for {0}".format(child))
-        Logger.debug("Config load time: {0}s".format(timeit.default_timer() - start_time))
+        Logger.debug("Config load time: %ss", timeit.default_timer() - start_time)
 
     def closeEvent(self, event):
         MainDialog.GEOMETRY = self.saveGeometry()
@@ -123,7 +123,7 @@ class DeveloperPage(PageWidget):
 
         # Update config
         luna.Config.update(new_config)
-        luna.Logger.debug("Developer page - saved config: {0}".format(new_config))
+        luna.Logger.debug("Developer page - saved config: %s", new_config)
 
 
 class GeneralPage(PageWidget):
@@ -185,7 +185,7 @@ class GeneralPage(PageWidget):
         new_config[luna.LunaVars.marking_menu_mode] = self.marking_mode_combobox.currentIndex()
 
         luna.Config.update(new_config)
-        luna.Logger.debug("General page - saved config: {0}".format(new_config))
+        luna.Logger.debug("General page - saved config: %s", new_config)
         # Hud recreate
         luna.Logger.info("Updating HUD...")
         hud.LunaHUD.create()
@@ -275,7 +275,7 @@ class RigPage(PageWidget):
         new_config[luna.RigVars.line_width] = self.misc_line_width.value()
 
         luna.Config.update(new_config)
-        luna.Logger.debug("Rig page - saved config: {0}".format(new_config))
+        luna.Logger.debug("Rig page - saved config: %s", new_config)
 
     def update_templates_table(self, templates_dict):
         self.naming_templates_table.setRowCount(0)
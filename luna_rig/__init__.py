@@ -1,5 +1,7 @@
 # Core classes
 from luna_rig.core.meta import MetaNode
+from luna_rig.core.meta_graph import MetaGraph
+from luna_rig.core.pose import PoseSnapshot
 from luna_rig.core.component import Component
 from luna_rig.core.component import AnimComponent
 from luna_rig.core.component import Hook
@@ -21,6 +21,8 @@ class Character(luna_rig.Component):
     WORLD_SPACE_LOCATOR_NAME = static.CharacterMembers.world_space.value
 
     IGNORE_EXISTING_CONSTRAINTS_ON_SKELETON_ATTACHMENT = False
+    # Parsed bind poses: {character node: (bindPose attribute value, PoseSnapshot)}
+    _BIND_POSE_CACHE = {}  # type: dict
 
     @property
     def root_control(self):
@@ -223,18 +225,14 @@ class Character(luna_rig.Component):
 
     def list_controls(self, tag=None):
         ctls = []
-        comp_list = self.get_meta_children()
-        for comp in comp_list:
-            if isinstance(comp, luna_rig.AnimComponent):
-                ctls += comp.list_controls(tag)
+        for comp in self.get_meta_children(of_type=luna_rig.AnimComponent):
+            ctls += comp.list_controls(tag)
         return ctls
 
     def list_bind_joints(self, by_tag=""):
         joint_list = []
-        comp_list = self.get_meta_children(by_tag=by_tag)
-        for comp in comp_list:
-            if isinstance(comp, luna_rig.AnimComponent):
-                joint_list += comp.bind_joints
+        for comp in self.get_meta_children(of_type=luna_rig.AnimComponent, by_tag=by_tag):
+            joint_list += comp.bind_joints
         return joint_list
 
     def set_outliner_color(self, color):
@@ -249,18 +247,79 @@ class Character(luna_rig.Component):
         elif axis == "z":
             return bounding_box[5] - bounding_box[2]
 
+    def list_control_transforms(self):
+        """Get names of root control and controls of all descendant components.
+        Names are read from connections, controls are not wrapped.
+
+        :return: Control transform names.
+        :rtype: list[str]
+        """
+        transforms = [str(node) for node in self.attrs.list_connections("rootCtl")]
+        added = set(transforms)
+        for comp in self.iter_descendants(of_type=luna_rig.AnimComponent):
+            for node in comp.attrs.list_connections("controls"):
+                if str(node) not in added:
+                    added.add(str(node))
+                    transforms.append(str(node))
+        return transforms
+
+    def bind_pose_snapshot(self):
+        """Get bind pose stored by save_bind_pose. Parsed snapshot is cached until attribute value changes,
+        returned instance is shared and should not be modified.
+
+        :return: Bind pose snapshot, None if bind pose was not saved.
+        :rtype: luna_rig.PoseSnapshot
+        """
+        if not self.attrs.has_attr("bindPose"):
+            return None
+        data = self.attrs.get_string("bindPose")
+        if not data:
+            return None
+        node_name = self.attrs.node_name()
+        cached = Character._BIND_POSE_CACHE.get(node_name)
+        if cached and cached[0] == data:
+            return cached[1]
+        snapshot = luna_rig.PoseSnapshot.loads(data, namespace=":".join(self.namespace_list))
+        Character._BIND_POSE_CACHE[node_name] = (data, snapshot)
+        return snapshot
+
     def save_bind_pose(self):
+        """Capture pose of all character controls and store it in bindPose attribute on character node."""
         Logger.info("Writing controls bind poses...")
-        counter = 0
-        ctls = rigFn.list_controls()
-        for each in ctls:
-            each.write_bind_pose()
-            counter += 1
-        Logger.info("Written {0} bind poses.".format(counter))
+        snapshot = luna_rig.PoseSnapshot.capture(self.list_control_transforms())
+        self._store_bind_pose(snapshot)
+        Logger.info("Written {0} bind poses.".format(len(snapshot.nodes)))
+
+    def update_bind_pose(self, transforms):
+        """Capture pose of given controls and replace their entries in stored bind pose.
+        All controls are captured if bind pose wasn't saved yet.
+
+        :param transforms: Control transforms
+        :type transforms: list[str or PyNode]
+        """
+        snapshot = self.bind_pose_snapshot()
+        if snapshot is None:
+            self.save_bind_pose()
+            return
+        self._store_bind_pose(snapshot.merged(luna_rig.PoseSnapshot.capture(transforms)))
+
+    def _store_bind_pose(self, snapshot):
+        if not self.pynode.hasAttr("bindPose"):
+            self.pynode.addAttr("bindPose", dt="string", keyable=False)
+        data = snapshot.dumps()
+        self.pynode.bindPose.unlock()
+        self.pynode.bindPose.set(data)
+        self.pynode.bindPose.lock()
+        Character._BIND_POSE_CACHE[self.attrs.node_name()] = (data, snapshot)
 
     def to_bind_pose(self):
-        for ctl in self.list_controls():
-            ctl.to_bind_pose()
+        snapshot = self.bind_pose_snapshot()
+        if snapshot is None:
+            for ctl in self.list_controls():
+                ctl.to_bind_pose()
+            return
+        root_control = [str(node) for node in self.attrs.list_connections("rootCtl")]
+        snapshot.subset([node for node in snapshot.nodes if node not in root_control]).restore()
 
     def get_nucleus(self):
         node = None
@@ -30,13 +30,13 @@ class Component(luna_rig.MetaNode):
         :rtype: dict
         """
         attr_dict = {}
-        for connected_attr in self.pynode.settings.listConnections(d=1, plugs=1):
-            attr_dict[str(connected_attr)] = connected_attr.get()
+        for connected_attr in self.attrs.list_connections("settings", plugs=True):
+            attr_dict[str(connected_attr)] = self.attrs.get_value(connected_attr)
         return attr_dict
 
     @property
     def util_nodes(self):
-        nodes = self.pynode.utilNodes.listConnections(d=1)  # type: list
+        nodes = [pm.PyNode(node) for node in self.attrs.list_connections("utilNodes")]  # type: list
         return nodes
 
     @ classmethod
@@ -139,7 +139,7 @@ class Component(luna_rig.MetaNode):
                         Logger.warning("Failed to parent {0} children ({1}) to {2}".format(
                             util_node, util_node.getChildren(), util_node.getParent()))
             pm.delete(util_node)
-            Logger.debug("{0}: Deleted util node {1}".format(self, util_node))
+            Logger.debug("%s: Deleted util node %s", self, util_node)
 
     def copy_keyframes(self, time_range, target_component, time_offset=0.0):
         pass
@@ -173,19 +173,14 @@ class AnimComponent(Component):
         instance = super(AnimComponent, cls).create(
             meta_parent, side, name, tag=tag)  # type: AnimComponent
         # Create hierarchy
-        root_grp = pm.group(n=nameFn.generate_name(
-            instance.name, instance.side, suffix="comp"), em=1)
-        ctls_grp = pm.group(n=nameFn.generate_name(
-            instance.name, instance.side, suffix="ctls"), em=1, p=root_grp)
-        joints_grp = pm.group(n=nameFn.generate_name(
-            instance.name, instance.side, suffix="jnts"), em=1, p=root_grp)
-        parts_grp = pm.group(n=nameFn.generate_name(
-            instance.name, instance.side, suffix="parts"), em=1, p=root_grp)
-        noscale_grp = pm.group(n=nameFn.generate_name(
-            instance.name, instance.side, suffix="noscale"), em=1, p=parts_grp)
+        group_names = nameFn.generate_names(instance.name, instance.side, ["comp", "ctls", "jnts", "parts", "noscale", "out"])
+        root_grp = pm.group(n=group_names[0], em=1)
+        ctls_grp = pm.group(n=group_names[1], em=1, p=root_grp)
+        joints_grp = pm.group(n=group_names[2], em=1, p=root_grp)
+        parts_grp = pm.group(n=group_names[3], em=1, p=root_grp)
+        noscale_grp = pm.group(n=group_names[4], em=1, p=parts_grp)
         noscale_grp.inheritsTransform.set(0)
-        out_grp = pm.group(n=nameFn.generate_name(
-            instance.name, instance.side, suffix="out"), em=1, p=root_grp)
+        out_grp = pm.group(n=group_names[5], em=1, p=root_grp)
         out_grp.visibility.set(0)
         for node in [root_grp, ctls_grp, joints_grp, parts_grp, noscale_grp, out_grp]:
             node.addAttr("metaParent", at="message")
@@ -408,7 +403,7 @@ class AnimComponent(Component):
 
         common_constraints = bind_joints_parent_constraints.intersection(
             ctl_joints_parent_constraints)
-        Logger.debug("Deleting constraints: {}".format(common_constraints))
+        Logger.debug("Deleting constraints: %s", common_constraints)
         for constr_node in common_constraints:
             pm.delete(constr_node)
 
@@ -432,9 +427,16 @@ class AnimComponent(Component):
         pass
 
     def to_bind_pose(self):
-        """Override: revert all controls to default values"""
-        for ctl in self.controls:
-            ctl.to_bind_pose()
+        """Override: revert all controls to default values.
+        Uses character bind pose snapshot, rigs without one are reset control by control.
+        """
+        character = self.character
+        snapshot = character.bind_pose_snapshot() if character else None
+        if snapshot is None:
+            for ctl in self.controls:
+                ctl.to_bind_pose()
+            return
+        snapshot.subset(self.attrs.list_connections("controls")).restore()
 
     def remove(self):
         """Delete component from scene"""
@@ -1,6 +1,10 @@
 
 import json
+import math
+from collections import namedtuple
 import pymel.core as pm
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
 from luna import Logger
 from luna import Config
 from luna import RigVars
@@ -14,16 +18,55 @@ import luna_rig.functions.transformFn as transformFn
 import luna_rig.functions.outlinerFn as outlinerFn
 import luna_rig.functions.animFn as animFn
 from luna_rig.core.shape_manager import ShapeManager
+from luna_rig.core.shape_manager import ShapeLibrary
+from luna_rig.core.meta import ApiAttributes
+from luna_rig.core.pose import PoseSnapshot
+
+ControlRecord = namedtuple("ControlRecord", ["tag_node", "group", "offsets", "joint",
+                                             "name", "side", "index", "indexed_name", "tag"])
 
 
 class Control(object):
 
+    LOCKABLE_ATTRS = ('tx', 'ty', 'tz',
+                      'rx', 'ry', 'rz',
+                      'sx', 'sy', 'sz',
+                      'v')
+    # Shape rotation (degrees, xyz order) per orient axis, see orient_shape
+    ORIENT_ROTATIONS = {"x": (-90, -90, 0),
+                        "-x": (90, -90, 0),
+                        "y": None,
+                        "-y": (0, 0, 180),
+                        "z": (90, 0, 0),
+                        "-z": (-90, 0, 0)}
+    OUTLINER_COLOR = 27
+    # Control.create argument defaults, also used to complete Control.create_many specs
+    CREATE_DEFAULTS = {"name": "control_obj",
+                       "side": "c",
+                       "guide": None,
+                       "parent": None,
+                       "attributes": "tr",
+                       "delete_guide": False,
+                       "match_pos": True,
+                       "match_orient": True,
+                       "match_pivot": True,
+                       "color": None,
+                       "offset_grp": True,
+                       "joint": False,
+                       "shape": "cube",
+                       "tag": "",
+                       "component": None,
+                       "orient_axis": "x",
+                       "scale": 1.0}
+
     def __repr__(self):
         return "Control({0})".format(self.transform)
 
     def __init__(self, node):
+        self._record = None  # type: ControlRecord
         # Type casting
         if isinstance(node, Control):
+            self._record = node._record
             node = node.transform
         if not isinstance(node, pm.PyNode):
             node = pm.PyNode(node)
@@ -45,23 +88,23 @@ class Control(object):
 
     @classmethod
     def create(cls,
-               name="control_obj",
-               side="c",
-               guide=None,
-               parent=None,
-               attributes="tr",
-               delete_guide=False,
-               match_pos=True,
-               match_orient=True,
-               match_pivot=True,
-               color=None,
-               offset_grp=True,
-               joint=False,
-               shape="cube",
-               tag="",
-               component=None,
-               orient_axis="x",
-               scale=1.0):
+               name=CREATE_DEFAULTS["name"],
+               side=CREATE_DEFAULTS["side"],
+               guide=CREATE_DEFAULTS["guide"],
+               parent=CREATE_DEFAULTS["parent"],
+               attributes=CREATE_DEFAULTS["attributes"],
+               delete_guide=CREATE_DEFAULTS["delete_guide"],
+               match_pos=CREATE_DEFAULTS["match_pos"],
+               match_orient=CREATE_DEFAULTS["match_orient"],
+               match_pivot=CREATE_DEFAULTS["match_pivot"],
+               color=CREATE_DEFAULTS["color"],
+               offset_grp=CREATE_DEFAULTS["offset_grp"],
+               joint=CREATE_DEFAULTS["joint"],
+               shape=CREATE_DEFAULTS["shape"],
+               tag=CREATE_DEFAULTS["tag"],
+               component=CREATE_DEFAULTS["component"],
+               orient_axis=CREATE_DEFAULTS["orient_axis"],
+               scale=CREATE_DEFAULTS["scale"]):
         """Control creation method
 
         :param name: Control name, defaults to "control_obj"
@@ -112,8 +155,15 @@ class Control(object):
         else:
             temp_parent = parent
 
-        group_node = pm.createNode('transform', n=nameFn.generate_name(
-            name, side, suffix="grp"), p=temp_parent)
+        # Names
+        suffixes = ["grp", "ctl"]
+        if offset_grp:
+            suffixes.append("ofs")
+        if joint:
+            suffixes.append("cjnt")
+        names = dict(zip(suffixes, nameFn.generate_names(name, side, suffixes)))
+
+        group_node = pm.createNode('transform', n=names["grp"], p=temp_parent)
         temp_parent = group_node
         if guide:
             pm.matchTransform(group_node, guide, pos=match_pos, rot=match_orient, piv=match_pivot)
@@ -121,19 +171,16 @@ class Control(object):
                 pm.delete(guide)
         # Offset
         if offset_grp:
-            offset_node = pm.createNode('transform', n=nameFn.generate_name(
-                name, side, suffix="ofs"), p=temp_parent)
+            offset_node = pm.createNode('transform', n=names["ofs"], p=temp_parent)
             temp_parent = offset_node
 
         # Transform
-        transform_node = pm.createNode('transform', n=nameFn.generate_name(
-            name, side, suffix="ctl"), p=temp_parent)
+        transform_node = pm.createNode('transform', n=names["ctl"], p=temp_parent)
         temp_parent = transform_node
 
         # Joint
         if joint:
-            ctl_joint = pm.createNode('joint', n=nameFn.generate_name(
-                name, side, suffix="cjnt"), p=temp_parent)
+            ctl_joint = pm.createNode('joint', n=names["cjnt"], p=temp_parent)
             ctl_joint.visibility.set(0)
 
         # Tag node
@@ -183,7 +230,7 @@ class Control(object):
         instance = Control(transform_node)
         instance.shape = shape
         instance.color = color
-        instance.set_outliner_color(27)
+        instance.set_outliner_color(cls.OUTLINER_COLOR)
         ShapeManager.set_line_width(instance.transform, Config.get(
             RigVars.line_width, default=2.0, cached=True))
         # Attributes
@@ -198,6 +245,293 @@ class Control(object):
 
         return instance
 
+    @classmethod
+    def create_many(cls, specs):
+        """Create multiple controls in one pass. Build only: hierarchy and attributes are set through API modifiers
+        that are not recorded in undo queue, so result can't be undone. Use Control.create in interactive tools.
+        Specs are validated before any node is created, names are reserved up front,
+        hierarchy nodes are created by single MDagModifier and shapes are applied in one batch.
+
+        Example:
+            controls = Control.create_many([{"name": "fk", "side": "l", "guide": joint} for joint in chain])
+
+        :param specs: Control.create keyword arguments per control. "parent" can also be an index
+            of earlier spec in the list.
+        :type specs: list[dict]
+        :raises ValueError: If any of specs is invalid, message lists all problems.
+        :return: Created controls in specs order
+        :rtype: list[Control]
+        """
+        specs = cls._validate_specs(specs)
+        if not specs:
+            return []
+
+        # Names, reserved until nodes are created
+        all_names = []
+        with nameFn.NameAllocator.scope() as allocator:
+            for spec in specs:
+                suffixes = ["grp", "ctl"]
+                if spec["offset_grp"]:
+                    suffixes.append("ofs")
+                if spec["joint"]:
+                    suffixes.append("cjnt")
+                all_names.append(dict(zip(suffixes, allocator.allocate_many(spec["name"], spec["side"], suffixes, reserve=True))))
+            try:
+                all_nodes = cls._create_hierarchy(specs, all_names)
+            finally:
+                allocator.release([name for names in all_names for name in names.values()])
+        all_paths = [dict((suffix, om2.MFnDagNode(node).fullPathName()) for suffix, node in nodes.items()) for nodes in all_nodes]
+
+        # Match guides
+        guides_to_delete = []
+        for spec, paths in zip(specs, all_paths):
+            if spec["guide"]:
+                cmds.matchTransform(paths["grp"], str(spec["guide"]),
+                                    pos=spec["match_pos"], rot=spec["match_orient"], piv=spec["match_pivot"])
+                if spec["delete_guide"]:
+                    guides_to_delete.append(str(spec["guide"]))
+        if guides_to_delete:
+            cmds.delete(guides_to_delete)
+
+        # Tag nodes and meta attributes
+        tag_nodes = []
+        attr_modifier = om2.MDGModifier()
+        for nodes, paths in zip(all_nodes, all_paths):
+            cmds.controller(paths["ctl"])
+            tag_node = cls._get_mobject(cmds.listConnections(paths["ctl"] + ".message", type="controller")[0])
+            tag_nodes.append(tag_node)
+            attr_modifier.addAttribute(tag_node, cls._message_attr("group"))
+            attr_modifier.addAttribute(tag_node, cls._message_attr("offset", array=True))
+            attr_modifier.addAttribute(tag_node, cls._message_attr("joint"))
+            for attr_name in ("side", "name", "tag", "index", "indexedName", "bindPose"):
+                attr_modifier.addAttribute(tag_node, cls._string_attr(attr_name))
+            for node in nodes.values():
+                attr_modifier.addAttribute(node, cls._message_attr("metaParent"))
+        attr_modifier.doIt()
+
+        # Values and connections
+        outliner_rgb = static.ColorIndex.index_to_rgb(cls.OUTLINER_COLOR)
+        children_count = {}
+        value_modifier = om2.MDGModifier()
+        for index, (spec, nodes, tag_node) in enumerate(zip(specs, all_nodes, tag_nodes)):
+            fn_tag = om2.MFnDependencyNode(tag_node)
+            name_parts = nameFn.get_compiled_template().parse(om2.MFnDependencyNode(nodes["ctl"]).name())
+            for attr_name, value in (("side", name_parts.side),
+                                     ("name", name_parts.name),
+                                     ("tag", spec["tag"]),
+                                     ("index", name_parts.index),
+                                     ("indexedName", name_parts.indexed_name),
+                                     ("bindPose", json.dumps({}))):
+                value_modifier.newPlugValueString(fn_tag.findPlug(attr_name, False), value)
+            value_modifier.connect(cls._find_plug(nodes["grp"], "metaParent"), fn_tag.findPlug("group", False))
+            if "ofs" in nodes:
+                value_modifier.connect(cls._find_plug(nodes["ofs"], "metaParent"),
+                                       fn_tag.findPlug("offset", False).elementByLogicalIndex(0))
+            if "cjnt" in nodes:
+                value_modifier.connect(cls._find_plug(nodes["cjnt"], "metaParent"), fn_tag.findPlug("joint", False))
+                value_modifier.newPlugValueBool(cls._find_plug(nodes["cjnt"], "visibility"), False)
+            # Controller hierarchy
+            parent = spec["parent"]
+            parent_tag = None
+            if isinstance(parent, int):
+                parent_tag = tag_nodes[parent]
+            elif isinstance(parent, Control):
+                parent_tag = cls._get_mobject(parent.tag_node.name())
+            if parent_tag is not None:
+                parent_tag_name = om2.MFnDependencyNode(parent_tag).name()
+                if parent_tag_name not in children_count:
+                    children_count[parent_tag_name] = len(cmds.listConnections(parent_tag_name + ".children", s=1, d=0) or [])
+                children_plug = cls._find_plug(parent_tag, "children").elementByLogicalIndex(children_count[parent_tag_name])
+                value_modifier.connect(fn_tag.findPlug("parent", False), children_plug)
+                children_count[parent_tag_name] += 1
+            # Outliner color
+            value_modifier.newPlugValueBool(cls._find_plug(nodes["ctl"], "useOutlinerColor"), True)
+            for channel, value in zip("RGB", outliner_rgb):
+                value_modifier.newPlugValueFloat(cls._find_plug(nodes["ctl"], "outlinerColor" + channel), value)
+        value_modifier.doIt()
+
+        # Shapes
+        shapes_dict = {}
+        for spec, paths in zip(specs, all_paths):
+            color = spec["color"] or static.SideColor[spec["side"]].value
+            shape_list = ShapeManager.load_shape_from_lib(spec["shape"])
+            for shape_dict in shape_list:
+                shape_dict["color"] = color
+            shapes_dict[paths["ctl"]] = cls._transform_shape_points(shape_list, spec["scale"] * 0.8, spec["orient_axis"])
+        ShapeManager.apply_shapes(shapes_dict)
+
+        # Lock attributes
+        for spec, nodes, tag_node in zip(specs, all_nodes, tag_nodes):
+            for attr_name in ("side", "name", "tag", "index", "indexedName", "bindPose"):
+                cls._find_plug(tag_node, attr_name).isLocked = True
+            for attr_name in cls._attrs_to_lock(spec["attributes"]):
+                plug = cls._find_plug(nodes["ctl"], attr_name)
+                plug.isLocked = True
+                plug.isKeyable = False
+                plug.isChannelBox = False
+
+        # Instances
+        instances = [Control(paths["ctl"]) for paths in all_paths]
+        components = []
+        for spec in specs:
+            if spec["component"] and spec["component"] not in components:
+                components.append(spec["component"])
+        for component in components:
+            component._store_controls([instance for instance, spec in zip(instances, specs) if spec["component"] == component])
+        return instances
+
+    @classmethod
+    def _create_hierarchy(cls, specs, all_names):
+        """Create group, offset, control and joint nodes of all specs with one MDagModifier."""
+        dag_modifier = om2.MDagModifier()
+        all_nodes = []
+        for spec, names in zip(specs, all_names):
+            parent = spec["parent"]
+            if isinstance(parent, int):
+                parent_obj = all_nodes[parent]["ctl"]
+            elif parent is not None:
+                parent_obj = cls._get_mobject(parent.transform if isinstance(parent, Control) else parent)
+            else:
+                parent_obj = om2.MObject.kNullObj
+            nodes = {}
+            for suffix, node_type in (("grp", "transform"), ("ofs", "transform"), ("ctl", "transform"), ("cjnt", "joint")):
+                if suffix not in names:
+                    continue
+                nodes[suffix] = dag_modifier.createNode(node_type, parent_obj)
+                dag_modifier.renameNode(nodes[suffix], names[suffix])
+                parent_obj = nodes[suffix]
+            all_nodes.append(nodes)
+        dag_modifier.doIt()
+        return all_nodes
+
+    @classmethod
+    def _validate_specs(cls, specs):
+        defaults = cls.CREATE_DEFAULTS
+        library = ShapeLibrary.get(ShapeManager.SHAPES_LIB)
+        valid_specs = []
+        errors = []
+        for index, spec in enumerate(specs):
+            unknown = [key for key in spec if key not in defaults]
+            if unknown:
+                errors.append("{0}: unknown arguments {1}".format(index, unknown))
+                continue
+            full_spec = dict(defaults)
+            full_spec.update(spec)
+            full_spec["orient_axis"] = full_spec["orient_axis"].lower()
+            if full_spec["orient_axis"] not in cls.ORIENT_ROTATIONS:
+                errors.append("{0}: invalid orient axis {1}".format(index, full_spec["orient_axis"]))
+            if not library.has_shape(full_spec["shape"]):
+                errors.append("{0}: shape {1} is not in library".format(index, full_spec["shape"]))
+            for node_arg in ("guide", "parent"):
+                node = full_spec[node_arg]
+                if isinstance(node, int) and not isinstance(node, bool) and node_arg == "parent":
+                    if not 0 <= node < index:
+                        errors.append("{0}: parent index {1} must point to earlier spec".format(index, node))
+                elif node is not None and not isinstance(node, Control) and not cmds.objExists(str(node)):
+                    errors.append("{0}: {1} doesn't exist: {2}".format(index, node_arg, node))
+            if not full_spec["color"]:
+                try:
+                    static.SideColor[full_spec["side"]]
+                except KeyError:
+                    errors.append("{0}: no color given and no default color for side {1}".format(index, full_spec["side"]))
+            try:
+                cls._attrs_to_lock(full_spec["attributes"])
+            except ValueError:
+                errors.append("{0}: invalid attributes {1}".format(index, full_spec["attributes"]))
+            valid_specs.append(full_spec)
+        if errors:
+            raise ValueError("Invalid control specs:\n" + "\n".join(errors))
+        return valid_specs
+
+    @classmethod
+    def _attrs_to_lock(cls, exclude_attr):
+        to_lock = list(cls.LOCKABLE_ATTRS)
+        for attr in list(exclude_attr):
+            if attr in list("trs"):
+                for axis in "xyz":
+                    to_lock.remove(attr + axis)
+            else:
+                to_lock.remove(attr)
+        return to_lock
+
+    @classmethod
+    def _transform_shape_points(cls, shape_list, factor, orient_axis):
+        """Apply scale and orient_shape rotation to shape data points."""
+        rotation = cls.ORIENT_ROTATIONS[orient_axis]
+        matrix = om2.MEulerRotation(*[math.radians(angle) for angle in rotation]).asMatrix() if rotation else None
+        for shape_dict in shape_list:
+            points = []
+            for point in shape_dict["points"]:
+                point = om2.MPoint(point[0] * factor, point[1] * factor, point[2] * factor)
+                if matrix is not None:
+                    point = point * matrix
+                points.append([point.x, point.y, point.z])
+            shape_dict["points"] = points
+        return shape_list
+
+    @staticmethod
+    def _get_mobject(node):
+        selection = om2.MSelectionList()
+        selection.add(str(node))
+        return selection.getDependNode(0)
+
+    @staticmethod
+    def _find_plug(mobject, attr_name):
+        return om2.MFnDependencyNode(mobject).findPlug(attr_name, False)
+
+    @staticmethod
+    def _message_attr(name, array=False):
+        fn_attr = om2.MFnMessageAttribute()
+        attr = fn_attr.create(name, name)
+        if array:
+            fn_attr.array = True
+            fn_attr.indexMatters = False
+        return attr
+
+    @staticmethod
+    def _string_attr(name):
+        fn_attr = om2.MFnTypedAttribute()
+        attr = fn_attr.create(name, name, om2.MFnData.kString)
+        fn_attr.keyable = False
+        return attr
+
+    @property
+    def record(self):
+        """Cached tag node, hierarchy nodes and metadata of this control.
+        Resolved on first access, reset by control's own rename/insert_offset/set_tag.
+        Call refresh() after changing control nodes by other means.
+
+        :return: Control record
+        :rtype: ControlRecord
+        """
+        if self._record is None:
+            self._record = self._resolve_record()
+        return self._record
+
+    def refresh(self):
+        """Re-read cached control record from scene.
+
+        :return: Control record
+        :rtype: ControlRecord
+        """
+        self._record = None
+        return self.record
+
+    def _resolve_record(self):
+        tag_node = self.transform.listConnections(t="controller")[0]  # type: luna_rig.nt.Controller
+        tag_attrs = ApiAttributes(tag_node)
+        group = tag_attrs.list_connections("group")
+        joint = tag_attrs.list_connections("joint") if tag_attrs.has_attr("joint") else []
+        return ControlRecord(tag_node=tag_node,
+                             group=pm.PyNode(group[0]),
+                             offsets=[pm.PyNode(node) for node in tag_attrs.list_connections("offset")],
+                             joint=pm.PyNode(joint[0]) if joint else None,
+                             name=tag_attrs.get_string("name"),
+                             side=tag_attrs.get_string("side"),
+                             index=tag_attrs.get_string("index"),
+                             indexed_name=tag_attrs.get_string("indexedName"),
+                             tag=tag_attrs.get_string("tag"))
+
     @property
     def namespace_list(self):
         return nameFn.deconstruct_name(self.transform).namespaces
@@ -209,11 +543,11 @@ class Control(object):
         :return: Name
         :rtype: str
         """
-        return self.tag_node.attr("name").get()
+        return self.record.name
 
     @property
     def indexed_name(self):
-        return self.tag_node.attr("indexedName").get()
+        return self.record.indexed_name
 
     @property
     def side(self):
@@ -222,7 +556,7 @@ class Control(object):
         :return: Side
         :rtype: str
         """
-        return self.tag_node.side.get()
+        return self.record.side
 
     @property
     def index(self):
@@ -231,7 +565,7 @@ class Control(object):
         :return: Index
         :rtype: str
         """
-        return self.tag_node.attr("index").get()
+        return self.record.index
 
     @property
     def tag(self):
@@ -240,7 +574,7 @@ class Control(object):
         :return: Tag text
         :rtype: str
         """
-        value = self.tag_node.tag.get()  # type: str
+        value = self.record.tag  # type: str
         return value
 
     @property
@@ -250,7 +584,7 @@ class Control(object):
         :return: Control tag node as instance.
         :rtype: luna_rig.nt.Controller
         """
-        node = self.transform.listConnections(t="controller")[0]  # type: luna_rig.nt.Controller
+        node = self.record.tag_node  # type: luna_rig.nt.Controller
         return node
 
     @property
@@ -260,7 +594,7 @@ class Control(object):
         :return: Group
         :rtype: luna_rig.nt.Transform
         """
-        node = self.tag_node.group.listConnections()[0]  # type: luna_rig.nt.Transform
+        node = self.record.group  # type: luna_rig.nt.Transform
         return node
 
     @property
@@ -270,10 +604,7 @@ class Control(object):
         :return: Joint
         :rtype: luna_rig.nt.Joint
         """
-        result = None  # type: luna_rig.nt.Joint
-        child_joints = self.tag_node.joint.listConnections()
-        if child_joints:
-            result = child_joints[0]  # type: luna_rig.nt.Joint
+        result = self.record.joint  # type: luna_rig.nt.Joint
         return result
 
     @property
@@ -298,7 +629,7 @@ class Control(object):
         :return: List of transform nodes
         :rtype: list, luna_rig.nt.Transform
         """
-        offsets = self.tag_node.offset.listConnections()  # type: list
+        offsets = list(self.record.offsets)  # type: list
         return offsets
 
     @property
@@ -341,11 +672,15 @@ class Control(object):
 
     @property
     def bind_pose(self):
-        """Control bind pose as dictionary
+        """Control bind pose as dictionary. Character bind pose snapshot is used if it contains this control,
+        otherwise pose is read from bindPose attribute on tag node.
 
         :return: Bind pose.
         :rtype: dict
         """
+        snapshot = self.bind_pose_snapshot()
+        if snapshot is not None and self.transform in snapshot:
+            return snapshot.node_pose(self.transform)
         pose_dict = {}
         if pm.hasAttr(self.tag_node, "bindPose"):
             pose_dict = json.loads(self.tag_node.bindPose.get())
@@ -355,12 +690,22 @@ class Control(object):
 
     @property
     def pose(self):
-        pose_dict = {}
-        attributes = pm.listAttr(self.transform, k=1, u=1) + pm.listAttr(self.transform, cb=1, u=1)
-        for attr in attributes:
-            if not pm.listConnections("{0}.{1}".format(self.transform, attr), s=1, d=0):
-                pose_dict[attr] = pm.getAttr("{0}.{1}".format(self.transform, attr))
-        return pose_dict
+        return PoseSnapshot.capture([self.transform]).node_pose(self.transform)
+
+    def bind_pose_snapshot(self):
+        """Get bind pose snapshot of character this control belongs to.
+
+        :return: Character bind pose, None if control has no character or bind pose wasn't saved.
+        :rtype: luna_rig.PoseSnapshot
+        """
+        character = self._bind_pose_character()
+        return character.bind_pose_snapshot() if character else None
+
+    def _bind_pose_character(self):
+        component = self.connected_component
+        if not component:
+            return None
+        return component if isinstance(component, luna_rig.components.Character) else component.character
 
     @property
     def spaces(self):
@@ -469,6 +814,7 @@ class Control(object):
 
     def set_tag(self, value_str):
         self.tag_node.tag.set(value_str)
+        self._record = None
 
     def set_outliner_color(self, color):
         outlinerFn.set_color(self.transform, color)
@@ -517,19 +863,7 @@ class Control(object):
         :param channel_box: If locked attributes should be present in channel box, defaults to False
         :type channel_box: bool, optional
         """
-        to_lock = ['tx', 'ty', 'tz',
-                   'rx', 'ry', 'rz',
-                   'sx', 'sy', 'sz',
-                   'v']
-        exclude_attr = list(exclude_attr)
-
-        for attr in exclude_attr:
-            if attr in list("trs"):
-                for axis in "xyz":
-                    to_lock.remove(attr + axis)
-            else:
-                to_lock.remove(attr)
-
+        to_lock = self._attrs_to_lock(exclude_attr)
         attrFn.lock(self.transform, to_lock, channel_box)
 
     def insert_offset(self, extra_name="extra"):
@@ -540,7 +874,7 @@ class Control(object):
         :return: Created node
         :rtype: pm.PyNode
         """
-        Logger.debug("{0} - Inserting offset with extra name: {1}".format(self, extra_name))
+        Logger.debug("%s - Inserting offset with extra name: %s", self, extra_name)
         if self.offset_list:
             parent = self.offset
         else:
@@ -552,6 +886,7 @@ class Control(object):
         pm.parent(self.transform, new_offset)
         new_offset.addAttr("metaParent", at="message")
         new_offset.metaParent.connect(self.tag_node.offset, na=1)
+        self._record = None
         return new_offset
 
     def find_offset(self, extra_name):
@@ -763,9 +1098,16 @@ class Control(object):
                 extra_parts = [substr for substr in name_parts if substr not in old_name.split("_")]
                 name = "_".join([name] + extra_parts)
             nameFn.rename(node, side, name, index, suffix)
+        self._record = None
 
     def write_bind_pose(self):
-        """Writes current control pose to bindPose attribute on Control.transform"""
+        """Writes current control pose to character bind pose if it was saved,
+        otherwise to bindPose attribute on Control.tag_node.
+        """
+        character = self._bind_pose_character()
+        if character and character.bind_pose_snapshot() is not None:
+            character.update_bind_pose([self.transform])
+            return
         if not pm.hasAttr(self.tag_node, "bindPose"):
             self.tag_node.addAttr("bindPose", dt="string", keyable=False)
             self.tag_node.bindPose.set(json.dumps(self.pose))
@@ -785,11 +1127,7 @@ class Control(object):
         :param attr_dict: Dictionary of pairs attr:value
         :type attr_dict: dict
         """
-        for attr, value in attr_dict.items():
-            if self.transform.hasAttr(attr):
-                pm.setAttr("{0}.{1}".format(self.transform, attr), value)
-            else:
-                Logger.warning("Missing attribute {0}.{1}".format(self.transform, attr))
+        PoseSnapshot.from_dict(self.transform, attr_dict).restore()
 
     def find_opposite(self):
         """Finds opposite control in the scene
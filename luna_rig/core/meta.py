@@ -1,13 +1,114 @@
 """Based on 2015 GDC talk by David Hunt & Forrest Sderlind https://www.youtube.com/watch?v=U_4u0kbf-JE"""
 
+import sys
 import pymel.core as pm
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
 import luna_rig
 from luna import Logger
 from luna_rig.functions import nameFn
+from luna_rig.core.meta_graph import MetaGraph
+
+
+class PymelAttributes(object):
+    """Meta node attribute access through PyMEL attribute wrappers."""
+
+    name = "pymel"
+
+    def __init__(self, node):
+        self.pynode = pm.PyNode(node)
+
+    def node_name(self):
+        return self.pynode.name()
+
+    def has_attr(self, attr_name):
+        return self.pynode.hasAttr(attr_name)
+
+    def get_string(self, attr_name):
+        return self.pynode.attr(attr_name).get()
+
+    def list_connections(self, attr_name, plugs=False):
+        return self.pynode.attr(attr_name).listConnections(plugs=plugs)
+
+    def get_value(self, plug):
+        if not isinstance(plug, pm.Attribute):
+            plug = pm.Attribute(plug)
+        return plug.get()
+
+
+class ApiAttributes(object):
+    """Meta node attribute access through maya.api.OpenMaya.
+    Node is held as MObjectHandle (stays valid after rename), plugs are read without creating PyNodes.
+    Connections are returned as node and plug names.
+    """
+
+    name = "api"
+
+    def __init__(self, node):
+        selection = om2.MSelectionList()
+        try:
+            selection.add(str(node))
+        except RuntimeError:
+            raise pm.MayaNodeError(str(node))
+        self.handle = om2.MObjectHandle(selection.getDependNode(0))
+        self.fn_node = om2.MFnDependencyNode(self.handle.object())
+
+    def node_name(self):
+        return self.fn_node.name()
+
+    def has_attr(self, attr_name):
+        return self.fn_node.hasAttribute(attr_name)
+
+    def get_string(self, attr_name):
+        return self._plug(attr_name).asString()
+
+    def list_connections(self, attr_name, plugs=False):
+        plug = self._plug(attr_name)
+        if plug.isArray:
+            elements = [plug.elementByPhysicalIndex(index) for index in range(plug.numElements())]
+        else:
+            elements = [plug]
+        result = []
+        for element in elements:
+            for other_plug in element.connectedTo(True, True):
+                result.append(self._plug_name(other_plug) if plugs else self._node_name(other_plug.node()))
+        return result
+
+    def get_value(self, plug):
+        value = cmds.getAttr(str(plug))
+        if isinstance(value, list):
+            # Compound and multi attributes, keep PyMEL data types
+            value = pm.Attribute(plug).get()
+        return value
+
+    def _plug(self, attr_name):
+        if not self.handle.isValid():
+            raise RuntimeError("Meta node no longer exists")
+        if not self.fn_node.hasAttribute(attr_name):
+            raise AttributeError("{0}.{1} doesn't exist".format(self.fn_node.name(), attr_name))
+        return self.fn_node.findPlug(attr_name, False)
+
+    @staticmethod
+    def _node_name(mobject):
+        if mobject.hasFn(om2.MFn.kDagNode):
+            return om2.MFnDagNode(mobject).partialPathName()
+        return om2.MFnDependencyNode(mobject).name()
+
+    @classmethod
+    def _plug_name(cls, plug):
+        return "{0}.{1}".format(cls._node_name(plug.node()),
+                                plug.partialName(includeNonMandatoryIndices=True, useLongNames=True))
 
 
 class MetaNode(object):
 
+    _REGISTRY = {}  # type: dict
+    _BACKENDS = {PymelAttributes.name: PymelAttributes,
+                 ApiAttributes.name: ApiAttributes}
+    BACKEND = ApiAttributes.name
+    _attrs = None
+    _pynode = None
+
     @classmethod
     def as_str(cls, name_only=False):
         """Get a string representation of class path.
@@ -23,7 +124,7 @@ class MetaNode(object):
         return meta_type_str
 
     def __repr__(self):
-        return "{0} ({1})".format(self.as_str(name_only=True), self.pynode.name())
+        return "{0} ({1})".format(self.as_str(name_only=True), self.attrs.node_name())
 
     def __eq__(self, other):
         if not hasattr(other, 'pynode'):
@@ -38,18 +139,18 @@ class MetaNode(object):
         :return: Evaluated meta class
         :rtype: Meta rig node class instance
         """
-        import luna_rig  # noqa: F401
         result = None
         if node:
-            node = pm.PyNode(node)
-            class_string = node.metaType.get()
+            attrs = MetaNode._BACKENDS[MetaNode.BACKEND](node)
+            class_string = attrs.get_string("metaType")
             try:
-                eval_class = eval(class_string, globals(), locals())
-                result = eval_class.__new__(eval_class, node)
-            except Exception:
-                Logger.exception(
-                    "{0}: Failed to evaluate class string: {1}".format(cls, class_string))
+                meta_class = MetaNode.get_class(class_string)
+            except TypeError:
+                Logger.error("{0}: Failed to resolve class string: {1}".format(cls, class_string))
                 raise
+            result = meta_class.__new__(meta_class, node)
+            # metaType is already verified, reuse resolved node in __init__
+            result._attrs = attrs
         else:
             result = super(MetaNode, cls)
 
@@ -62,10 +163,44 @@ class MetaNode(object):
         :type node: str or PyNode
         :raises TypeError: If node has no metaType attribute
         """
-        node = pm.PyNode(node)
-        if not self.is_metanode(node):
-            raise TypeError("{0} is not a valid meta rig node".format(str(node)))
-        self.pynode = node  # type: luna_rig.nt.Network
+        if self._attrs is None:
+            node = pm.PyNode(node)
+            if not self.is_metanode(node):
+                raise TypeError("{0} is not a valid meta rig node".format(str(node)))
+        if isinstance(node, pm.PyNode):
+            self._pynode = node
+
+    @property
+    def pynode(self):
+        """Network node, created on first access when node was resolved through API backend.
+
+        :rtype: luna_rig.nt.Network
+        """
+        if self._pynode is None:
+            self._pynode = pm.PyNode(self._attrs.node_name())
+        return self._pynode
+
+    @property
+    def attrs(self):
+        """Attribute access backend for this node, see MetaNode.set_backend.
+
+        :rtype: ApiAttributes or PymelAttributes
+        """
+        if self._attrs is None or self._attrs.name != MetaNode.BACKEND:
+            self._attrs = MetaNode._BACKENDS[MetaNode.BACKEND](self.pynode)
+        return self._attrs
+
+    @staticmethod
+    def set_backend(name):
+        """Set attribute access backend used by meta nodes.
+
+        :param name: "api" (maya.api.OpenMaya, default) or "pymel".
+        :type name: str
+        :raises ValueError: If backend name is unknown.
+        """
+        if name not in MetaNode._BACKENDS:
+            raise ValueError("Unknown meta backend: {0}. Valid backends: {1}".format(name, list(MetaNode._BACKENDS)))
+        MetaNode.BACKEND = name
 
     @property
     def namespace_list(self):
@@ -96,13 +231,13 @@ class MetaNode(object):
 
     @property
     def meta_type(self):
-        attr_val = self.pynode.metaType.get()  # type: str
+        attr_val = self.attrs.get_string("metaType")  # type: str
         return attr_val
 
     @property
     def tag(self):
-        if self.pynode.hasAttr("tag"):
-            return self.pynode.tag.get()
+        if self.attrs.has_attr("tag"):
+            return self.attrs.get_string("tag")
         else:
             Logger.warning("{0}: Missing tag attribute".format(self))
             return ""
@@ -115,7 +250,7 @@ class MetaNode(object):
         :rtype: MetaNode
         """
         result = None
-        connections = self.pynode.metaParent.listConnections()
+        connections = self.attrs.list_connections("metaParent")
         if connections:
             result = MetaNode(connections[0])
         return result
@@ -152,6 +287,54 @@ class MetaNode(object):
     def get_meta_parent(self):
         return self.meta_parent
 
+    # ========= Class registry ==========#
+    @staticmethod
+    def register(meta_class):
+        """Register class for metaType resolution. Can be used as class decorator.
+        Subclasses of MetaNode from imported modules are registered automatically on first lookup.
+
+        :param meta_class: MetaNode subclass.
+        :type meta_class: type
+        :return: Registered class.
+        :rtype: type
+        """
+        MetaNode._REGISTRY[meta_class.as_str()] = meta_class
+        return meta_class
+
+    @staticmethod
+    def get_class(class_string):
+        """Get class for metaType string.
+
+        :param class_string: Class path, e.g luna_rig.components.fk_component.FKComponent
+        :type class_string: str
+        :raises TypeError: If class is not a registered or imported MetaNode subclass.
+        :return: Meta class
+        :rtype: type
+        """
+        meta_class = MetaNode._REGISTRY.get(class_string)
+        if meta_class is None:
+            MetaNode.register_subclasses()
+            meta_class = MetaNode._REGISTRY.get(class_string)
+            if meta_class is None:
+                raise TypeError("Unknown meta type: {0}".format(class_string))
+        return meta_class
+
+    @staticmethod
+    def register_subclasses():
+        """Register MetaNode and all currently imported subclasses."""
+        stack = [MetaNode]
+        while stack:
+            meta_class = stack.pop()
+            stack.extend(meta_class.__subclasses__())
+            # Skip stale classes left from reloaded modules
+            module = sys.modules.get(meta_class.__module__)
+            if getattr(module, meta_class.__name__, None) is meta_class:
+                MetaNode.register(meta_class)
+
+    @staticmethod
+    def clear_registry():
+        MetaNode._REGISTRY.clear()
+
     # ========= Other Methods ==========#
 
     @classmethod
@@ -200,28 +383,62 @@ class MetaNode(object):
         :return: List of meta children instances
         :rtype: list[MetaNode]
         """
+        if not self.attrs.has_attr("metaChildren"):
+            Logger.warning("{0}: Missing metaChildren attribute.".format(self))
+            return []
+        graph = MetaGraph.get()
+        meta_types = set(MetaNode._resolve_meta_types(of_type, graph)) if of_type else None
+        return [MetaNode(child) for child in self._filter_nodes(self._list_child_nodes(self.attrs.node_name()), graph, meta_types, by_tag)]
+
+    def iter_descendants(self, of_type=None, by_tag=""):
+        """Iterate over meta descendants depth first. Children are filtered by index data,
+        only matching nodes are wrapped.
+
+        :param of_type: Only yield descendants of specific type, defaults to None
+        :type of_type: class, str, optional
+        :param by_tag: Only yield descendants with specified tag, defaults to ""
+        :type by_tag: str, optional
+        :yield: Meta descendant instances
+        :rtype: Iterator[MetaNode]
+        """
+        graph = MetaGraph.get()
+        meta_types = set(MetaNode._resolve_meta_types(of_type, graph)) if of_type else None
+        stack = [self._list_child_nodes(self.attrs.node_name())]
+        visited = set()
+        while stack:
+            children = stack.pop()
+            for index, child in enumerate(children):
+                if child in visited:
+                    continue
+                visited.add(child)
+                if self._filter_nodes([child], graph, meta_types, by_tag):
+                    yield MetaNode(child)
+                grand_children = self._list_child_nodes(child)
+                if grand_children:
+                    # Continue with siblings after child's subtree
+                    stack.append(children[index + 1:])
+                    stack.append(grand_children)
+                    break
+
+    @staticmethod
+    def _list_child_nodes(node_name):
+        if not cmds.attributeQuery("metaChildren", node=node_name, exists=1):
+            return []
+        return cmds.listConnections(node_name + ".metaChildren") or []
+
+    @staticmethod
+    def _filter_nodes(nodes, graph, meta_types=None, by_tag=""):
+        """Filter node names by indexed metaType and tag, skipping non meta nodes."""
         result = []
-        if self.pynode.hasAttr("metaChildren"):
-            connections = self.pynode.metaChildren.listConnections()
-            if connections:
-                children = [MetaNode(connection_node) for connection_node in connections if pm.hasAttr(
-                    connection_node, "metaType")]
-                # Type filter
-                if not of_type:
-                    result = children
-                else:
-                    if not isinstance(of_type, type):
-                        of_type = type(of_type)
-
-                    if isinstance(of_type, str):
-                        result = [child for child in children if of_type in child.as_str()]
-                    else:
-                        result = [child for child in children if isinstance(child, of_type)]
-                # Tag filter
-                if by_tag:
-                    result = [child for child in result if child.tag == by_tag]
-        else:
-            Logger.warning("{0}: Missing metaChildren attribute.")
+        for node in nodes:
+            record = graph.record(node)
+            if record is None:
+                continue
+            if meta_types is not None and record.meta_type not in meta_types:
+                continue
+            if by_tag and record.tag != by_tag:
+                continue
+            result.append(node)
         return result
 
     def set_tag(self, tag_str):
@@ -241,23 +458,32 @@ class MetaNode(object):
         :return: List of MetaNode instances.
         :rtype: list[MetaNode]
         """
-        result = []
-        all_nodes = [MetaNode(node) for node in pm.ls(typ="network") if node.hasAttr("metaType")]
-        if of_type:
-            if not isinstance(of_type, type):
-                of_type = type(of_type)
-
-            if isinstance(of_type, str):
-                result = [node for node in all_nodes if of_type in node.as_str()]
-            else:
-                result = [node for node in all_nodes if isinstance(node, of_type)]
-        else:
-            result = all_nodes
+        graph = MetaGraph.get()
+        meta_types = MetaNode._resolve_meta_types(of_type, graph) if of_type else None
+        return [MetaNode(node) for node in graph.nodes(meta_types=meta_types, tag=by_tag or None)]
 
-        # Tag filter
-        if by_tag:
-            result = [node for node in result if node.tag == by_tag]
-        return result
+    @staticmethod
+    def _resolve_meta_types(of_type, graph):
+        """Get metaType strings for type filter.
+
+        :param of_type: Class (includes subclasses), instance or substring of class path.
+        :type of_type: type, MetaNode, str
+        :param graph: Scene graph, used to match substrings.
+        :type graph: MetaGraph
+        :return: Meta type strings.
+        :rtype: list[str]
+        """
+        if isinstance(of_type, str):
+            return [meta_type for meta_type in graph.meta_types() if of_type in meta_type]
+        if not isinstance(of_type, type):
+            of_type = type(of_type)
+        meta_types = []
+        stack = [of_type]
+        while stack:
+            meta_class = stack.pop()
+            meta_types.append(meta_class.as_str())
+            stack.extend(meta_class.__subclasses__())
+        return meta_types
 
     @staticmethod
     def scene_types(of_type=None):
@@ -0,0 +1,340 @@
+"""Scene wide index of meta nodes.
+
+MetaGraph keeps meta nodes indexed by type, tag, side and meta parent. Index is built with one scene scan
+and then kept up to date by scene callbacks, so queries don't list and wrap every network node in the scene.
+Scene wide callbacks are limited to network node creation/deletion and scene changes,
+renames and metaType/tag/metaParent changes are watched per meta node.
+Scene access goes through adapter object, MayaSceneAdapter is used in Maya and tests can use a fake one.
+"""
+from collections import namedtuple
+from collections import OrderedDict
+import maya.cmds as cmds
+import pymel.api as pma
+from luna import Logger
+import luna_rig.functions.nameFn as nameFn
+
+MetaRecord = namedtuple("MetaRecord", ["meta_type", "tag", "side", "parent"])
+
+
+class MetaGraph(object):
+    """Meta nodes index. Nodes are identified by name.
+
+    Adapter interface:
+        list_meta_nodes() -> list[str]: Names of all meta nodes in scene order.
+        read_node(name) -> MetaRecord or None: Node data, None if node is not a meta node.
+        add_callbacks(graph) -> list: Register scene callbacks, returns callback ids.
+        watch_node(graph, name) -> list: Register rename and attribute callbacks of single node, returns callback ids.
+        remove_callbacks(ids): Remove registered callbacks.
+    """
+    _INSTANCE = None  # type: MetaGraph
+
+    @classmethod
+    def get(cls):
+        """Get scene graph, created with Maya adapter and callbacks on first call.
+
+        :return: Scene meta graph.
+        :rtype: MetaGraph
+        """
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls(MayaSceneAdapter())
+            cls._INSTANCE.add_callbacks()
+        return cls._INSTANCE
+
+    @classmethod
+    def active(cls):
+        return cls._INSTANCE
+
+    @classmethod
+    def reset(cls):
+        """Remove callbacks and drop scene graph."""
+        if cls._INSTANCE is not None:
+            cls._INSTANCE.remove_callbacks()
+            cls._INSTANCE = None
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self._records = OrderedDict()  # type: OrderedDict
+        self._by_type = {}  # type: dict
+        self._by_tag = {}  # type: dict
+        self._by_side = {}  # type: dict
+        self._by_parent = {}  # type: dict
+        self._pending = OrderedDict()  # type: OrderedDict
+        self._valid = False
+        self._live = True
+        self._callback_ids = []
+        self._node_callbacks = {}  # type: dict
+
+    def __repr__(self):
+        return "MetaGraph({0} nodes)".format(len(self._records))
+
+    def __contains__(self, node):
+        self._sync()
+        return node in self._records
+
+    def __len__(self):
+        self._sync()
+        return len(self._records)
+
+    # ========= Callbacks ==========#
+    def add_callbacks(self):
+        if not self._callback_ids:
+            self._callback_ids = self.adapter.add_callbacks(self) or []
+            # Without callbacks index can't be trusted between queries
+            self._live = bool(self._callback_ids)
+
+    def remove_callbacks(self):
+        if self._callback_ids:
+            self.adapter.remove_callbacks(self._callback_ids)
+        self._callback_ids = []
+        self._unwatch_all()
+
+    def watched_nodes(self):
+        return list(self._node_callbacks)
+
+    def _watch(self, node):
+        if self._callback_ids and node not in self._node_callbacks:
+            self._node_callbacks[node] = self.adapter.watch_node(self, node) or []
+
+    def _unwatch(self, node):
+        callback_ids = self._node_callbacks.pop(node, None)
+        if callback_ids:
+            self.adapter.remove_callbacks(callback_ids)
+
+    def _unwatch_all(self):
+        for node in list(self._node_callbacks):
+            self._unwatch(node)
+
+    # ========= Scene events ==========#
+    def invalidate(self):
+        """Mark whole index for rebuild (new scene, file open/import)."""
+        self._valid = False
+        self._pending.clear()
+
+    def is_tracked(self, node):
+        return node in self._records or node in self._pending
+
+    def node_added(self, node):
+        # Attributes are added after node creation, node is read on next query.
+        # Watch right away, new nodes are usually renamed before next query.
+        self._pending[node] = None
+        self._watch(node)
+
+    def node_removed(self, node):
+        self._pending.pop(node, None)
+        self._remove(node)
+        self._unwatch(node)
+
+    def node_renamed(self, old_name, new_name):
+        # Node callbacks stay registered, only their key changes
+        callback_ids = self._node_callbacks.pop(old_name, None)
+        if callback_ids is not None:
+            self._node_callbacks[new_name] = callback_ids
+        if not self.is_tracked(old_name):
+            return
+        self._pending.pop(old_name, None)
+        self._remove(old_name)
+        # Children records point to parent by name
+        for child in list(self._by_parent.get(old_name, ())):
+            self._pending[child] = None
+        self._pending[new_name] = None
+
+    def node_changed(self, node):
+        """Re-read node data (tag, metaType, metaParent connection changed)."""
+        self._pending[node] = None
+
+    # ========= Queries ==========#
+    def record(self, node):
+        """Get indexed data for node.
+
+        :param node: Node name
+        :type node: str
+        :return: Node record, None if node is not indexed.
+        :rtype: MetaRecord
+        """
+        self._sync()
+        return self._records.get(node)
+
+    def nodes(self, meta_types=None, tag=None, side=None, parent=None):
+        """Get meta nodes matching all given filters.
+
+        :param meta_types: Exact meta type strings, node matches any of them, defaults to None
+        :type meta_types: list[str], optional
+        :param tag: Tag, defaults to None
+        :type tag: str, optional
+        :param side: Side, defaults to None
+        :type side: str, optional
+        :param parent: Meta parent node name, defaults to None
+        :type parent: str, optional
+        :return: Node names in creation order.
+        :rtype: list[str]
+        """
+        self._sync()
+        candidates = []
+        if meta_types is not None:
+            type_sets = [self._by_type.get(meta_type, {}) for meta_type in meta_types]
+            if len(type_sets) == 1:
+                candidates.append(type_sets[0])
+            else:
+                union = OrderedDict()
+                for type_set in type_sets:
+                    union.update(type_set)
+                candidates.append(union)
+        if tag is not None:
+            candidates.append(self._by_tag.get(tag, {}))
+        if side is not None:
+            candidates.append(self._by_side.get(side, {}))
+        if parent is not None:
+            candidates.append(self._by_parent.get(parent, {}))
+        if not candidates:
+            return list(self._records)
+
+        candidates.sort(key=len)
+        smallest = candidates[0]
+        others = candidates[1:]
+        return [node for node in smallest if all(node in other for other in others)]
+
+    def children(self, parent):
+        self._sync()
+        return list(self._by_parent.get(parent, ()))
+
+    def meta_types(self):
+        """Get all meta types present in scene.
+
+        :return: Meta type strings.
+        :rtype: list[str]
+        """
+        self._sync()
+        return list(self._by_type)
+
+    # ========= Index ==========#
+    def _sync(self):
+        if not self._valid or not self._live:
+            self._rebuild()
+            return
+        while self._pending:
+            node = self._pending.popitem(last=False)[0]
+            self._remove(node)
+            record = self.adapter.read_node(node)
+            if record:
+                self._add(node, record)
+            # Nodes pending from rename/change may not be watched yet
+            self._watch(node)
+
+    def _rebuild(self):
+        self._records.clear()
+        for index in (self._by_type, self._by_tag, self._by_side, self._by_parent):
+            index.clear()
+        self._pending.clear()
+        self._unwatch_all()
+        for node in self.adapter.list_meta_nodes():
+            record = self.adapter.read_node(node)
+            if record:
+                self._add(node, record)
+                self._watch(node)
+        self._valid = True
+
+    def _add(self, node, record):
+        self._records[node] = record
+        self._by_type.setdefault(record.meta_type, OrderedDict())[node] = None
+        self._by_tag.setdefault(record.tag, OrderedDict())[node] = None
+        self._by_side.setdefault(record.side, OrderedDict())[node] = None
+        self._by_parent.setdefault(record.parent, OrderedDict())[node] = None
+
+    def _remove(self, node):
+        record = self._records.pop(node, None)
+        if record is None:
+            return
+        for index, key in ((self._by_type, record.meta_type),
+                           (self._by_tag, record.tag),
+                           (self._by_side, record.side),
+                           (self._by_parent, record.parent)):
+            nodes = index.get(key)
+            if nodes is not None:
+                nodes.pop(node, None)
+                if not nodes:
+                    del index[key]
+
+
+class MayaSceneAdapter(object):
+    """MetaGraph scene access through maya.cmds and API callbacks."""
+
+    WATCHED_ATTRIBUTES = ("metaType", "tag", "metaParent")
+
+    def list_meta_nodes(self):
+        return cmds.ls("*.metaType", r=1, o=1, type="network") or []
+
+    def read_node(self, node):
+        if not cmds.objExists(node + ".metaType"):
+            return None
+        meta_type = cmds.getAttr(node + ".metaType")
+        tag = cmds.getAttr(node + ".tag") if cmds.objExists(node + ".tag") else ""
+        parent = None
+        if cmds.objExists(node + ".metaParent"):
+            connections = cmds.listConnections(node + ".metaParent", s=0, d=1) or []
+            parent = connections[0] if connections else None
+        try:
+            side = nameFn.get_compiled_template().parse(node.split(":")[-1]).side
+        except (ValueError, IndexError):
+            side = None
+        return MetaRecord(meta_type, tag or "", side, parent)
+
+    def add_callbacks(self, graph):
+        def on_added(mobject, *args):
+            graph.node_added(pma.MFnDependencyNode(mobject).name())
+
+        def on_removed(mobject, *args):
+            graph.node_removed(pma.MFnDependencyNode(mobject).name())
+
+        def on_scene_changed(*args):
+            graph.invalidate()
+
+        callback_ids = []
+        try:
+            callback_ids.append(pma.MDGMessage.addNodeAddedCallback(on_added, "network"))
+            callback_ids.append(pma.MDGMessage.addNodeRemovedCallback(on_removed, "network"))
+            for message in (pma.MSceneMessage.kAfterNew, pma.MSceneMessage.kAfterOpen,
+                            pma.MSceneMessage.kAfterImport, pma.MSceneMessage.kAfterCreateReference,
+                            pma.MSceneMessage.kAfterLoadReference, pma.MSceneMessage.kAfterUnloadReference,
+                            pma.MSceneMessage.kAfterRemoveReference):
+                callback_ids.append(pma.MSceneMessage.addCallback(message, on_scene_changed))
+        except RuntimeError:
+            Logger.exception("Failed to add meta graph callbacks")
+            self.remove_callbacks(callback_ids)
+            return []
+        return callback_ids
+
+    def watch_node(self, graph, node):
+        selection = pma.MSelectionList()
+        try:
+            selection.add(node)
+        except RuntimeError:
+            return []
+        mobject = pma.MObject()
+        selection.getDependNode(0, mobject)
+        changed_messages = (pma.MNodeMessage.kAttributeSet | pma.MNodeMessage.kConnectionMade |
+                            pma.MNodeMessage.kConnectionBroken | pma.MNodeMessage.kAttributeAdded |
+                            pma.MNodeMessage.kAttributeRemoved)
+
+        def on_renamed(mobject, old_name, *args):
+            if old_name:
+                graph.node_renamed(old_name, pma.MFnDependencyNode(mobject).name())
+
+        def on_attribute_changed(message, plug, *args):
+            if not message & changed_messages:
+                return
+            if pma.MFnAttribute(plug.attribute()).name() in self.WATCHED_ATTRIBUTES:
+                graph.node_changed(pma.MFnDependencyNode(plug.node()).name())
+
+        callback_ids = []
+        try:
+            callback_ids.append(pma.MNodeMessage.addNameChangedCallback(mobject, on_renamed))
+            callback_ids.append(pma.MNodeMessage.addAttributeChangedCallback(mobject, on_attribute_changed))
+        except RuntimeError:
+            Logger.exception("Failed to add meta graph callbacks for {0}".format(node))
+            self.remove_callbacks(callback_ids)
+            return []
+        return callback_ids
+
+    def remove_callbacks(self, callback_ids):
+        for callback_id in callback_ids:
+            pma.MMessage.removeCallback(callback_id)
@@ -0,0 +1,281 @@
+"""Flat storage of control poses.
+
+PoseSnapshot keeps node names, attribute names and values in parallel lists, so pose of whole character
+can be captured and stored in one attribute. Restore goes through undoable setAttr in one undo chunk.
+"""
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+from luna import Logger
+from luna.utils import fileFn
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+
+class PoseSnapshot(object):
+    """Pose of multiple nodes. Entry i sets nodes[node_indices[i]].attrs[i] to values[i]."""
+
+    VERSION = 1
+
+    def __repr__(self):
+        return "PoseSnapshot({0} nodes, {1} attributes)".format(len(self.nodes), len(self.attrs))
+
+    def __init__(self, nodes=None, node_indices=None, attrs=None, values=None):
+        self.nodes = nodes or []  # type: list[str]
+        self.node_indices = node_indices or []  # type: list[int]
+        self.attrs = attrs or []  # type: list[str]
+        self.values = values or []  # type: list
+        self._node_entries = None  # type: dict
+
+    def __len__(self):
+        return len(self.attrs)
+
+    def __contains__(self, node):
+        return str(node) in self._get_node_entries()
+
+    # ========= Capture ==========#
+    @classmethod
+    def capture(cls, nodes):
+        """Capture unlocked keyable and channel box attributes without incoming connections.
+
+        :param nodes: Nodes to capture
+        :type nodes: list[str or PyNode]
+        :return: New snapshot
+        :rtype: PoseSnapshot
+        """
+        snapshot = cls()
+        for node in nodes:
+            node = str(node)
+            node_pose = cls._capture_node(node)
+            if node_pose is None:
+                continue
+            snapshot._add_node(node, node_pose)
+        return snapshot
+
+    @classmethod
+    def from_dict(cls, node, attr_dict):
+        """Create snapshot for single node from {attr: value} dictionary.
+
+        :param node: Node name
+        :type node: str or PyNode
+        :param attr_dict: Attribute values
+        :type attr_dict: dict
+        :return: New snapshot
+        :rtype: PoseSnapshot
+        """
+        snapshot = cls()
+        snapshot._add_node(str(node), list(attr_dict.items()))
+        return snapshot
+
+    @classmethod
+    def _capture_node(cls, node):
+        if not cmds.objExists(node):
+            Logger.warning("Can't capture pose, node doesn't exist: {0}".format(node))
+            return None
+        attributes = (cmds.listAttr(node, k=1, u=1) or []) + (cmds.listAttr(node, cb=1, u=1) or [])
+        selection = om2.MSelectionList()
+        selection.add(node)
+        fn_node = om2.MFnDependencyNode(selection.getDependNode(0))
+
+        # Skip driven attributes, group compound children to read parent with one getAttr
+        captured = []
+        compounds = {}
+        for attr_name in attributes:
+            if attr_name in captured or not fn_node.hasAttribute(attr_name):
+                continue
+            plug = fn_node.findPlug(attr_name, False)
+            if plug.isDestination:
+                continue
+            captured.append(attr_name)
+            if plug.isChild:
+                compounds.setdefault(plug.parent().partialName(useLongNames=True), []).append(attr_name)
+
+        values = {}
+        for parent_name, child_names in compounds.items():
+            parent_plug = fn_node.findPlug(parent_name, False)
+            all_children = [parent_plug.child(index).partialName(useLongNames=True) for index in range(parent_plug.numChildren())]
+            if len(child_names) < 2 or set(all_children) - set(child_names):
+                continue
+            parent_value = cmds.getAttr("{0}.{1}".format(node, parent_name))[0]
+            values.update(zip(all_children, parent_value))
+        node_pose = []
+        for attr_name in captured:
+            if attr_name not in values:
+                values[attr_name] = cmds.getAttr("{0}.{1}".format(node, attr_name))
+            node_pose.append((attr_name, values[attr_name]))
+        return node_pose
+
+    def _add_node(self, node, node_pose):
+        self._node_entries = None
+        node_index = len(self.nodes)
+        self.nodes.append(node)
+        for attr_name, value in node_pose:
+            self.node_indices.append(node_index)
+            self.attrs.append(attr_name)
+            self.values.append(value)
+
+    # ========= Access ==========#
+    def node_pose(self, node):
+        """Get pose of single node.
+
+        :param node: Node name
+        :type node: str or PyNode
+        :return: Dictionary of {attr: value}, empty if node is not in snapshot.
+        :rtype: dict
+        """
+        return dict(self._get_node_entries().get(str(node), []))
+
+    def _get_node_entries(self):
+        """{node: [(attr, value), ...]}, built on first lookup so node queries don't scan all entries."""
+        if self._node_entries is None:
+            self._node_entries = dict((node, []) for node in self.nodes)
+            for node_index, attr_name, value in zip(self.node_indices, self.attrs, self.values):
+                self._node_entries[self.nodes[node_index]].append((attr_name, value))
+        return self._node_entries
+
+    def _iter_node_poses(self):
+        node_entries = self._get_node_entries()
+        for node in self.nodes:
+            yield node, node_entries[node]
+
+    def subset(self, nodes):
+        """Get snapshot of given nodes only, nodes missing from this snapshot are skipped.
+
+        :param nodes: Nodes to keep
+        :type nodes: list[str or PyNode]
+        :return: New snapshot
+        :rtype: PoseSnapshot
+        """
+        keep = set(str(node) for node in nodes)
+        snapshot = PoseSnapshot()
+        index_map = {}
+        for node_index, node in enumerate(self.nodes):
+            if node in keep:
+                index_map[node_index] = len(snapshot.nodes)
+                snapshot.nodes.append(node)
+        for node_index, attr_name, value in zip(self.node_indices, self.attrs, self.values):
+            if node_index in index_map:
+                snapshot.node_indices.append(index_map[node_index])
+                snapshot.attrs.append(attr_name)
+                snapshot.values.append(value)
+        return snapshot
+
+    def merged(self, other):
+        """Get snapshot with poses of other snapshot replacing or extending poses of this one.
+
+        :param other: Snapshot with new poses
+        :type other: PoseSnapshot
+        :return: New snapshot
+        :rtype: PoseSnapshot
+        """
+        replaced = set(other.nodes)
+        snapshot = self.subset([node for node in self.nodes if node not in replaced])
+        for node, node_pose in other._iter_node_poses():
+            snapshot._add_node(node, node_pose)
+        return snapshot
+
+    # ========= Restore ==========#
+    def restore(self):
+        """Apply pose with undoable setAttr calls in one undo chunk, compound attributes with all children
+        in snapshot are set with one call. Locked and connected attributes are skipped.
+
+        :return: Number of set attributes.
+        :rtype: int
+        """
+        set_count = 0
+        cmds.undoInfo(openChunk=1)
+        try:
+            for node, node_pose in self._iter_node_poses():
+                if not cmds.objExists(node):
+                    Logger.warning("Can't restore pose, node doesn't exist: {0}".format(node))
+                    continue
+                set_count += self._restore_node(node, node_pose)
+        finally:
+            cmds.undoInfo(closeChunk=1)
+        return set_count
+
+    @classmethod
+    def _restore_node(cls, node, node_pose):
+        selection = om2.MSelectionList()
+        selection.add(node)
+        fn_node = om2.MFnDependencyNode(selection.getDependNode(0))
+        settable = {}
+        compounds = {}
+        for attr_name, value in node_pose:
+            if not fn_node.hasAttribute(attr_name):
+                Logger.warning("Missing attribute {0}.{1}".format(node, attr_name))
+                continue
+            plug = fn_node.findPlug(attr_name, False)
+            if plug.isLocked or plug.isDestination:
+                continue
+            settable[attr_name] = value
+            if plug.isChild:
+                compounds.setdefault(plug.parent().partialName(useLongNames=True), []).append(attr_name)
+        set_count = len(settable)
+
+        for parent_name, child_names in compounds.items():
+            parent_plug = fn_node.findPlug(parent_name, False)
+            all_children = [parent_plug.child(index).partialName(useLongNames=True) for index in range(parent_plug.numChildren())]
+            if len(child_names) < 2 or set(all_children) - set(child_names) or parent_plug.isLocked or parent_plug.isDestination:
+                continue
+            cmds.setAttr("{0}.{1}".format(node, parent_name), *[settable.pop(child) for child in all_children])
+        for attr_name, value in settable.items():
+            if isinstance(value, basestring):
+                cmds.setAttr("{0}.{1}".format(node, attr_name), value, type="string")
+            else:
+                cmds.setAttr("{0}.{1}".format(node, attr_name), value)
+        return set_count
+
+    # ========= Serialization ==========#
+    def to_data(self, strip_namespaces=True):
+        """Get compact serializable data. Attribute names are stored once and referenced by index.
+
+        :param strip_namespaces: Store node names without namespaces, defaults to True
+        :type strip_namespaces: bool, optional
+        :return: Snapshot data
+        :rtype: dict
+        """
+        attr_names = []
+        attr_lookup = {}
+        attr_indices = []
+        for attr_name in self.attrs:
+            if attr_name not in attr_lookup:
+                attr_lookup[attr_name] = len(attr_names)
+                attr_names.append(attr_name)
+            attr_indices.append(attr_lookup[attr_name])
+        nodes = [node.split(":")[-1] for node in self.nodes] if strip_namespaces else list(self.nodes)
+        return {"version": self.VERSION,
+                "nodes": nodes,
+                "node_indices": self.node_indices,
+                "attr_names": attr_names,
+                "attr_indices": attr_indices,
+                "values": self.values}
+
+    @classmethod
+    def from_data(cls, data, namespace=""):
+        """Create snapshot from data returned by to_data.
+
+        :param data: Snapshot data
+        :type data: dict
+        :param namespace: Namespace to add to node names, defaults to ""
+        :type namespace: str, optional
+        :return: Snapshot
+        :rtype: PoseSnapshot
+        """
+        nodes = data["nodes"]
+        if namespace:
+            nodes = [":".join([namespace, node]) for node in nodes]
+        attr_names = data["attr_names"]
+        return cls(nodes=list(nodes),
+                   node_indices=list(data["node_indices"]),
+                   attrs=[attr_names[index] for index in data["attr_indices"]],
+                   values=list(data["values"]))
+
+    def dumps(self, strip_namespaces=True):
+        return fileFn.dumps_json(self.to_data(strip_namespaces=strip_namespaces), compact=True)
+
+    @classmethod
+    def loads(cls, string, namespace=""):
+        return cls.from_data(fileFn.loads_json(string), namespace=namespace)
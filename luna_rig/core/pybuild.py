@@ -2,10 +2,13 @@ import pymel.core as pm
 import timeit
 
 from luna import Logger
+from luna import Telemetry
 import luna.workspace
 import luna_rig
 import luna.utils.maya_utils as maya_utils
+import luna_rig.functions.nameFn as nameFn
 import luna_rig.functions.asset_files as asset_files
+from luna_rig.core.shape_manager import ShapeManager
 
 
 class PyBuild(object):
@@ -28,32 +31,42 @@ class PyBuild(object):
         pm.newFile(f=1)
         self.start_time = timeit.default_timer()
         Logger.info("Initiating new build...")
+        Telemetry.build_started(asset_name, source=self.__class__.__name__, asset_type=asset_type)
 
-        self.asset = luna.workspace.Asset(self.project, asset_name, asset_type)
-        # Import model and componets files
-        asset_files.import_model()
-        asset_files.import_skeleton()
-        # Setup character
-        if existing_character:
-            self.character = self.CHARACTER_CLASS(existing_character)
-        else:
-            self.character = self.CHARACTER_CLASS.create(name=asset_name)
-
-        # Override methods
-        self.run()
-        self.character.save_bind_pose()
-        Logger.info("Running post build tasks...")
-        self.post()
-
-        # Adjust viewport
-        pm.select(cl=1)
-        maya_utils.switch_xray_joints()
-        pm.viewFit(self.character.root_control.group)
-        self.character.geometry_grp.overrideEnabled.set(1)
-        self.character.geometry_grp.overrideColor.set(1)
-
-        # Report completion
-        Logger.info("Build finished in {0:.2f}s".format(timeit.default_timer() - self.start_time))
+        success = False
+        try:
+            with nameFn.NameAllocator.scope(), ShapeManager.fast_apply():
+                self.asset = luna.workspace.Asset(self.project, asset_name, asset_type)
+                # Import model and componets files
+                with Telemetry.timed("scene_import", name="model"):
+                    asset_files.import_model()
+                with Telemetry.timed("scene_import", name="skeleton"):
+                    asset_files.import_skeleton()
+                # Setup character
+                if existing_character:
+                    self.character = self.CHARACTER_CLASS(existing_character)
+                else:
+                    self.character = self.CHARACTER_CLASS.create(name=asset_name)
+
+                # Override methods
+                self.run()
+                self.character.save_bind_pose()
+                Logger.info("Running post build tasks...")
+                self.post()
+
+                # Adjust viewport
+                pm.select(cl=1)
+                maya_utils.switch_xray_joints()
+                pm.viewFit(self.character.root_control.group)
+                self.character.geometry_grp.overrideEnabled.set(1)
+                self.character.geometry_grp.overrideColor.set(1)
+
+            # Report completion
+            success = True
+            Logger.info("Build finished in {0:.2f}s".format(timeit.default_timer() - self.start_time))
+        finally:
+            Telemetry.build_finished(success=success)
+            Logger.flush()
         pm.scriptEditorInfo(e=1, sr=0)
 
     def run(self):
@@ -1,5 +1,9 @@
 import os
+from collections import OrderedDict
+from contextlib import contextmanager
 import pymel.core as pm
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
 
 import luna
 import luna_rig
@@ -11,12 +15,151 @@ from luna.static import directories
 from luna_rig.functions import curveFn
 
 
+class ShapeLibrary(object):
+    """Index of shapes directory with LRU cache of parsed shape files.
+
+    Directory is listed once and re-listed only when its mtime changes.
+    Cached shapes are re-read when their file mtime or size changes.
+    Nested lists (points, knots) are stored as tuples and shared between loads.
+    """
+
+    MAX_SIZE = 64
+    EXTENSION = ".json"
+    _INSTANCES = {}  # type: dict
+
+    @classmethod
+    def get(cls, path=directories.SHAPES_LIB_PATH):
+        """Get shared library instance for directory.
+
+        :param path: Shapes directory, defaults to directories.SHAPES_LIB_PATH
+        :type path: str, optional
+        :return: Library instance
+        :rtype: ShapeLibrary
+        """
+        path = os.path.normpath(path)
+        if path not in cls._INSTANCES:
+            cls._INSTANCES[path] = cls(path)
+        return cls._INSTANCES[path]
+
+    @classmethod
+    def clear_instances(cls):
+        cls._INSTANCES.clear()
+
+    def __repr__(self):
+        return "ShapeLibrary({0}, cached: {1})".format(self.path, len(self._cache))
+
+    def __init__(self, path, max_size=None):
+        self.path = path
+        self.max_size = max_size or self.MAX_SIZE
+        self._shapes = {}  # type: dict
+        self._dir_mtime = None
+        self._cache = OrderedDict()  # type: OrderedDict
+
+    def list_shapes(self):
+        """Get names of shapes in library.
+
+        :return: Sorted shape names.
+        :rtype: list[str]
+        """
+        self._update_index()
+        return sorted(self._shapes)
+
+    def has_shape(self, shape_name):
+        self._update_index()
+        return shape_name in self._shapes
+
+    def shape_path(self, shape_name):
+        return os.path.join(self.path, shape_name + self.EXTENSION)
+
+    def load(self, shape_name):
+        """Get shape definition, parsed file is cached until file changes.
+
+        :param shape_name: Shape name
+        :type shape_name: str
+        :raises KeyError: If shape is not in library.
+        :return: New list of shape dictionaries.
+        :rtype: list[dict]
+        """
+        if not self.has_shape(shape_name):
+            raise KeyError("Shape {0} not found in {1}".format(shape_name, self.path))
+        path = self._shapes[shape_name]
+        try:
+            stat = os.stat(path)
+            stamp = (stat.st_mtime, stat.st_size)
+        except OSError:
+            self.invalidate()
+            raise KeyError("Shape file was removed: {0}".format(path))
+
+        entry = self._cache.pop(shape_name, None)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, self._freeze(fileFn.load_json(path)))
+            Logger.debug("Loaded shape from lib: %s", path)
+        self._cache[shape_name] = entry
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return [dict(shape_dict) for shape_dict in entry[1]]
+
+    def invalidate(self, shape_name=None):
+        """Drop cached data. Without shape name directory index is dropped as well.
+
+        :param shape_name: Shape to drop from cache, defaults to None
+        :type shape_name: str, optional
+        """
+        if shape_name is not None:
+            self._cache.pop(shape_name, None)
+            return
+        self._cache.clear()
+        self._dir_mtime = None
+
+    @classmethod
+    def _freeze(cls, data):
+        if isinstance(data, dict):
+            return dict((key, cls._freeze(value)) for key, value in data.items())
+        if isinstance(data, list):
+            return tuple(cls._freeze(item) for item in data)
+        return data
+
+    def _update_index(self):
+        try:
+            dir_mtime = os.stat(self.path).st_mtime
+        except OSError:
+            Logger.error("Shapes library directory doesn't exist: {0}".format(self.path))
+            self._shapes = {}
+            self._dir_mtime = None
+            return
+        if dir_mtime == self._dir_mtime:
+            return
+        self._shapes = {}
+        for file_name in os.listdir(self.path):
+            shape_name, extension = os.path.splitext(file_name)
+            if extension == self.EXTENSION:
+                self._shapes[shape_name] = os.path.join(self.path, file_name)
+        for shape_name in list(self._cache):
+            if shape_name not in self._shapes:
+                del self._cache[shape_name]
+        self._dir_mtime = dir_mtime
+
+
 class ShapeManager:
 
     SHAPES_LIB = directories.SHAPES_LIB_PATH
+    # Create curves with MFnNurbsCurve instead of pm.curve + reparenting.
+    # API path is not recorded in undo queue, so it's only used in builds (see fast_apply) or with undo disabled.
+    FAST_APPLY = False
     COPIED_SHAPE_FILE = "luna_copied_shape.json"
     COPIED_COLOR_FILE = "luna_copied_color.json"
 
+    @classmethod
+    @contextmanager
+    def fast_apply(cls):
+        """Create shapes through API in this block. For builds, changes made in block can't be undone."""
+        previous = cls.FAST_APPLY
+        cls.FAST_APPLY = True
+        try:
+            yield
+        finally:
+            cls.FAST_APPLY = previous
+
     @classmethod
     def get_shapes(cls, node):
         node = pm.PyNode(node)
@@ -60,8 +203,97 @@ class ShapeManager:
 
     @classmethod
     def apply_shape(cls, node, shape_list, default_color=0):
+        """Replace node shapes with curves from shape list.
+
+        :param node: Transform to apply shapes to
+        :type node: str or luna_rig.nt.Transform
+        :param shape_list: Curve data dictionaries (points, knots, degree and optional color)
+        :type shape_list: list[dict]
+        :param default_color: Color for shapes that don't have one, defaults to 0
+        :type default_color: int, optional
+        :return: If shapes were applied.
+        :rtype: bool
+        """
         if not pm.objExists(node):
             return False
+        if cls._can_apply_fast(shape_list):
+            return cls._apply_shape_api(node, shape_list, default_color)
+        return cls._apply_shape_cmds(node, shape_list, default_color)
+
+    @classmethod
+    def apply_shapes(cls, shapes_dict, default_color=0):
+        """Replace shapes of multiple transforms in one pass.
+        On API path (see fast_apply) old shapes are deleted with one command,
+        color and line width of all new shapes are set by one modifier. Otherwise shapes are applied one by one with undoable commands.
+
+        :param shapes_dict: Dictionary of {transform name: shape list}
+        :type shapes_dict: dict
+        :param default_color: Color for shapes that don't have one, defaults to 0
+        :type default_color: int, optional
+        :return: Transforms shapes were applied to.
+        :rtype: list[str]
+        """
+        transforms = []
+        for transform in shapes_dict.keys():
+            if cmds.objExists(transform):
+                transforms.append(transform)
+            else:
+                Logger.warning("Can't apply shape, node doesn't exist: {0}".format(transform))
+        # listRelatives of empty list would return shapes of selection
+        if not transforms:
+            return []
+        if not cls._can_apply_fast([shape_dict for transform in transforms for shape_dict in shapes_dict[transform]]):
+            return [transform for transform in transforms if cls.apply_shape(transform, shapes_dict[transform], default_color)]
+
+        old_shapes = cmds.listRelatives(transforms, s=1, f=1) or []
+        if old_shapes:
+            cmds.delete(old_shapes)
+        dg_modifier = om2.MDGModifier()
+        for transform in transforms:
+            cls._create_curves(transform, shapes_dict[transform], default_color, dg_modifier)
+        dg_modifier.doIt()
+        return transforms
+
+    @classmethod
+    def _can_apply_fast(cls, shape_list):
+        if not cls.FAST_APPLY and cmds.undoInfo(q=1, state=1):
+            return False
+        return all(shape_dict.get("knots") and shape_dict.get("degree") for shape_dict in shape_list)
+
+    @classmethod
+    def _apply_shape_api(cls, node, shape_list, default_color=0):
+        node = pm.PyNode(node)  # type: luna_rig.nt.Transform
+        pm.delete(node.getShapes())
+        dg_modifier = om2.MDGModifier()
+        cls._create_curves(node.longName(), shape_list, default_color, dg_modifier)
+        dg_modifier.doIt()
+        return True
+
+    @classmethod
+    def _create_curves(cls, transform, shape_list, default_color, dg_modifier):
+        """Create curve shapes under transform, attribute changes are queued on given modifier."""
+        line_width = luna.Config.get(luna.RigVars.line_width, default=2.0, cached=True)  # type: float
+        selection = om2.MSelectionList()
+        selection.add(transform)
+        dag_path = selection.getDagPath(0)
+        transform_obj = dag_path.node()
+        base_name = dag_path.partialPathName() + "Shape"
+
+        fn_curve = om2.MFnNurbsCurve()
+        fn_node = om2.MFnDependencyNode()
+        for index, shape_dict in enumerate(shape_list):
+            points = [om2.MPoint(*point) for point in shape_dict.get("points")]
+            shape_obj = fn_curve.create(points, shape_dict.get("knots"), shape_dict.get("degree"),
+                                        om2.MFnNurbsCurve.kOpen, False, False, transform_obj)
+            fn_node.setObject(shape_obj)
+            fn_node.setName(base_name + str(index + 1).zfill(2))
+            color = cls._color_index(shape_dict.get("color", default_color))
+            dg_modifier.newPlugValueBool(fn_node.findPlug("overrideEnabled", False), True)
+            dg_modifier.newPlugValueInt(fn_node.findPlug("overrideColor", False), color)
+            dg_modifier.newPlugValueFloat(fn_node.findPlug("lineWidth", False), line_width)
+
+    @classmethod
+    def _apply_shape_cmds(cls, node, shape_list, default_color=0):
         node = pm.PyNode(node)  # type: luna_rig.nt.Transform
         pm.delete(node.getShapes())
         line_width = luna.Config.get(luna.RigVars.line_width, default=2.0, cached=True)  # type: float
@@ -85,13 +317,22 @@ class ShapeManager:
 
     @classmethod
     def load_shape_from_lib(cls, shape_name):
-        path = os.path.join(cls.SHAPES_LIB, shape_name + ".json")
-        if not os.path.isfile(path):
-            Logger.exception("Shape file doesn't exist {0}".format(path))
-            path = os.path.join(cls.SHAPES_LIB, "cube.json")
-        data = fileFn.load_json(path)  # type: dict
+        library = ShapeLibrary.get(cls.SHAPES_LIB)
+        if not library.has_shape(shape_name):
+            Logger.exception("Shape file doesn't exist {0}".format(library.shape_path(shape_name)))
+            shape_name = "cube"
+        data = library.load(shape_name)  # type: list
         return data
 
+    @classmethod
+    def list_lib_shapes(cls):
+        """Get names of shapes available in shapes library.
+
+        :return: Shape names
+        :rtype: list[str]
+        """
+        return ShapeLibrary.get(cls.SHAPES_LIB).list_shapes()
+
     @classmethod
     def save_shape(cls, transform, name, path=None):
         if not path:
@@ -102,6 +343,8 @@ class ShapeManager:
         for data_dict in shape_list:
             data_dict.pop("color", None)
         fileFn.write_json(save_path, shape_list)
+        if os.path.normpath(path) == os.path.normpath(cls.SHAPES_LIB):
+            ShapeLibrary.get(cls.SHAPES_LIB).invalidate()
 
     @classmethod
     def copy_shape(cls, transform=None):
@@ -159,11 +402,7 @@ class ShapeManager:
         if not isinstance(nodes, list):
             nodes = [nodes]
             nodes = [pm.PyNode(node) for node in nodes]
-        # Handle color
-        if isinstance(color, enumFn.Enum):
-            color = color.value
-        elif isinstance(color, str):
-            color = static.ColorIndex[color].value
+        color = cls._color_index(color)
         # Get shape nodes
         shape_nodes = []
         for node in nodes:
@@ -176,6 +415,14 @@ class ShapeManager:
             shape.overrideEnabled.set(1)
             shape.overrideColor.set(color)
 
+    @staticmethod
+    def _color_index(color):
+        if isinstance(color, enumFn.Enum):
+            color = color.value
+        elif isinstance(color, str):
+            color = static.ColorIndex[color].value
+        return color
+
     @classmethod
     def get_color(cls, node):
         if not isinstance(node, pm.PyNode):
@@ -1,4 +1,5 @@
 import pymel.core as pm
+import maya.api.OpenMaya as om2
 from luna import Logger
 import luna_rig
 from luna_rig.functions import transformFn
@@ -11,19 +12,44 @@ def get_curve_data(curve):
         Logger.exception("Invalid NurbsCurve {}".format(curve))
         return data_dict
 
-    # Ponts
-    points = []
-    for i in range(curve.controlPoints.get(s=1)):
-        point_xyz = list(curve.controlPoints[i].get())
-        points.append(point_xyz)
+    selection = om2.MSelectionList()
+    selection.add(curve.longName())
+    return _read_curve(selection.getDagPath(0))
 
-    data_dict["points"] = points
-    data_dict["knots"] = curve.getKnots()
-    data_dict["form"] = curve.form().index
-    data_dict["degree"] = curve.degree()
-    data_dict["color"] = curve.overrideColor.get()
 
-    return data_dict
+def get_shapes_data(transforms):
+    """Get curve data of all nurbsCurve shapes under transforms. Data is read through API,
+    all CVs of each curve are read at once.
+
+    :param transforms: Transform names
+    :type transforms: list[str]
+    :return: Dictionary of {transform name: list of curve data dicts}, transforms without curves are skipped.
+    :rtype: dict
+    """
+    selection = om2.MSelectionList()
+    for transform in transforms:
+        selection.add(transform)
+    shapes_dict = {}
+    for index in range(selection.length()):
+        dag_path = selection.getDagPath(index)
+        curves = []
+        for child_index in range(dag_path.childCount()):
+            child = dag_path.child(child_index)
+            if not child.hasFn(om2.MFn.kNurbsCurve):
+                continue
+            curves.append(_read_curve(om2.MDagPath.getAPathTo(child)))
+        if curves:
+            shapes_dict[dag_path.partialPathName()] = curves
+    return shapes_dict
+
+
+def _read_curve(dag_path):
+    fn_curve = om2.MFnNurbsCurve(dag_path)
+    return {"points": [[point.x, point.y, point.z] for point in fn_curve.cvPositions()],
+            "knots": list(fn_curve.knots()),
+            "form": fn_curve.form,
+            "degree": fn_curve.degree,
+            "color": fn_curve.findPlug("overrideColor", False).asInt()}
 
 
 def curve_from_points(name, degree=1, points=None, parent=None):
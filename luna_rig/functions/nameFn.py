@@ -1,9 +1,90 @@
 import re
+from collections import namedtuple
+from contextlib import contextmanager
 import pymel.core as pm
+import maya.cmds as cmds
 import luna
 from luna import Logger
 
 
+NameParts = namedtuple("NameParts", ["namespaces", "side", "name", "indexed_name", "index", "suffix"])
+_INDEX_REGEX = re.compile(r"\d+|^$")
+
+
+class NameTemplate(object):
+    """Naming template compiled once per template string.
+
+    Token positions are resolved on creation, so parsing a name is a single split and reverse scan for index.
+    Parse results are cached per name.
+    """
+    _TEMPLATES = {}  # type: dict
+    PARSE_CACHE_SIZE = 20000
+
+    @classmethod
+    def get(cls, template):
+        """Get compiled template.
+
+        :param template: Template string, e.g. "{side}_{name}_{suffix}"
+        :type template: str
+        :return: Compiled template.
+        :rtype: NameTemplate
+        """
+        compiled = cls._TEMPLATES.get(template)
+        if compiled is None:
+            compiled = cls._TEMPLATES[template] = cls(template)
+        return compiled
+
+    def __init__(self, template):
+        self.template = template
+        tokens = template.split("_")
+        self.name_position = tokens.index("{name}")
+        self.side_position = tokens.index("{side}")
+        self.suffix_position = tokens.index("{suffix}")
+        self._parse_cache = {}
+
+    def __repr__(self):
+        return "NameTemplate({0})".format(self.template)
+
+    def format(self, side, name, suffix):
+        return self.template.format(side=side, name=name, suffix=suffix)
+
+    def parse(self, full_name, namespaces=None):
+        """Split name without namespaces into parts.
+
+        :param full_name: Name to parse.
+        :type full_name: str
+        :param namespaces: Namespaces to store in result, defaults to None
+        :type namespaces: list, optional
+        :raises ValueError: If name has no index token.
+        :return: Named tuple of (namespaces, side, name, indexed_name, index, suffix).
+        :rtype: NameParts
+        """
+        parsed = self._parse_cache.get(full_name)
+        if parsed is None:
+            parsed = self._parse(full_name)
+            if len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+                self._parse_cache.clear()
+            self._parse_cache[full_name] = parsed
+        return NameParts(namespaces if namespaces is not None else [], *parsed)
+
+    def _parse(self, full_name):
+        name_parts = full_name.split("_")
+        # Find last index
+        for index_position in range(len(name_parts) - 1, -1, -1):
+            if _INDEX_REGEX.match(name_parts[index_position]):
+                break
+        else:
+            raise ValueError("No index found in name: {0}".format(full_name))
+        index = name_parts[index_position]
+        # Name tokens collapse into one template token
+        name = "_".join(name_parts[self.name_position:index_position])
+        indexed_name = "_".join(name_parts[self.name_position:index_position + 1])
+        template_parts = name_parts[:self.name_position] + ["name"] + name_parts[index_position + 1:]
+        side = template_parts[self.side_position]
+        suffix = template_parts[self.suffix_position]
+        return side, name, indexed_name, index, suffix
+
+
 def get_template():
     default_template = "{side}_{name}_{suffix}"
     all_templates = luna.Config.get(luna.NamingVars.templates_dict, default={"default": default_template}, cached=True)  # type: dict
@@ -11,61 +92,148 @@ def get_template():
     return all_templates.get(current_name)
 
 
+def get_compiled_template():
+    """Get current naming template compiled.
+
+    :return: Compiled template.
+    :rtype: NameTemplate
+    """
+    return NameTemplate.get(get_template())
+
+
 def deconstruct_name(node):
-    template = get_template()
+    """Split node name into parts according to current template.
+
+    :param node: Node to get name parts for.
+    :type node: str or PyNode
+    :return: Name parts
+    :rtype: NameParts
+    """
     node = pm.PyNode(node)
-    full_name = node.stripNamespace()
-    name_parts = full_name.split("_")
-    # Find last index
-    re_index = re.compile(r"\d+|^$")
-    all_indexes = list(filter(re_index.match, name_parts))
-    index_index = len(name_parts) - name_parts[::-1].index(all_indexes[-1]) - 1
-    index = name_parts[index_index]  # type: str
-    # Find name
-    name_start_index = template.split("_").index("{name}")
-    name = "_".join(name_parts[name_start_index:index_index])
-    indexed_name = "_".join(name_parts[name_start_index:index_index + 1])
-    # Find suffix and side
-    temp_name = full_name.replace(indexed_name, "name")
-    side_index = template.split("_").index("{side}")
-    suffix_index = template.split("_").index("{suffix}")
-    side = temp_name.split("_")[side_index]  # type: str
-    suffix = temp_name.split("_")[suffix_index]  # type: str
-
-    class _nameStruct:
-        def __init__(self):
-            self.namespaces = node.namespaceList()  # type: list
-            self.side = side
-            self.name = name
-            self.indexed_name = indexed_name
-            self.index = index
-            self.suffix = suffix
-
-    return _nameStruct()  # type: _nameStruct
+    return get_compiled_template().parse(node.stripNamespace(), node.namespaceList())
+
+
+class NameAllocator(object):
+    """Hands out unique indexed names. Template and naming config are read once per allocator.
+
+    Each name gets lowest index that doesn't exist in scene, existing indices are listed with one
+    wildcard query, so nodes deleted or renamed during build free their index again.
+    Names allocated before their nodes are created can be reserved, reserved names are skipped
+    until released or until scope ends.
+
+    Example:
+        with NameAllocator.scope():
+            build_rig()
+    """
+    _ACTIVE = None  # type: NameAllocator
+
+    @classmethod
+    def current(cls):
+        """Get allocator of active scope.
+
+        :return: Active allocator or None if not in scope.
+        :rtype: NameAllocator
+        """
+        return cls._ACTIVE
+
+    @classmethod
+    @contextmanager
+    def scope(cls):
+        """Share one allocator for all names generated in the block. Nested scopes reuse outer one."""
+        if cls._ACTIVE is not None:
+            yield cls._ACTIVE
+            return
+        cls._ACTIVE = cls()
+        try:
+            yield cls._ACTIVE
+        finally:
+            cls._ACTIVE = None
+
+    def __init__(self):
+        self.template = get_compiled_template()
+        self.start_index = luna.Config.get(luna.NamingVars.start_index, default=0, cached=True)  # type: int
+        self.zfill = luna.Config.get(luna.NamingVars.index_padding, default=2, cached=True)  # type: int
+        self._reserved = set()  # type: set
+
+    def allocate(self, name, side, suffix, override_index=None, reserve=False):
+        """Get unique name.
+
+        :param name: Base name
+        :type name: str
+        :param side: Side
+        :type side: str
+        :param suffix: Suffix
+        :type suffix: str
+        :param override_index: Use this index instead of next free one, defaults to None
+        :type override_index: str, optional
+        :param reserve: Skip this name in next allocations until released, defaults to False
+        :type reserve: bool, optional
+        :return: Full name
+        :rtype: str
+        """
+        if override_index is not None:
+            return self.template.format(side, name + "_" + str(override_index), suffix)
+
+        # One wildcard query per allocation instead of objExists per index
+        existing = set(node.split("|")[-1] for node in cmds.ls(self.template.format(side, name + "_*", suffix)) or [])
+        index = self.start_index
+        while True:
+            full_name = self.template.format(side, name + "_" + str(index).zfill(self.zfill), suffix)
+            if full_name not in self._reserved and full_name not in existing:
+                break
+            index += 1
+        if reserve:
+            self._reserved.add(full_name)
+        return full_name
+
+    def allocate_many(self, name, side, suffixes, reserve=False):
+        """Get unique names for several suffixes.
+
+        :param name: Base name
+        :type name: str
+        :param side: Side
+        :type side: str
+        :param suffixes: Suffixes list
+        :type suffixes: list[str]
+        :param reserve: Reserve allocated names, defaults to False
+        :type reserve: bool, optional
+        :return: Full names in suffixes order
+        :rtype: list[str]
+        """
+        return [self.allocate(name, side, suffix, reserve=reserve) for suffix in suffixes]
+
+    def release(self, names):
+        """Release reserved names, call once nodes are created.
+
+        :param names: Full names
+        :type names: list[str]
+        """
+        self._reserved.difference_update(names)
 
 
 def generate_name(name, side, suffix, override_index=None):
+    if isinstance(name, list):
+        name = "_".join(name)
+    allocator = NameAllocator.current() or NameAllocator()
+    return allocator.allocate(name, side, suffix, override_index=override_index)
+
 
+def generate_names(name, side, suffixes):
+    """Generate unique names for multiple suffixes.
+
+    :param name: Base name. If list - items will be joined by underscore.
+    :type name: str, list[str]
+    :param side: Side
+    :type side: str
+    :param suffixes: Suffixes list
+    :type suffixes: list[str]
+    :return: Names in suffixes order
+    :rtype: list[str]
+    """
     if isinstance(name, list):
         name = "_".join(name)
-    # Prepare for name generation
-    timeout = 300
-    template = get_template()
-    index = luna.Config.get(luna.NamingVars.start_index, default=0, cached=True)  # type: int
-    zfill = luna.Config.get(luna.NamingVars.index_padding, default=2, cached=True)  # type: int
-    # Construct base name
-    index_str = str(index).zfill(zfill) if override_index is None else override_index
-    indexed_name = name + "_" + index_str
-    full_name = template.format(side=side, name=indexed_name, suffix=suffix)
-    while pm.objExists(full_name):
-        index += 1
-        index_str = str(index).zfill(zfill) if override_index is None else override_index
-        indexed_name = name + "_" + index_str
-        full_name = template.format(side=side, name=indexed_name, suffix=suffix)
-        if index == timeout:
-            Logger.warning("Reached max iterations of {0}".format(timeout))
-            break
-    return full_name
+    allocator = NameAllocator.current() or NameAllocator()
+    return allocator.allocate_many(name, side, suffixes)
 
 
 def rename(node, side=None, name=None, index=None, suffix=None):
@@ -87,13 +255,13 @@ def rename(node, side=None, name=None, index=None, suffix=None):
 
     name_parts = deconstruct_name(node)
     if side is not None:
-        name_parts.side = side
+        name_parts = name_parts._replace(side=side)
     if name is not None:
-        name_parts.name = name
+        name_parts = name_parts._replace(name=name)
     if suffix is not None:
-        name_parts.suffix = suffix
+        name_parts = name_parts._replace(suffix=suffix)
     if index is not None:
-        name_parts.index = index
+        name_parts = name_parts._replace(index=index)
 
     new_name = generate_name(name_parts.name, name_parts.side, name_parts.suffix, override_index=name_parts.index)
     pm.rename(node, new_name)
@@ -82,8 +82,16 @@ def selected_control_bind_pose():
     for item in selected:
         if luna_rig.Control.is_control(item):
             controls.append(luna_rig.Control(item))
+    # Group controls by character bind pose, so each snapshot is restored once
+    snapshot_groups = {}
     for ctl in controls:
-        ctl.to_bind_pose()
+        snapshot = ctl.bind_pose_snapshot()
+        if snapshot is None or ctl.transform not in snapshot:
+            ctl.to_bind_pose()
+            continue
+        snapshot_groups.setdefault(id(snapshot), (snapshot, []))[1].append(ctl.transform)
+    for snapshot, transforms in snapshot_groups.values():
+        snapshot.subset(transforms).restore()
 
 
 def asset_bind_pose():
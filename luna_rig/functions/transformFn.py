@@ -210,7 +210,7 @@ def mirror_geometry(transform=None, across='yz', rename=True):
         try:
             name_parts = nameFn.deconstruct_name(mirror_object)
             if name_parts.side in static.OppositeSide:
-                name_parts.side = static.OppositeSide[name_parts.side]
+                name_parts = name_parts._replace(side=static.OppositeSide[name_parts.side])
             new_name = nameFn.generate_name(name_parts.name, name_parts.side, name_parts.suffix)
         except Exception:
             name_parts = None
@@ -242,7 +242,7 @@ def mirror_geometry(transform=None, across='yz', rename=True):
                     Logger.warning("{0} side isn't in {1}. Skipping renaming...".format(
                         child, list(static.OppositeSide)))
                     continue
-                child_parts.side = static.OppositeSide[child_parts.side]
+                child_parts = child_parts._replace(side=static.OppositeSide[child_parts.side])
                 nameFn.rename(child, side=child_parts.side,
                               name=child_parts.name, index=child_parts.index)
                 Logger.info('Renamed child {0} -> {1}'.format(old_child_name, child.name()))
@@ -1,3 +1,4 @@
+import os
 import pymel.core as pm
 from luna import Logger
 from luna import static
@@ -26,6 +27,8 @@ class BlendShapeManager(manager.AbstractManager):
         return fileFn.get_new_versioned_file(self.get_base_name(bs_node), self.path, extension=self.EXTENSION, full_path=True)
 
     def get_mapping(self):
+        if not os.path.isfile(self.asset.mapping.blendshapes):
+            return {}
         return fileFn.load_json(self.asset.mapping.blendshapes)
 
     def save_mapping(self, bs_node):
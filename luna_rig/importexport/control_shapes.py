@@ -1,17 +1,81 @@
 import pymel.core as pm
+import maya.cmds as cmds
 import os
 from luna import Logger
 from luna.utils import fileFn
 import luna_rig
 from luna_rig.importexport import manager
 from luna_rig.core.shape_manager import ShapeManager
-from luna_rig.functions import rigFn
+from luna_rig.functions import curveFn
+
+
+def pack_shapes(shapes_dict):
+    """Convert {transform: shape list} dictionary to columnar layout.
+    Per curve values are stored in flat lists instead of dictionary per curve.
+
+    :param shapes_dict: Shapes dictionary
+    :type shapes_dict: dict
+    :return: Columnar data
+    :rtype: dict
+    """
+    columns = {"controls": [], "shape_counts": [], "degrees": [], "forms": [], "colors": [],
+               "cv_counts": [], "knot_counts": [], "points": [], "knots": []}
+    for transform in sorted(shapes_dict):
+        shape_list = shapes_dict[transform]
+        columns["controls"].append(transform)
+        columns["shape_counts"].append(len(shape_list))
+        for shape_dict in shape_list:
+            columns["degrees"].append(shape_dict.get("degree"))
+            columns["forms"].append(shape_dict.get("form", 1))
+            columns["colors"].append(shape_dict.get("color", 0))
+            columns["cv_counts"].append(len(shape_dict["points"]))
+            columns["knot_counts"].append(len(shape_dict["knots"]))
+            for point in shape_dict["points"]:
+                columns["points"].extend(point)
+            columns["knots"].extend(shape_dict["knots"])
+    return {"format": CtlShapeManager.FORMAT, "version": CtlShapeManager.FORMAT_VERSION, "columns": columns}
+
+
+def unpack_shapes(data):
+    """Convert columnar data back to {transform: shape list} dictionary.
+    Files written before columnar layout are returned unchanged.
+
+    :param data: Data loaded from .crvs file
+    :type data: dict
+    :return: Shapes dictionary
+    :rtype: dict
+    """
+    if data.get("format") != CtlShapeManager.FORMAT:
+        return data
+    columns = data["columns"]
+    shapes_dict = {}
+    shape_index = 0
+    point_index = 0
+    knot_index = 0
+    for transform, shape_count in zip(columns["controls"], columns["shape_counts"]):
+        shape_list = []
+        for curve_index in range(shape_index, shape_index + shape_count):
+            cv_count = columns["cv_counts"][curve_index]
+            knot_count = columns["knot_counts"][curve_index]
+            flat_points = columns["points"][point_index:point_index + cv_count * 3]
+            shape_list.append({"points": [flat_points[index:index + 3] for index in range(0, len(flat_points), 3)],
+                               "knots": columns["knots"][knot_index:knot_index + knot_count],
+                               "degree": columns["degrees"][curve_index],
+                               "form": columns["forms"][curve_index],
+                               "color": columns["colors"][curve_index]})
+            point_index += cv_count * 3
+            knot_index += knot_count
+        shape_index += shape_count
+        shapes_dict[transform] = shape_list
+    return shapes_dict
 
 
 class CtlShapeManager(manager.AbstractManager):
 
     DATA_TYPE = 'controls'
     EXTENSION = 'crvs'
+    FORMAT = 'luna_crvs_columnar'
+    FORMAT_VERSION = 1
 
     @property
     def path(self):
@@ -59,19 +123,35 @@ class CtlShapeManager(manager.AbstractManager):
             ctl.shape = shape_name
         Logger.info("Successfully loaded shape: " + shape_name)
 
+    @classmethod
+    def collect_shapes(cls):
+        """Get shapes of all controls in scene, controls are listed with one controller query.
+
+        :return: Dictionary of {transform name: shape list}
+        :rtype: dict
+        """
+        transforms = [transform for transform in cmds.controller(ac=1, q=1) or []
+                      if cmds.attributeQuery("metaParent", node=transform, exists=1)]
+        return curveFn.get_shapes_data(transforms)
+
+    @classmethod
+    def write_shapes(cls, path, shapes_dict):
+        fileFn.write_json(path, data=pack_shapes(shapes_dict), compact=True)
+
+    @classmethod
+    def read_shapes(cls, path):
+        return unpack_shapes(fileFn.load_json(path))
+
     @classmethod
     def export_asset_shapes(cls):
         manager_instance = cls()
-        data_dict = {}
-        all_controls = rigFn.list_controls()
-        if not all_controls:
+        shapes_dict = cls.collect_shapes()
+        if not shapes_dict:
             Logger.warning("No controls to save")
             return
 
-        for ctl in all_controls:
-            data_dict[ctl.transform.name()] = ctl.shape
         export_path = manager_instance.get_new_file()
-        fileFn.write_json(export_path, data=data_dict)
+        cls.write_shapes(export_path, shapes_dict)
         Logger.info("Exported control shapes: " + export_path)
 
     @classmethod
@@ -80,8 +160,6 @@ class CtlShapeManager(manager.AbstractManager):
         latest_file = manager_instance.get_latest_file()
         if not latest_file:
             return
-        data_dict = fileFn.load_json(latest_file)
-
-        for transform, shape_data in data_dict.items():
-            ShapeManager.apply_shape(transform, shape_list=shape_data)
+        shapes_dict = cls.read_shapes(latest_file)
+        ShapeManager.apply_shapes(shapes_dict)
         Logger.info("Imported control shapes: {0}".format(latest_file))
@@ -36,7 +36,7 @@ class DrivenPoseManager(manager.AbstractManager):
         pose_dict["driver"] = driver_ctl
         pose_dict["driver_value"] = driver_value
         export_path = self.get_new_file(component_node.pynode.name(), pose_name)
-        fileFn.write_json(export_path, data=pose_dict)
+        fileFn.write_json(export_path, data=pose_dict, compact=True)
         Logger.info("{0}: Exported {1} pose: {2}".format(self, component_node, export_path))
 
         return pose_dict
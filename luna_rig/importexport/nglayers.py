@@ -56,7 +56,7 @@ class NgLayersManager(manager_base.AbstractManager):
             if self.file_format == "pickle":
                 fileFn.write_pickle(new_file, json_data)
             elif self.file_format == "json":
-                fileFn.write_json(new_file, json_data, sort_keys=False)
+                fileFn.write_json(new_file, json_data, sort_keys=False, stream=True)
             Logger.info("{0}: Exported layers {1}".format(self, new_file))
         except Exception:
             Logger.exception("{0}: Failed to export layers for {0}".format(node))
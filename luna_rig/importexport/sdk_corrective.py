@@ -33,7 +33,7 @@ class SDKCorrectiveManager(manager.AbstractManager):
                 continue
         pose_dict["driver"] = driver
         pose_dict["driver_value"] = pm.getAttr(driver)
-        fileFn.write_json(export_path, data=pose_dict, sort_keys=False)
+        fileFn.write_json(export_path, data=pose_dict, sort_keys=False, compact=True)
         Logger.info("{0}: Exported {1} pose {2}".format(self, corrective_component, export_path))
 
     def import_pose(self, corrective_component, pose_name):
@@ -204,7 +204,7 @@ class SkinCluster(object):
     def export_data(self, file_path, fmt="json"):
         self.collect_data()
         if fmt == "json":
-            fileFn.write_json(file_path, self.data, sort_keys=False)
+            fileFn.write_json(file_path, self.data, sort_keys=False, stream=True)
         elif fmt == "pickle":
             fileFn.write_pickle(file_path, self.data)
 
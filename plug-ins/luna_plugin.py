@@ -8,6 +8,7 @@ from luna.static import directories
 from luna.interface.hud import LunaHUD
 from luna.interface.menu import LunaMenu
 import luna.utils.devFn as devFn
+import luna.utils.fileFn as fileFn
 import luna.interface.marking_menu as marking_menu
 import luna.core.callbacks as callbacks
 import luna_configer
@@ -59,13 +60,20 @@ def initializePlugin(mobject):
     vendor = "Dmitrii Shevchenko"
     version = luna.__version__
     # Init Config, Logger
-    luna.Config.CACHED_DATA = luna.Config.load()
+    luna.Config.reload()
     luna.Logger.set_level(luna.Config.get(luna.LunaVars.logging_level, default=10, cached=True))
+    json_backend = fileFn.set_json_backend(luna.Config.get(luna.LunaVars.json_backend, default="auto", cached=True))
+    fileFn.set_json_compact(luna.Config.get(luna.LunaVars.json_compact, default=True, cached=True))
 
     # Init logging
     luna.Logger.write_to_rotating_file(directories.LOG_FILE, level=40)
+    if luna.Config.get(luna.LunaVars.logging_queue, default=False, cached=True):
+        luna.Logger.enable_queue()
+    luna.Telemetry.set_enabled(luna.Config.get(luna.LunaVars.logging_telemetry, default=True, cached=True))
+    luna.Telemetry.set_file(directories.TELEMETRY_FILE)
     luna.Logger.info("Logging to file: {0}".format(directories.LOG_FILE))
     luna.Logger.info("Current logging level: {0}".format(luna.Logger.get_level(name=1)))
+    luna.Logger.info("Json backend: {0}".format(json_backend.name))
     load_additional_plugins()
     editor_conf.load_plugins()
     # Command port
@@ -103,8 +111,14 @@ def uninitializePlugin(mobject):
         # Callbacks
         for callback_id in REGISTERED_CALLBACKS:
             pma.MMessage.removeCallback(callback_id)
+        luna_rig.MetaGraph.reset()
         luna.Logger.info("Removed callbacks")
 
+        # Write pending config changes and log records
+        luna.Config.flush()
+        luna.Logger.disable_queue()
+        luna.Telemetry.flush()
+
         # Python modules
         devFn.unload_builder_modules()
         devFn.unload_configer_modules()
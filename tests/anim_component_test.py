@@ -113,6 +113,26 @@ class AnimComponentTests(TestCase):
         pm.renameFile(self.get_temp_filename("anim_component_test_get_meta_children.ma"))
         pm.saveFile(f=1)
 
+    def test_iter_descendants(self):
+        test_character = luna_rig.components.Character.create(name="test_character")
+        component1 = luna_rig.AnimComponent.create(character=test_character)
+        child = luna_rig.AnimComponent.create(meta_parent=component1, character=test_character, tag="child")
+        grand_child = luna_rig.AnimComponent.create(meta_parent=child, character=test_character)
+        sibling = luna_rig.AnimComponent.create(meta_parent=component1, character=test_character, tag="child")
+
+        # Assertions
+        self.assertListEqual([child, grand_child, sibling], list(component1.iter_descendants()))
+        self.assertListEqual([child, sibling], list(component1.iter_descendants(by_tag="child")))
+        self.assertListEqual([child, sibling], component1.get_meta_children(of_type=luna_rig.AnimComponent, by_tag="child"))
+        self.assertListEqual([], list(component1.iter_descendants(of_type=luna_rig.components.Character)))
+
+        # Direct attribute writes are picked up by meta graph
+        sibling.pynode.tag.set("other")
+        self.assertListEqual([child], component1.get_meta_children(by_tag="child"))
+        pm.rename(sibling.pynode, "c_renamed_00_meta")
+        self.assertListEqual([child], component1.get_meta_children(by_tag="child"))
+        self.assertEqual(luna_rig.MetaGraph.get().record("c_renamed_00_meta").tag, "other")
+
     def test_instance_from_meta(self):
         test_character = luna_rig.components.Character.create(name="test_character")
         component1 = luna_rig.AnimComponent.create(character=test_character)
@@ -156,6 +176,46 @@ class AnimComponentTests(TestCase):
         pm.renameFile(self.get_temp_filename("anim_component_test_instance_from_meta.ma"))
         pm.saveFile(f=1)
 
+    def test_meta_class_resolution(self):
+        test_character = luna_rig.components.Character.create(name="test_character")
+        component1 = luna_rig.AnimComponent.create(character=test_character)
+        self.assertIs(luna_rig.MetaNode.get_class(luna_rig.AnimComponent.as_str()), luna_rig.AnimComponent)
+        self.assertIsInstance(luna_rig.MetaNode(component1.pynode), luna_rig.AnimComponent)
+
+        # Unknown type
+        component1.pynode.metaType.set("luna_rig.components.MissingComponent")
+        with self.assertRaises(TypeError):
+            luna_rig.MetaNode(component1.pynode)
+
+    def test_attribute_backends(self):
+        test_character = luna_rig.components.Character.create(name="test_character")
+        component1 = luna_rig.AnimComponent.create(character=test_character, tag="body")
+        component2 = luna_rig.AnimComponent.create(meta_parent=component1, character=test_character)
+        pm.addAttr(component2.root, ln="testSetting", at="float", dv=2.0, k=1)
+        component2._store_settings(component2.root.testSetting)
+        component2._store_util_nodes(pm.createNode("multiplyDivide"))
+
+        results = {}
+        try:
+            for backend in ("pymel", "api"):
+                luna_rig.MetaNode.set_backend(backend)
+                meta_node = luna_rig.MetaNode(component2.pynode.name())
+                results[backend] = (meta_node.meta_type, meta_node.tag, meta_node.meta_parent.tag,
+                                    meta_node.settings, meta_node.util_nodes)
+        finally:
+            luna_rig.MetaNode.set_backend("api")
+
+        # Assertions
+        self.assertEqual(results["pymel"], results["api"])
+        self.assertEqual(results["api"][2], "body")
+        self.assertDictEqual(results["api"][3], {"c_anim_component_01_comp.testSetting": 2.0})
+        with self.assertRaises(ValueError):
+            luna_rig.MetaNode.set_backend("cmds")
+
+        # Handle survives rename
+        component2.pynode.rename("renamed_meta")
+        self.assertEqual(repr(component2), "AnimComponent (renamed_meta)")
+
 
 if __name__ == "__main__":
     unittest.main(exit=False)
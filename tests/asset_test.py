@@ -4,6 +4,7 @@ from luna.workspace.asset import Asset
 from luna.workspace.project import Project
 from luna.static import directories
 from luna.test import TestCase
+from luna.utils import fileFn
 
 
 class AssetTests(TestCase):
@@ -53,6 +54,48 @@ class AssetTests(TestCase):
         self.assertTrue(os.path.isfile(os.path.join(test_asset.skeleton, "{0}_skeleton.0000.ma".format(test_asset.name))))
         self.assertTrue(os.path.isfile(os.path.join(test_asset.rig, "{0}_rig.0000.ma".format(test_asset.name))))
 
+    def test_asset_open(self):
+        creation_path = AssetTests.get_temp_dirname("testProject")
+        test_project = Project.create(creation_path, silent=True)
+        test_asset = Asset.open(test_project, "testAsset", typ="prop")
+
+        # Nothing is written until requested
+        self.assertFalse(os.path.exists(test_asset.path))
+        self.assertIsNone(test_asset.latest_rig_path)
+        self.assertIsNone(Asset.get())
+
+        # Latest path queries have no side effects, new version path is ready for Maya writers
+        self.assertIsNone(test_asset.latest_skeleton_path)
+        self.assertFalse(os.path.isdir(test_asset.skeleton))
+        new_rig_path = test_asset.new_rig_path
+        self.assertTrue(os.path.isdir(test_asset.rig))
+        self.assertTrue(new_rig_path.endswith("testAsset_rig.0000.ma"))
+        fileFn.write_json(os.path.join(test_asset.weights.skin, "body.0000.skin"), {})
+        self.assertTrue(os.path.isdir(test_asset.weights.skin))
+        self.assertFalse(os.path.isdir(test_asset.weights.ffd))
+
+        test_asset.ensure_layout()
+        self.assertTrue(os.path.isdir(test_asset.weights.skin))
+        self.assertTrue(os.path.isfile(test_asset.mapping.blendshapes))
+
+    def test_meta_transaction(self):
+        creation_path = AssetTests.get_temp_dirname("testProject")
+        test_project = Project.create(creation_path, silent=True)
+        test_asset = Asset(test_project, "testAsset", typ="prop")
+        with test_asset.meta_transaction() as meta:
+            meta["model"] = "model.ma"
+            meta["extra"] = 1
+
+        self.assertEqual(test_asset.meta_data.get("model"), "model.ma")
+        self.assertEqual(test_asset.meta_data.get("extra"), 1)
+
+        # Failed transaction doesn't write
+        with self.assertRaises(ValueError):
+            with test_asset.meta_transaction() as meta:
+                meta["extra"] = 2
+                raise ValueError
+        self.assertEqual(test_asset.meta_data.get("extra"), 1)
+
 
 if __name__ == "__main__":
     unittest.main(exit=False)
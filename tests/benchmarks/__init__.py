@@ -0,0 +1,5 @@
+"""Micro benchmarks. Run from Maya's script editor, e.g.:
+
+from tests.benchmarks import config_bench
+config_bench.run()
+"""
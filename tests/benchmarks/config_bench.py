@@ -0,0 +1,27 @@
+import timeit
+from luna import Logger
+from luna import Config
+from luna import NamingVars
+from luna.utils import fileFn
+
+
+def _get_from_disk(key, default=None):
+    """Config.get as it was before in-memory store: parse config file per call."""
+    current_config = fileFn.load_json(Config.get_config_path())  # type: dict
+    if key not in current_config.keys():
+        return default
+    return current_config.get(key)
+
+
+def run(number=10000):
+    Config.reload()
+    before = timeit.timeit(lambda: _get_from_disk(NamingVars.index_padding, 2), number=number)
+    after = timeit.timeit(lambda: Config.get(NamingVars.index_padding, default=2), number=number)
+    after_cached = timeit.timeit(lambda: Config.get(NamingVars.index_padding, default=2, cached=True), number=number)
+    Logger.info("Config.get x{0}: disk read {1:.4f}s, memory {2:.4f}s, memory(cached) {3:.4f}s ({4:.1f}x faster)".format(
+        number, before, after, after_cached, before / max(after, 1e-9)))
+    return before, after, after_cached
+
+
+if __name__ == "__main__":
+    run()
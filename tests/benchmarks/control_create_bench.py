@@ -0,0 +1,37 @@
+import timeit
+import pymel.core as pm
+import luna_rig
+from luna_rig.core.shape_manager import ShapeManager
+from luna import Logger
+
+
+def run(num_controls=500):
+    specs = []
+    for index in range(num_controls):
+        spec = {"name": "bench", "side": "l", "shape": "circle", "joint": index % 2 == 0}
+        if index % 10:
+            spec["parent"] = index - 1
+        specs.append(spec)
+
+    pm.newFile(f=1)
+    controls = []
+
+    def create_each():
+        for spec in specs:
+            spec = dict(spec)
+            if "parent" in spec:
+                spec["parent"] = controls[spec["parent"]]
+            controls.append(luna_rig.Control.create(**spec))
+
+    before = timeit.timeit(create_each, number=1)
+    pm.newFile(f=1)
+    with ShapeManager.fast_apply():
+        after = timeit.timeit(lambda: luna_rig.Control.create_many(specs), number=1)
+    Logger.info("Create {0} controls: Control.create {1:.4f}s, Control.create_many {2:.4f}s ({3:.1f}x faster)".format(
+        num_controls, before, after, before / max(after, 1e-9)))
+    pm.newFile(f=1)
+    return before, after
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import timeit
+import pymel.core as pm
+import maya.cmds as cmds
+from luna import Logger
+from luna.utils import fileFn
+from luna_rig.functions import rigFn
+from luna_rig.core.shape_manager import ShapeManager
+from luna_rig.importexport.control_shapes import CtlShapeManager
+
+
+def _legacy_get_curve_data(curve):
+    """curveFn.get_curve_data as it was before API reads: one controlPoints get per CV."""
+    curve = pm.PyNode(curve)
+    points = [list(curve.controlPoints[index].get()) for index in range(curve.controlPoints.get(s=1))]
+    return {"points": points,
+            "knots": curve.getKnots(),
+            "form": curve.form().index,
+            "degree": curve.degree(),
+            "color": curve.overrideColor.get()}
+
+
+def _legacy_export(path):
+    data_dict = {}
+    for ctl in rigFn.list_controls():
+        data_dict[ctl.transform.name()] = [_legacy_get_curve_data(shape) for shape in ctl.transform.getShapes()]
+    fileFn.write_json(path, data=data_dict)
+
+
+def _legacy_import(path):
+    for transform, shape_data in fileFn.load_json(path).items():
+        ShapeManager._apply_shape_cmds(transform, shape_data)
+
+
+def _bulk_export(path):
+    CtlShapeManager.write_shapes(path, CtlShapeManager.collect_shapes())
+
+
+def _bulk_import(path):
+    # Build path, interactive import uses undoable commands
+    with ShapeManager.fast_apply():
+        ShapeManager.apply_shapes(CtlShapeManager.read_shapes(path))
+
+
+def create_controls(num_controls):
+    shape_list = ShapeManager.load_shape_from_lib("cube")
+    for index in range(num_controls):
+        transform = cmds.createNode("transform", n="bench_{0}_ctl".format(index))
+        cmds.controller(transform)
+        cmds.addAttr(transform, ln="metaParent", at="message")
+        ShapeManager.apply_shape(transform, shape_list)
+
+
+def run(num_controls=800):
+    pm.newFile(f=1)
+    create_controls(num_controls)
+    temp_dir = tempfile.mkdtemp(prefix="luna_crvs_")
+    legacy_path = os.path.join(temp_dir, "legacy.crvs")
+    bulk_path = os.path.join(temp_dir, "bulk.crvs")
+    try:
+        export_before = timeit.timeit(lambda: _legacy_export(legacy_path), number=1)
+        export_after = timeit.timeit(lambda: _bulk_export(bulk_path), number=1)
+        import_before = timeit.timeit(lambda: _legacy_import(legacy_path), number=1)
+        import_after = timeit.timeit(lambda: _bulk_import(bulk_path), number=1)
+        Logger.info("Export {0} control shapes: legacy {1:.4f}s, bulk {2:.4f}s ({3:.1f}x faster), file size {4} -> {5} bytes".format(
+            num_controls, export_before, export_after, export_before / max(export_after, 1e-9),
+            os.path.getsize(legacy_path), os.path.getsize(bulk_path)))
+        Logger.info("Import {0} control shapes: legacy {1:.4f}s, bulk {2:.4f}s ({3:.1f}x faster)".format(
+            num_controls, import_before, import_after, import_before / max(import_after, 1e-9)))
+    finally:
+        shutil.rmtree(temp_dir)
+        pm.newFile(f=1)
+    return (export_before, export_after), (import_before, import_after)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,51 @@
+import os
+import json
+import pickle
+import random
+import shutil
+import tempfile
+import timeit
+from luna import Logger
+from luna.utils import fileFn
+
+
+def create_weights_payload(size_mb=50, influences=100):
+    """Skin-like payload: {"weights": {influence: [float, ...]}}, roughly size_mb when written as json."""
+    rng = random.Random(0)
+    # ~20 characters per encoded float
+    num_values = int(size_mb * 1024 * 1024 / 20 / influences)
+    weights = {}
+    for index in range(influences):
+        weights["joint_{0}".format(index)] = [rng.random() for _ in range(num_values)]
+    return {"weights": weights, "skinningMethod": 0, "normalizeWeights": 1}
+
+
+def _legacy_write_json(path, data):
+    with open(path, "w") as json_file:
+        json.dump(data, json_file, indent=4)
+
+
+def run(size_mb=50):
+    data = create_weights_payload(size_mb)
+    temp_dir = tempfile.mkdtemp(prefix="luna_write_bench_")
+    results = {}
+    try:
+        path = os.path.join(temp_dir, "weights.json")
+        cases = [("json indent (legacy)", lambda: _legacy_write_json(path, data)),
+                 ("json atomic", lambda: fileFn.write_json(path, data)),
+                 ("json atomic stream", lambda: fileFn.write_json(path, data, stream=True)),
+                 ("json atomic stream fsync", lambda: fileFn.write_json(path, data, stream=True, fsync=True)),
+                 ("pickle protocol 2", lambda: fileFn.write_pickle(path, data)),
+                 ("pickle highest", lambda: fileFn.write_pickle(path, data, protocol=pickle.HIGHEST_PROTOCOL))]
+        for label, func in cases:
+            duration = timeit.timeit(func, number=1)
+            file_size = os.path.getsize(path) / 1024.0 / 1024.0
+            results[label] = duration
+            Logger.info("{0}: {1:.2f}s, {2:.1f} MB, {3:.1f} MB/s".format(label, duration, file_size, file_size / max(duration, 1e-9)))
+    finally:
+        shutil.rmtree(temp_dir)
+    return results
+
+
+if __name__ == "__main__":
+    run()
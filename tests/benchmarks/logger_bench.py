@@ -0,0 +1,32 @@
+import timeit
+import logging
+from luna import Logger
+
+
+class _Node(object):
+    """Stand-in for a builder node with non trivial repr."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "<Node {0} ({1})>".format(self.name, id(self))
+
+
+def run(number=100000):
+    node = _Node("FK_component")
+    prev_level = Logger.get_level()
+    Logger.set_level(logging.INFO)
+    try:
+        eager = timeit.timeit(lambda: Logger.debug("Executing {0}...".format(node)), number=number)
+        lazy = timeit.timeit(lambda: Logger.debug("Executing %s...", node), number=number)
+        guarded = timeit.timeit(lambda: Logger.is_enabled_for(logging.DEBUG) and Logger.debug("Executing %s...", node), number=number)
+    finally:
+        Logger.set_level(prev_level)
+    Logger.info("Logger.debug x{0} at INFO: str.format {1:.4f}s, %-args {2:.4f}s, guarded {3:.4f}s ({4:.1f}x faster)".format(
+        number, eager, lazy, guarded, eager / max(lazy, 1e-9)))
+    return eager, lazy, guarded
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,41 @@
+import timeit
+import pymel.core as pm
+import luna_rig
+from luna import Logger
+
+
+def _inspect_components():
+    for component in luna_rig.MetaNode.list_nodes(of_type=luna_rig.AnimComponent):
+        component.meta_type
+        component.tag
+        component.meta_parent
+        component.settings
+        component.util_nodes
+
+
+def _time_backend(backend, number):
+    luna_rig.MetaNode.set_backend(backend)
+    return min(timeit.repeat(_inspect_components, number=1, repeat=number))
+
+
+def run(number=3, num_components=500):
+    pm.newFile(f=1)
+    character = luna_rig.components.Character.create(name="bench_character")
+    for _ in range(num_components):
+        component = luna_rig.AnimComponent.create(character=character, name="bench")
+        component._store_util_nodes(pm.createNode("multiplyDivide"))
+        pm.addAttr(component.root, ln="benchSetting", at="float", k=1)
+        component._store_settings(component.root.benchSetting)
+    try:
+        before = _time_backend("pymel", number)
+        after = _time_backend("api", number)
+    finally:
+        luna_rig.MetaNode.set_backend("api")
+    Logger.info("List and inspect {0} components: pymel {1:.4f}s, api {2:.4f}s ({3:.1f}x faster)".format(
+        num_components, before, after, before / max(after, 1e-9)))
+    pm.newFile(f=1)
+    return before, after
+
+
+if __name__ == "__main__":
+    run()
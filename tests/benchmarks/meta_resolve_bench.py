@@ -0,0 +1,28 @@
+import timeit
+import pymel.core as pm
+import luna_rig
+from luna import Logger
+
+
+def _legacy_wrap(node):
+    """MetaNode(node) as it was before class registry: eval of metaType string per wrap."""
+    node = pm.PyNode(node)
+    eval_class = eval(node.metaType.get(), vars(luna_rig.core.meta))
+    return eval_class.__new__(eval_class, node)
+
+
+def run(number=10000, num_components=50):
+    pm.newFile(f=1)
+    character = luna_rig.components.Character.create(name="bench_character")
+    nodes = [luna_rig.AnimComponent.create(character=character, name="bench").pynode for _ in range(num_components)]
+    samples = [nodes[index % len(nodes)] for index in range(number)]
+    before = timeit.timeit(lambda: [_legacy_wrap(node) for node in samples], number=1)
+    after = timeit.timeit(lambda: [luna_rig.MetaNode(node) for node in samples], number=1)
+    Logger.info("Wrap x{0} meta nodes: eval {1:.4f}s, registry {2:.4f}s ({3:.1f}x faster)".format(
+        number, before, after, before / max(after, 1e-9)))
+    pm.newFile(f=1)
+    return before, after
+
+
+if __name__ == "__main__":
+    run()
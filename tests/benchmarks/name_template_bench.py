@@ -0,0 +1,38 @@
+import random
+import timeit
+from luna import Logger
+import luna_rig.functions.nameFn as nameFn
+from tests.nameFn_test import legacy_parse
+
+
+def generate_names(number, unique=None, seed=1234):
+    """Random names, all unique if unique count is not passed, otherwise unique names are repeated."""
+    rng = random.Random(seed)
+    unique = unique or number
+    names = []
+    for index in range(unique):
+        name = "_".join(rng.choice(["arm", "leg", "spine", "upper", "twist", "fk", "ik"]) for _ in range(rng.randint(1, 3)))
+        names.append("{0}_{1}_{2}_{3}".format(rng.choice("lrc"), name, str(index).zfill(2), rng.choice(["ctl", "jnt", "grp"])))
+    return [names[index % unique] for index in range(number)]
+
+
+def run(number=100000):
+    template = "{side}_{name}_{suffix}"
+    # Cold: every name parsed for the first time
+    unique_names = generate_names(number)
+    before = timeit.timeit(lambda: [legacy_parse(name, template) for name in unique_names], number=1)
+    compiled = nameFn.NameTemplate(template)
+    cold = timeit.timeit(lambda: [compiled.parse(name) for name in unique_names], number=1)
+    # Cached: same names parsed repeatedly during build
+    repeated_names = generate_names(number, unique=1000)
+    compiled = nameFn.NameTemplate(template)
+    cached = timeit.timeit(lambda: [compiled.parse(name) for name in repeated_names], number=1)
+    Logger.info("Parse x{0} unique names: legacy {1:.4f}s, compiled template {2:.4f}s ({3:.1f}x faster)".format(
+        number, before, cold, before / max(cold, 1e-9)))
+    Logger.info("Parse x{0} names (1000 unique): compiled template with cache {1:.4f}s ({2:.1f}x faster than legacy)".format(
+        number, cached, before / max(cached, 1e-9)))
+    return before, cold, cached
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,35 @@
+import timeit
+import pymel.core as pm
+import luna_rig
+from luna import Logger
+
+
+def run(num_controls=300, number=5):
+    pm.newFile(f=1)
+    character = luna_rig.components.Character.create()
+    component = luna_rig.AnimComponent.create(character=character)
+    for index in range(num_controls):
+        ctl = luna_rig.Control.create(name="bench", side="l", shape="circle", attributes="trs", component=component)
+        ctl.transform.translate.set(index, 0, 0)
+    controls = character.list_controls()
+
+    def per_control():
+        for ctl in controls:
+            ctl.write_bind_pose()
+        for ctl in controls:
+            ctl.to_bind_pose()
+
+    def snapshot():
+        character.save_bind_pose()
+        character.to_bind_pose()
+
+    before = timeit.timeit(per_control, number=number) / number
+    after = timeit.timeit(snapshot, number=number) / number
+    Logger.info("Save and restore bind pose of {0} controls: per control {1:.4f}s, PoseSnapshot {2:.4f}s ({3:.1f}x faster)".format(
+        num_controls, before, after, before / max(after, 1e-9)))
+    pm.newFile(f=1)
+    return before, after
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,29 @@
+import os
+import timeit
+from luna import Logger
+from luna.utils import fileFn
+from luna_rig.core.shape_manager import ShapeManager
+from luna_rig.core.shape_manager import ShapeLibrary
+
+
+def _legacy_load(shape_name):
+    """ShapeManager.load_shape_from_lib as it was before ShapeLibrary: file read and parse per call."""
+    path = os.path.join(ShapeManager.SHAPES_LIB, shape_name + ".json")
+    if not os.path.isfile(path):
+        path = os.path.join(ShapeManager.SHAPES_LIB, "cube.json")
+    return fileFn.load_json(path)
+
+
+def run(number=1000):
+    ShapeLibrary.clear_instances()
+    shape_names = ShapeManager.list_lib_shapes()
+    samples = [shape_names[index % len(shape_names)] for index in range(number)]
+    before = timeit.timeit(lambda: [_legacy_load(name) for name in samples], number=1)
+    after = timeit.timeit(lambda: [ShapeManager.load_shape_from_lib(name) for name in samples], number=1)
+    Logger.info("Load x{0} shapes ({1} in lib): disk {2:.4f}s, library {3:.4f}s ({4:.1f}x faster)".format(
+        number, len(shape_names), before, after, before / max(after, 1e-9)))
+    return before, after
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import timeit
+from luna import Logger
+from luna.utils import fileFn
+
+
+def _legacy_get_latest_file(name, dir_path, extension=""):
+    """get_latest_file as it was before VersionIndex: full directory scan per call."""
+    files_dict = {}
+    all_files = [item for item in os.listdir(dir_path) if os.path.isfile(os.path.join(dir_path, item))]
+    if extension:
+        all_files = [item for item in all_files if item.endswith("." + extension)]
+    for each_file in all_files:
+        files_dict.setdefault(each_file.split(".")[0], []).append(each_file)
+    if name not in files_dict:
+        return None
+    return os.path.join(dir_path, sorted(files_dict[name])[-1])
+
+
+def create_weights_dir(num_files=10000, versions=10):
+    dir_path = tempfile.mkdtemp(prefix="luna_version_index_")
+    for file_index in range(num_files):
+        file_name = "geo_{0}.{1}.skin".format(file_index // versions, str(file_index % versions).zfill(4))
+        open(os.path.join(dir_path, file_name), "w").close()
+    return dir_path
+
+
+def run(num_files=10000, queries=200):
+    dir_path = create_weights_dir(num_files)
+    names = ["geo_{0}".format(index) for index in range(queries)]
+    try:
+        fileFn.VersionIndex.clear_cache()
+        before = timeit.timeit(lambda: [_legacy_get_latest_file(name, dir_path, "skin") for name in names], number=1)
+        build = timeit.timeit(lambda: fileFn.VersionIndex.get(dir_path, extension="skin").files, number=1)
+        after = timeit.timeit(lambda: [fileFn.get_latest_file(name, dir_path, extension="skin") for name in names], number=1)
+        Logger.info("get_latest_file x{0} over {1} files: scan per call {2:.4f}s, index build {3:.4f}s, indexed {4:.4f}s".format(
+            queries, num_files, before, build, after))
+    finally:
+        fileFn.VersionIndex.clear_cache()
+        shutil.rmtree(dir_path)
+    return before, build, after
+
+
+if __name__ == "__main__":
+    run()
@@ -4,6 +4,7 @@ import unittest
 from luna import static
 from luna.test import TestCase
 import luna_rig
+from luna_rig.functions import rigFn
 
 
 class CharacterTests(TestCase):
@@ -71,6 +72,60 @@ class CharacterTests(TestCase):
         pm.renameFile(self.get_temp_filename("character_component_test_instance_from_meta.ma"))
         pm.saveFile(f=1)
 
+    def test_bind_pose_snapshot(self):
+        character = luna_rig.components.Character.create()
+        component = luna_rig.AnimComponent.create(character=character)
+        ctl = luna_rig.Control.create(name="pose", side="l", component=component, attributes="trs")
+        ctl.transform.translate.set(1, 2, 3)
+        ctl.transform.rotateY.set(45)
+        character.save_bind_pose()
+
+        snapshot = character.bind_pose_snapshot()
+        self.assertIn(ctl.transform, snapshot)
+        self.assertIn(character.root_control.transform, snapshot)
+        self.assertEqual(ctl.bind_pose, ctl.pose)
+        self.assertEqual(luna_rig.PoseSnapshot.loads(snapshot.dumps()).values, snapshot.values)
+
+        # Character and component restore stored pose, driven attributes are skipped
+        ctl.transform.translate.set(0, 0, 0)
+        ctl.transform.rotateY.set(0)
+        driver = pm.createNode("transform", n="driver")
+        driver.scaleX.set(2)
+        driver.scaleX.connect(ctl.transform.scaleZ)
+        character.to_bind_pose()
+        self.assertEqual(ctl.transform.translate.get(), pm.dt.Vector(1, 2, 3))
+        self.assertAlmostEqual(ctl.transform.rotateY.get(), 45)
+        self.assertEqual(ctl.transform.scaleZ.get(), 2)
+        ctl.transform.translateX.set(5)
+        component.to_bind_pose()
+        self.assertEqual(ctl.transform.translateX.get(), 1)
+
+        # Parsed snapshot is cached per character
+        self.assertIs(character.bind_pose_snapshot(), snapshot)
+        self.assertIs(ctl.bind_pose_snapshot(), snapshot)
+
+        # Control bind pose is written to character snapshot
+        ctl.transform.translateZ.set(7)
+        ctl.write_bind_pose()
+        self.assertFalse(ctl.tag_node.hasAttr("bindPose"))
+        self.assertEqual(ctl.bind_pose["translateZ"], 7)
+        self.assertEqual(len(character.bind_pose_snapshot().nodes), len(snapshot.nodes))
+
+        # Restore is one undo step
+        pm.undoInfo(state=1)
+        ctl.transform.translate.set(4, 5, 6)
+        ctl.transform.rotateY.set(10)
+        character.to_bind_pose()
+        self.assertEqual(ctl.transform.translate.get(), pm.dt.Vector(1, 2, 7))
+        pm.undo()
+        self.assertEqual(ctl.transform.translate.get(), pm.dt.Vector(4, 5, 6))
+        self.assertAlmostEqual(ctl.transform.rotateY.get(), 10)
+
+        # Selected controls are restored through character snapshot
+        pm.select(ctl.transform)
+        rigFn.selected_control_bind_pose()
+        self.assertEqual(ctl.transform.translate.get(), pm.dt.Vector(1, 2, 7))
+
 
 if __name__ == "__main__":
     unittest.main(exit=False)
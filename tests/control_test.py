@@ -119,6 +119,108 @@ class ControlTests(TestCase):
         pm.renameFile(self.get_temp_filename("control_test_rename.ma"))
         pm.saveFile(f=1)
 
+    def test_record_cache(self):
+        instance = luna_rig.Control.create(name="arm_ik",
+                                           side="r",
+                                           offset_grp=True,
+                                           joint=1,
+                                           tag="ik")
+        record = instance.record
+        self.assertEqual(record.tag_node, instance.transform.listConnections(t="controller")[0])
+        self.assertEqual(record.group, instance.tag_node.group.listConnections()[0])
+        self.assertEqual(record.joint, instance.tag_node.joint.listConnections()[0])
+        self.assertEqual((record.side, record.name, record.tag), ("r", "arm_ik", "ik"))
+        self.assertIs(instance.record, record)
+
+        # Offset connected outside of Control methods is picked up by refresh
+        extra_offset = pm.createNode("transform", n="extra_ofs", p=instance.offset)
+        extra_offset.addAttr("metaParent", at="message")
+        extra_offset.metaParent.connect(instance.tag_node.offset, na=1)
+        self.assertEqual(len(instance.offset_list), 1)
+        instance.refresh()
+        self.assertEqual(instance.offset_list[-1], extra_offset)
+
+    def test_pose(self):
+        instance = luna_rig.Control.create(name="pose", side="l", attributes="trs")
+        instance.transform.addAttr("blend", at="enum", en="a:b:c", k=1)
+        instance.transform.translateX.set(2)
+        instance.transform.rotateZ.set(30)
+        instance.transform.blend.set(2)
+        pose = instance.pose
+        self.assertAlmostEqual(pose["rotateZ"], 30)
+        self.assertEqual((pose["translateX"], pose["blend"], pose["scaleY"]), (2, 2, 1))
+
+        instance.transform.translateX.set(0)
+        instance.transform.rotateZ.set(0)
+        instance.transform.blend.set(0)
+        instance.transform.translateY.lock()
+        instance.set_pose(dict(pose, translateY=5))
+        self.assertEqual(instance.pose, pose)
+        self.assertEqual(instance.transform.translateY.get(), 0)
+
+        # String attributes
+        instance.transform.addAttr("label", dt="string")
+        instance.set_pose({"label": "hand"})
+        self.assertEqual(instance.transform.label.get(), "hand")
+
+    def describe_control(self, ctl):
+        """Control state without name indices, used to compare creation paths."""
+        shapes = ShapeManager.get_shapes(ctl.transform)
+        return {"data": (ctl.side, ctl.name, ctl.tag, ctl.bind_pose),
+                "hierarchy": (len(ctl.offset_list), ctl.joint is not None, ctl.joint.visibility.get() if ctl.joint else None),
+                "parent_tag": [str(node) for node in ctl.tag_node.parent.listConnections()],
+                "matrix": [round(value, 5) for value in ctl.transform.getMatrix(worldSpace=True).flat],
+                "shapes": [([[round(value, 5) for value in point] for point in data["points"]], data["knots"], data["degree"], data["color"])
+                           for data in shapes],
+                "line_width": [shape.lineWidth.get() for shape in ctl.transform.getShapes()],
+                "locked": [attr for attr in luna_rig.Control.LOCKABLE_ATTRS if ctl.transform.attr(attr).isLocked()],
+                "keyable": [attr for attr in luna_rig.Control.LOCKABLE_ATTRS if ctl.transform.attr(attr).isKeyable()],
+                "outliner": (ctl.transform.useOutlinerColor.get(), [round(value, 5) for value in ctl.transform.outlinerColor.get()]),
+                "meta_attrs": [pm.hasAttr(node, "metaParent") for node in [ctl.group, ctl.transform] + ctl.offset_list]}
+
+    def test_create_many(self):
+        guide = pm.spaceLocator(n="temp_guide")
+        guide.translate.set(1, 5, 2)
+        guide.rotate.set(0, 45, 0)
+        specs = [{"name": "arm", "side": "l", "guide": guide, "shape": "arrow", "attributes": "r", "tag": "fk"},
+                 {"name": "hand", "side": "l", "parent": 0, "joint": True, "offset_grp": False, "orient_axis": "z", "scale": 2.0},
+                 {"name": "finger", "side": "l", "parent": 1, "color": 13, "shape": "circle", "orient_axis": "-x"}]
+
+        # Same specs through Control.create
+        legacy_controls = []
+        for spec in specs:
+            spec = dict(spec)
+            if "parent" in spec:
+                spec["parent"] = legacy_controls[spec["parent"]]
+            legacy_controls.append(luna_rig.Control.create(**spec))
+        new_controls = luna_rig.Control.create_many(specs)
+
+        # Assertions
+        self.assertEqual(len(new_controls), 3)
+        self.assertEqual(new_controls[0].indexed_name, "arm_01")
+        for legacy_ctl, new_ctl in zip(legacy_controls, new_controls):
+            legacy_state = self.describe_control(legacy_ctl)
+            new_state = self.describe_control(new_ctl)
+            legacy_state["parent_tag"] = [name.replace("_00_", "_01_") for name in legacy_state["parent_tag"]]
+            self.assertDictEqual(legacy_state, new_state)
+        self.assertEqual(new_controls[2].get_parent(), new_controls[1].transform)
+        self.assertEqual(new_controls[1].get_parent(), new_controls[0].transform)
+
+    def test_create_many_validation(self):
+        specs = [{"name": "arm", "shape": "missing_shape"},
+                 {"name": "hand", "parent": 5},
+                 {"name": "finger", "guide": "missing_guide", "orient_axis": "w"},
+                 {"name": "toe", "wrong_arg": 1}]
+        with self.assertRaises(ValueError) as context:
+            luna_rig.Control.create_many(specs)
+        for index in range(len(specs)):
+            self.assertIn("{0}: ".format(index), str(context.exception))
+        self.assertFalse(pm.ls(type="controller"))
+
+        # Defaults cover all create arguments
+        create_code = luna_rig.Control.create.__func__.__code__
+        self.assertEqual(set(create_code.co_varnames[1:create_code.co_argcount]), set(luna_rig.Control.CREATE_DEFAULTS))
+
 
 if __name__ == "__main__":
     unittest.main(exit=False)
@@ -0,0 +1,209 @@
+import json
+import os
+import random
+import string
+import threading
+import unittest
+from luna.test import TestCase
+from luna.utils import fileFn
+
+
+class VersionParsingTests(TestCase):
+    """Property tests for versioned file name parsing and ordering. Inputs are generated with a fixed seed."""
+    ITERATIONS = 200
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+        fileFn.VersionIndex.clear_cache()
+
+    def tearDown(self):
+        fileFn.VersionIndex.clear_cache()
+
+    def random_name(self):
+        chars = string.ascii_letters + string.digits + "_-"
+        return "".join(self.rng.choice(chars) for _ in range(self.rng.randint(1, 12)))
+
+    def random_versions(self):
+        return self.rng.sample(range(0, 100000), self.rng.randint(1, 20))
+
+    def create_files(self, dir_path, name, versions, extension, padding=4):
+        for version in versions:
+            open(os.path.join(dir_path, "{0}.{1}.{2}".format(name, str(version).zfill(padding), extension)), "w").close()
+
+    def test_parse_round_trip(self):
+        for _ in range(self.ITERATIONS):
+            version = self.rng.randint(0, 10 ** 7)
+            padding = self.rng.randint(0, 8)
+            file_name = "{0}.{1}.{2}".format(self.random_name(), str(version).zfill(padding), "skin")
+            self.assertEqual(fileFn.parse_version(file_name), version)
+
+    def test_parse_unversioned(self):
+        for _ in range(self.ITERATIONS):
+            name = self.random_name().replace("-", "").replace("_", "") + "x"
+            self.assertIsNone(fileFn.parse_version("{0}.json".format(name)))
+            self.assertIsNone(fileFn.parse_version("{0}.v{1}.json".format(name, self.rng.randint(0, 100))))
+
+    def test_numeric_ordering(self):
+        dir_path = self.get_temp_dirname("version_ordering")
+        os.makedirs(dir_path)
+        for index in range(20):
+            name = "geo{0}".format(index)
+            versions = self.random_versions()
+            self.create_files(dir_path, name, versions, "skin", padding=self.rng.randint(0, 4))
+            expected_order = sorted(versions)
+            result = fileFn.get_versioned_files(dir_path, extension="skin")[name]
+            self.assertEqual([fileFn.parse_version(file_name) for file_name in result], expected_order)
+            latest = fileFn.get_latest_file(name, dir_path, extension="skin", full_path=False)
+            self.assertEqual(fileFn.parse_version(latest), max(versions))
+            new_file = fileFn.get_new_versioned_file(name, dir_path, extension="skin", full_path=False)
+            self.assertEqual(fileFn.parse_version(new_file), max(versions) + 1)
+
+    def test_version_rollover(self):
+        dir_path = self.get_temp_dirname("version_rollover")
+        os.makedirs(dir_path)
+        self.create_files(dir_path, "body", [9998, 9999], "skin")
+        new_file = fileFn.get_new_versioned_file("body", dir_path, extension="skin", full_path=True)
+        self.assertTrue(new_file.endswith("body.10000.skin"))
+        fileFn.write_json(new_file, {})
+        self.assertEqual(fileFn.get_latest_file("body", dir_path, extension="skin", full_path=False), "body.10000.skin")
+        self.assertEqual(fileFn.VersionIndex.get(dir_path, extension="skin").next_version("body"), 10001)
+
+    def test_incremental_matches_scan(self):
+        dir_path = self.get_temp_dirname("version_incremental")
+        os.makedirs(dir_path)
+        names = [self.random_name() for _ in range(5)]
+        index = fileFn.VersionIndex.get(dir_path, extension="skin")
+        index.files
+        for _ in range(self.ITERATIONS):
+            name = self.rng.choice(names)
+            file_path = os.path.join(dir_path, "{0}.{1}.skin".format(name, str(self.rng.randint(0, 20000)).zfill(4)))
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+                fileFn.VersionIndex.file_removed(file_path)
+            else:
+                fileFn.write_json(file_path, {})
+        incremental = index.files
+        index.refresh()
+        self.assertDictEqual(incremental, index.files)
+        for name in index.names():
+            self.assertEqual(index.latest(name), index.versions(name)[-1])
+
+    def test_external_file_after_write(self):
+        dir_path = self.get_temp_dirname("version_external")
+        os.makedirs(dir_path)
+        self.create_files(dir_path, "body", [0], "skin")
+        fileFn.write_json(fileFn.get_new_versioned_file("body", dir_path, extension="skin"), {})
+        # File written by another process after luna write
+        self.create_files(dir_path, "body", [2], "skin")
+        self.assertEqual(fileFn.get_latest_file("body", dir_path, extension="skin", full_path=False), "body.0002.skin")
+        self.assertTrue(fileFn.get_new_versioned_file("body", dir_path, extension="skin").endswith("body.0003.skin"))
+
+    def test_write_keeps_index(self):
+        dir_path = self.get_temp_dirname("version_no_rescan")
+        os.makedirs(dir_path)
+        self.create_files(dir_path, "body", [0], "skin")
+        index = fileFn.VersionIndex.get(dir_path, extension="skin")
+        index.files
+        refresh_calls = []
+        index.refresh = lambda mtime=None: refresh_calls.append(mtime)
+        try:
+            fileFn.write_json(fileFn.get_new_versioned_file("body", dir_path, extension="skin"), {})
+            self.assertEqual(index.latest("body"), "body.0001.skin")
+            self.assertEqual(refresh_calls, [])
+        finally:
+            del index.refresh
+
+    def test_concurrent_writes(self):
+        dir_path = self.get_temp_dirname("version_threads")
+        os.makedirs(dir_path)
+        index = fileFn.VersionIndex.get(dir_path, extension="json")
+        index.files
+
+        def write_files(name):
+            for version in range(50):
+                fileFn.write_json(os.path.join(dir_path, "{0}.{1}.json".format(name, str(version).zfill(4))), {})
+                index.latest(name)
+
+        workers = [threading.Thread(target=write_files, args=("asset{0}".format(number),)) for number in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        for number in range(4):
+            self.assertEqual(index.latest("asset{0}".format(number)), "asset{0}.0049.json".format(number))
+            self.assertEqual(len(index.versions("asset{0}".format(number))), 50)
+
+
+class JsonWriteTests(TestCase):
+    def test_readable_output(self):
+        dir_path = self.get_temp_dirname("json_readable")
+        os.makedirs(dir_path)
+        path = os.path.join(dir_path, "data.json")
+        data = {"b": [1, 2], "a": {"d": 1.5, "c": "text"}}
+        current_backend = fileFn.JsonSettings.backend
+        try:
+            # Same key order and indentation as stdlib json with every backend
+            for backend in fileFn.JsonSettings.available:
+                fileFn.JsonSettings.backend = backend
+                fileFn.write_json(path, data)
+                with open(path, "r") as json_file:
+                    self.assertEqual(json_file.read(), json.dumps(data, indent=4), backend.name)
+        finally:
+            fileFn.JsonSettings.backend = current_backend
+
+
+class AtomicWriteTests(TestCase):
+    @unittest.skipIf(os.name == "nt", "Posix permissions")
+    def test_permissions(self):
+        dir_path = self.get_temp_dirname("atomic_write")
+        os.makedirs(dir_path)
+        new_path = os.path.join(dir_path, "new.json")
+        fileFn.write_json(new_path, {})
+        # New file gets same mode as file created with open
+        reference_path = os.path.join(dir_path, "reference.json")
+        with open(reference_path, "w"):
+            pass
+        self.assertEqual(os.stat(new_path).st_mode & 0o777, os.stat(reference_path).st_mode & 0o777)
+
+        # Existing file keeps its mode
+        os.chmod(new_path, 0o664)
+        fileFn.write_json(new_path, {"a": 1})
+        self.assertEqual(os.stat(new_path).st_mode & 0o777, 0o664)
+
+    def test_pickle_protocol(self):
+        dir_path = self.get_temp_dirname("atomic_pickle")
+        os.makedirs(dir_path)
+        path = os.path.join(dir_path, "weights.pickle")
+        fileFn.write_pickle(path, {"weights": [0.5]})
+        with open(path, "rb") as pickle_file:
+            header = pickle_file.read(2)
+        # Protocol 2 header, readable by Python 2 Maya
+        self.assertEqual(header, b"\x80\x02")
+        self.assertEqual(fileFn.load_pickle(path), {"weights": [0.5]})
+
+
+class FileLockTests(TestCase):
+    def test_lock_file_removed(self):
+        dir_path = self.get_temp_dirname("file_lock")
+        os.makedirs(dir_path)
+        meta_path = os.path.join(dir_path, "asset.meta")
+        counter = []
+
+        def increment():
+            for _ in range(20):
+                with fileFn.FileLock(meta_path):
+                    with fileFn.FileLock(meta_path):
+                        value = len(counter)
+                        counter.append(value)
+
+        workers = [threading.Thread(target=increment) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(counter, list(range(80)))
+        self.assertEqual(os.listdir(dir_path), [])
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,148 @@
+import unittest
+import pymel.core as pm
+import luna_rig
+from luna.test import TestCase
+from luna_rig.core.meta_graph import MetaGraph
+from luna_rig.core.meta_graph import MetaRecord
+
+
+class FakeSceneAdapter(object):
+    """In-memory scene: node name -> MetaRecord. Counts reads to verify incremental updates."""
+
+    def __init__(self):
+        self.scene = {}
+        self.order = []
+        self.reads = 0
+        self.watched = {}
+
+    def create(self, name, meta_type, tag="", side="c", parent=None):
+        self.scene[name] = MetaRecord(meta_type, tag, side, parent)
+        self.order.append(name)
+
+    def delete(self, name):
+        self.scene.pop(name)
+        self.order.remove(name)
+
+    def list_meta_nodes(self):
+        return list(self.order)
+
+    def read_node(self, name):
+        self.reads += 1
+        return self.scene.get(name)
+
+    def add_callbacks(self, graph):
+        return [1]
+
+    def watch_node(self, graph, name):
+        self.watched[name] = self.watched.get(name, 0) + 1
+        return [name]
+
+    def remove_callbacks(self, callback_ids):
+        for callback_id in callback_ids:
+            if callback_id in self.watched:
+                self.watched[callback_id] -= 1
+
+
+class MetaGraphTests(TestCase):
+
+    def setUp(self):
+        self.adapter = FakeSceneAdapter()
+        self.adapter.create("c_character_00_meta", "Character", tag="character")
+        self.adapter.create("l_arm_00_meta", "FKComponent", side="l", parent="c_character_00_meta")
+        self.adapter.create("r_arm_00_meta", "FKComponent", side="r", parent="c_character_00_meta")
+        self.adapter.create("l_leg_00_meta", "IKComponent", side="l", tag="leg", parent="c_character_00_meta")
+        self.graph = MetaGraph(self.adapter)
+        self.graph.add_callbacks()
+
+    def test_queries(self):
+        self.assertEqual(self.graph.nodes(meta_types=["FKComponent"]), ["l_arm_00_meta", "r_arm_00_meta"])
+        self.assertEqual(self.graph.nodes(meta_types=["FKComponent", "IKComponent"], side="l"), ["l_arm_00_meta", "l_leg_00_meta"])
+        self.assertEqual(self.graph.nodes(tag="leg"), ["l_leg_00_meta"])
+        self.assertEqual(len(self.graph.children("c_character_00_meta")), 3)
+        self.assertEqual(self.graph.nodes(meta_types=["Missing"]), [])
+        self.assertEqual(len(self.graph), 4)
+
+    def test_queries_use_index(self):
+        self.graph.nodes()
+        reads = self.adapter.reads
+        for _ in range(100):
+            self.graph.nodes(meta_types=["FKComponent"], side="r")
+        self.assertEqual(self.adapter.reads, reads)
+
+    def test_node_added(self):
+        self.graph.nodes()
+        self.adapter.create("network1", "FKComponent", side=None)
+        self.graph.node_added("network1")
+        # Rename callback must exist before first query
+        self.assertIn("network1", self.graph.watched_nodes())
+        # Rename before next query
+        self.adapter.delete("network1")
+        self.adapter.create("c_spine_00_meta", "FKComponent", parent="c_character_00_meta")
+        self.graph.node_renamed("network1", "c_spine_00_meta")
+        self.assertEqual(self.graph.nodes(meta_types=["FKComponent"], side="c"), ["c_spine_00_meta"])
+        self.assertNotIn("network1", self.graph)
+
+    def test_node_removed(self):
+        self.graph.nodes()
+        self.adapter.delete("l_leg_00_meta")
+        self.graph.node_removed("l_leg_00_meta")
+        self.assertEqual(self.graph.nodes(tag="leg"), [])
+        self.assertEqual(self.graph.meta_types(), ["Character", "FKComponent"])
+
+    def test_parent_renamed(self):
+        self.graph.nodes()
+        self.adapter.delete("c_character_00_meta")
+        self.adapter.create("c_hero_00_meta", "Character", tag="character")
+        for child in ["l_arm_00_meta", "r_arm_00_meta", "l_leg_00_meta"]:
+            self.adapter.scene[child] = self.adapter.scene[child]._replace(parent="c_hero_00_meta")
+        self.graph.node_renamed("c_character_00_meta", "c_hero_00_meta")
+        self.assertEqual(len(self.graph.children("c_hero_00_meta")), 3)
+        self.assertEqual(self.graph.children("c_character_00_meta"), [])
+
+    def test_node_changed(self):
+        self.graph.nodes()
+        self.adapter.scene["r_arm_00_meta"] = self.adapter.scene["r_arm_00_meta"]._replace(tag="arm")
+        self.graph.node_changed("r_arm_00_meta")
+        self.assertEqual(self.graph.nodes(tag="arm"), ["r_arm_00_meta"])
+
+    def test_invalidate(self):
+        self.graph.nodes()
+        self.adapter.create("c_prop_00_meta", "Character")
+        self.graph.invalidate()
+        self.assertEqual(self.graph.nodes(meta_types=["Character"]), ["c_character_00_meta", "c_prop_00_meta"])
+
+    def test_watched_nodes(self):
+        self.graph.nodes()
+        self.assertEqual(sorted(self.graph.watched_nodes()), sorted(self.adapter.order))
+        # Network node is watched before it becomes meta node
+        self.graph.node_added("network1")
+        self.assertIn("network1", self.graph.watched_nodes())
+        self.graph.nodes()
+        self.assertEqual(self.adapter.watched["network1"], 1)
+        self.graph.node_renamed("network1", "network2")
+        self.assertIn("network2", self.graph.watched_nodes())
+        self.graph.node_removed("l_leg_00_meta")
+        self.assertNotIn("l_leg_00_meta", self.graph.watched_nodes())
+        self.graph.remove_callbacks()
+        self.assertEqual(self.graph.watched_nodes(), [])
+        self.assertTrue(all(count == 0 for count in self.adapter.watched.values()))
+
+
+class MetaGraphSceneTests(TestCase):
+
+    def setUp(self):
+        pm.newFile(f=1)
+
+    def test_component_created_after_query(self):
+        character = luna_rig.components.Character.create(name="test_character")
+        component1 = luna_rig.AnimComponent.create(character=character)
+        # Index is synced mid-build, next component is renamed after creation
+        self.assertListEqual([component1], character.get_meta_children(of_type=luna_rig.AnimComponent))
+        component2 = luna_rig.AnimComponent.create(character=character, tag="late")
+        self.assertListEqual([component1, component2], character.get_meta_children(of_type=luna_rig.AnimComponent))
+        self.assertListEqual([component2], character.get_meta_children(by_tag="late"))
+        self.assertIn(component2.pynode.name(), MetaGraph.get().watched_nodes())
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
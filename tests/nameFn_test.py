@@ -0,0 +1,107 @@
+import re
+import random
+import unittest
+import pymel.core as pm
+from luna.test import TestCase
+import luna_rig.functions.nameFn as nameFn
+
+
+def legacy_parse(full_name, template):
+    """deconstruct_name parsing as it was before NameTemplate, reference for parse results."""
+    name_parts = full_name.split("_")
+    re_index = re.compile(r"\d+|^$")
+    all_indexes = list(filter(re_index.match, name_parts))
+    index_index = len(name_parts) - name_parts[::-1].index(all_indexes[-1]) - 1
+    index = name_parts[index_index]
+    name_start_index = template.split("_").index("{name}")
+    name = "_".join(name_parts[name_start_index:index_index])
+    indexed_name = "_".join(name_parts[name_start_index:index_index + 1])
+    temp_name = full_name.replace(indexed_name, "name")
+    side = temp_name.split("_")[template.split("_").index("{side}")]
+    suffix = temp_name.split("_")[template.split("_").index("{suffix}")]
+    return side, name, indexed_name, index, suffix
+
+
+class NameTemplateTests(TestCase):
+
+    def test_parse_default(self):
+        parts = nameFn.NameTemplate("{side}_{name}_{suffix}").parse("l_arm_upper_00_ctl")
+        self.assertEqual(parts.side, "l")
+        self.assertEqual(parts.name, "arm_upper")
+        self.assertEqual(parts.indexed_name, "arm_upper_00")
+        self.assertEqual(parts.index, "00")
+        self.assertEqual(parts.suffix, "ctl")
+        self.assertEqual(parts.namespaces, [])
+
+    def test_parse_templates(self):
+        self.assertEqual(nameFn.NameTemplate("{name}_{side}_{suffix}").parse("spine_03_c_jnt")[1:], ("c", "spine", "spine_03", "03", "jnt"))
+        self.assertEqual(nameFn.NameTemplate("{suffix}_{name}_{side}").parse("grp_leg_fk_01_r")[1:], ("r", "leg_fk", "leg_fk_01", "01", "grp"))
+
+    def test_matches_legacy_parse(self):
+        template = "{side}_{name}_{suffix}"
+        compiled = nameFn.NameTemplate(template)
+        rng = random.Random(1234)
+        for _ in range(2000):
+            name = "_".join(rng.choice(["arm", "leg", "spine", "upper", "twist", "fk", "ik"]) for _ in range(rng.randint(1, 3)))
+            full_name = "{0}_{1}_{2}_{3}".format(rng.choice("lrc"), name, str(rng.randint(0, 99)).zfill(2), rng.choice(["ctl", "jnt", "grp"]))
+            self.assertEqual(compiled.parse(full_name)[1:], legacy_parse(full_name, template))
+
+    def test_template_cache(self):
+        self.assertIs(nameFn.NameTemplate.get("{side}_{name}_{suffix}"), nameFn.NameTemplate.get("{side}_{name}_{suffix}"))
+
+    def test_format(self):
+        self.assertEqual(nameFn.NameTemplate("{suffix}_{name}_{side}").format("l", "arm_00", "ctl"), "ctl_arm_00_l")
+
+    def test_parse_no_index(self):
+        with self.assertRaises(ValueError):
+            nameFn.NameTemplate("{side}_{name}_{suffix}").parse("l_arm_ctl")
+
+
+class NameAllocatorTests(TestCase):
+
+    def setUp(self):
+        pm.newFile(f=1)
+
+    def test_skips_existing(self):
+        pm.createNode("transform", n="c_arm_00_grp")
+        pm.createNode("transform", n="c_arm_01_grp")
+        self.assertEqual(nameFn.generate_name("arm", "c", "grp"), "c_arm_02_grp")
+        self.assertEqual(nameFn.generate_name("arm", "c", "ctl"), "c_arm_00_ctl")
+
+    def test_scope_matches_scene(self):
+        with nameFn.NameAllocator.scope():
+            temp_node = pm.createNode("transform", n=nameFn.generate_name("leg", "l", "jnt"))
+            pm.createNode("transform", n=nameFn.generate_name("leg", "l", "jnt"))
+            # Deleted and renamed nodes free their index
+            pm.delete(temp_node)
+            self.assertEqual(nameFn.generate_name("leg", "l", "jnt"), "l_leg_00_jnt")
+            pm.rename("l_leg_01_jnt", "temp")
+            self.assertEqual(nameFn.generate_name("leg", "l", "jnt"), "l_leg_00_jnt")
+        self.assertIsNone(nameFn.NameAllocator.current())
+
+    def test_scope_reuses_deleted_index(self):
+        with nameFn.NameAllocator.scope():
+            nodes = [pm.createNode("transform", n=nameFn.generate_name("finger", "r", "ctl")) for _ in range(5)]
+            pm.delete(nodes[2])
+            self.assertEqual(nameFn.generate_name("finger", "r", "ctl"), "r_finger_02_ctl")
+            pm.createNode("transform", n="r_finger_02_ctl")
+            self.assertEqual(nameFn.generate_name("finger", "r", "ctl"), "r_finger_05_ctl")
+            # Other names matching wildcard don't take index
+            pm.createNode("transform", n="r_finger_tip_05_ctl")
+            self.assertEqual(nameFn.generate_name("finger", "r", "ctl"), "r_finger_05_ctl")
+
+    def test_reserve(self):
+        allocator = nameFn.NameAllocator()
+        first = allocator.allocate("leg", "l", "jnt", reserve=True)
+        second = allocator.allocate("leg", "l", "jnt", reserve=True)
+        self.assertEqual([first, second], ["l_leg_00_jnt", "l_leg_01_jnt"])
+        allocator.release([first, second])
+        self.assertEqual(allocator.allocate("leg", "l", "jnt"), "l_leg_00_jnt")
+
+    def test_generate_names(self):
+        pm.createNode("transform", n="r_hand_00_ctl")
+        self.assertEqual(nameFn.generate_names("hand", "r", ["grp", "ctl"]), ["r_hand_00_grp", "r_hand_01_ctl"])
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -38,6 +38,20 @@ class ProjectTests(TestCase):
         self.assertTrue(os.path.exists(test_project.tag_path))
         self.assertTrue(os.path.exists(test_project.meta_path))
 
+    def test_create_assets(self):
+        creation_path = ProjectTests.get_temp_dirname("testProject")
+        test_project = luna.workspace.Project.create(creation_path, silent=True)
+        specs = [{"name": "prop{0}".format(index), "type": "prop", "model": "model{0}.ma".format(index)} for index in range(10)]
+        assets = test_project.create_assets(specs, threads=4)
+
+        # Assertions
+        self.assertEqual(len(assets), 10)
+        self.assertListEqual(test_project.assets("props"), sorted([spec["name"] for spec in specs]))
+        for asset, spec in zip(assets, specs):
+            self.assertTrue(os.path.isdir(asset.weights.skin))
+            self.assertTrue(os.path.isfile(asset.template_scenes()[0]))
+            self.assertEqual(asset.meta_data.get("model"), spec["model"])
+
 
 if __name__ == "__main__":
     unittest.main(exit=False)
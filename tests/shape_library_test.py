@@ -0,0 +1,55 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from luna.test import TestCase
+from luna.utils import fileFn
+from luna_rig.core.shape_manager import ShapeLibrary
+
+
+class ShapeLibraryTests(TestCase):
+    def setUp(self):
+        self.lib_path = tempfile.mkdtemp(prefix="luna_shape_lib_")
+        self.library = ShapeLibrary(self.lib_path, max_size=2)
+        self.write_shape("circle", degree=3)
+
+    def tearDown(self):
+        shutil.rmtree(self.lib_path)
+
+    def write_shape(self, name, degree, time_offset=0):
+        path = os.path.join(self.lib_path, name + ".json")
+        fileFn.write_json(path, [{"points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], "knots": [0, 1], "degree": degree}])
+        if time_offset:
+            stamp = time.time() + time_offset
+            os.utime(path, (stamp, stamp))
+            os.utime(self.lib_path, (stamp, stamp))
+
+    def test_list_shapes(self):
+        self.assertListEqual(self.library.list_shapes(), ["circle"])
+        self.write_shape("square", degree=1, time_offset=5)
+        self.assertListEqual(self.library.list_shapes(), ["circle", "square"])
+
+    def test_load_cached(self):
+        first = self.library.load("circle")
+        first[0]["degree"] = 5
+        self.assertEqual(self.library.load("circle")[0]["degree"], 3)
+        with self.assertRaises(KeyError):
+            self.library.load("missing")
+
+    def test_mtime_invalidation(self):
+        self.assertEqual(self.library.load("circle")[0]["degree"], 3)
+        self.write_shape("circle", degree=1, time_offset=5)
+        self.assertEqual(self.library.load("circle")[0]["degree"], 1)
+
+    def test_lru_size(self):
+        self.write_shape("square", degree=1, time_offset=5)
+        self.write_shape("star", degree=1, time_offset=10)
+        for shape_name in ("circle", "square", "star"):
+            self.library.load(shape_name)
+        self.assertEqual(len(self.library._cache), 2)
+        self.assertNotIn("circle", self.library._cache)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)
@@ -0,0 +1,98 @@
+import pymel.core as pm
+import unittest
+from luna.test import TestCase
+from luna_rig.core.shape_manager import ShapeManager
+from luna_rig.functions import curveFn
+from luna_rig.importexport.control_shapes import CtlShapeManager
+
+
+class ShapeManagerTests(TestCase):
+    def setUp(self):
+        pm.newFile(f=1)
+
+    def tearDown(self):
+        ShapeManager.FAST_APPLY = False
+        pm.newFile(f=1)
+
+    def shape_state(self, transform):
+        state = []
+        for shape_node, data in zip(transform.getShapes(), ShapeManager.get_shapes(transform)):
+            state.append((shape_node.nodeName().replace(transform.nodeName(), ""),
+                          [[round(value, 6) for value in point] for point in data["points"]],
+                          data["knots"],
+                          data["degree"],
+                          data["form"],
+                          data["color"],
+                          shape_node.overrideEnabled.get(),
+                          shape_node.lineWidth.get()))
+        return state
+
+    def test_api_matches_cmds(self):
+        for shape_name in ShapeManager.list_lib_shapes():
+            shape_list = ShapeManager.load_shape_from_lib(shape_name)
+            results = []
+            for apply_func in (ShapeManager._apply_shape_cmds, ShapeManager._apply_shape_api):
+                transform = pm.createNode("transform", n="{0}_{1}".format(shape_name, len(results)))
+                pm.circle(n="old_shape")[0].getShape().setParent(transform, r=1, s=1)
+                apply_func(transform, shape_list, default_color=13)
+                results.append(self.shape_state(transform))
+            self.assertEqual(results[0], results[1], "Shape mismatch: {0}".format(shape_name))
+
+    def test_apply_undo(self):
+        transform = pm.createNode("transform", n="undo_ctl")
+        pm.circle(n="old_shape")[0].getShape().setParent(transform, r=1, s=1)
+        old_state = self.shape_state(transform)
+        undo_state = pm.undoInfo(q=1, state=1)
+        pm.undoInfo(state=1)
+        try:
+            ShapeManager.apply_shape(transform, ShapeManager.load_shape_from_lib("cube"))
+            new_state = self.shape_state(transform)
+            pm.undo()
+            self.assertEqual(self.shape_state(transform), old_state)
+            pm.redo()
+            self.assertEqual(self.shape_state(transform), new_state)
+        finally:
+            pm.undoInfo(state=undo_state)
+
+        # Build scope uses API path
+        with ShapeManager.fast_apply():
+            self.assertTrue(ShapeManager._can_apply_fast(ShapeManager.load_shape_from_lib("cube")))
+        self.assertFalse(ShapeManager.FAST_APPLY)
+
+    def test_apply_shapes_missing_nodes(self):
+        selected = pm.circle(n="selected_ctl")[0]
+        pm.select(selected, r=1)
+        with ShapeManager.fast_apply():
+            self.assertEqual(ShapeManager.apply_shapes({"missing_ctl": ShapeManager.load_shape_from_lib("cube")}), [])
+        self.assertEqual(len(selected.getShapes()), 1)
+
+    def test_color_from_data(self):
+        transform = pm.createNode("transform", n="colored")
+        shape_list = ShapeManager.load_shape_from_lib("circle")
+        shape_list[0]["color"] = "red"
+        ShapeManager.apply_shape(transform, shape_list, default_color=13)
+        self.assertEqual(ShapeManager.get_color(transform), ShapeManager._color_index("red"))
+
+    def test_bulk_export_import(self):
+        shapes_dict = {}
+        for shape_name in ("circle", "cube", "arrowCross"):
+            transform = pm.createNode("transform", n="{0}_ctl".format(shape_name))
+            pm.controller(transform)
+            transform.addAttr("metaParent", at="message")
+            ShapeManager.apply_shape(transform, ShapeManager.load_shape_from_lib(shape_name), default_color=6)
+            shapes_dict[transform.name()] = self.shape_state(transform)
+
+        collected = CtlShapeManager.collect_shapes()
+        self.assertEqual(sorted(collected), sorted(shapes_dict))
+        self.assertEqual(collected["cube_ctl"][0], curveFn.get_curve_data(pm.PyNode("cube_ctl").getShapes()[0]))
+        # Write, swap shapes and restore from file
+        path = self.get_temp_filename("shape_manager_test_bulk.crvs")
+        CtlShapeManager.write_shapes(path, collected)
+        ShapeManager.apply_shapes(dict((transform, ShapeManager.load_shape_from_lib("sphere")) for transform in collected))
+        self.assertListEqual(sorted(ShapeManager.apply_shapes(CtlShapeManager.read_shapes(path))), sorted(shapes_dict))
+        for transform, state in shapes_dict.items():
+            self.assertEqual(self.shape_state(pm.PyNode(transform)), state)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)